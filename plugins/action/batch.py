@@ -0,0 +1,70 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Mapping
+
+from ansible.errors import AnsibleActionFail
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.batch import (
+    BATCH_KEY
+)
+
+COLLECTION = 'opentelekomcloud.cloud'
+
+
+class ActionModule(ActionBase):
+    """Run a module of the collection for many items in one execution.
+
+    The target module gets the items in the `BATCH_KEY` argument and runs
+    itself once per item, see `module_utils.batch.run_batch`.
+    """
+
+    TRANSFERS_FILES = False
+
+    def _module_name(self, name):
+        if not name:
+            raise AnsibleActionFail('module is required')
+        if '.' not in name:
+            name = '%s.%s' % (COLLECTION, name)
+        if not name.startswith(COLLECTION + '.') or name.endswith('.batch'):
+            raise AnsibleActionFail(
+                'Only modules of the %s collection can be batched, got %s'
+                % (COLLECTION, name))
+        return name
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        task_args = dict(self._task.args)
+        module = self._module_name(task_args.pop('module', None))
+        items = task_args.pop('items', None) or []
+        concurrency = task_args.pop('concurrency', 1)
+        if not isinstance(items, list) or not all(
+                isinstance(item, Mapping) for item in items):
+            raise AnsibleActionFail('items must be a list of dictionaries')
+        # Remaining keys are i.e. module_defaults of the otc action group
+        args = dict(task_args.pop('args', None) or {})
+        for key, value in task_args.items():
+            args.setdefault(key, value)
+
+        if not items:
+            result.update(changed=False, results=[])
+            return result
+
+        args[BATCH_KEY] = dict(
+            items=[dict(item) for item in items],
+            parallelism=int(concurrency))
+        result.update(self._execute_module(
+            module_name=module, module_args=args, task_vars=task_vars))
+        return result
@@ -0,0 +1,220 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+name: otc_metrics
+type: aggregate
+short_description: Aggregate OTC API usage of tasks
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Collects the C(otc_metrics) API call summaries returned by modules
+    of the collection (see the C(api_metrics) module argument) and
+    aggregates them per task, role, host and service.
+  - At the end of every play the tasks doing the most API calls and the
+    tasks spending the most time in API calls are printed together with
+    per service totals, including the number of throttled calls.
+  - Optionally the aggregated data of all plays is written to a JSON
+    report.
+requirements:
+  - Enable the callback in C(callbacks_enabled) and set C(api_metrics)
+    (or C(OTC_API_METRICS)) for the modules to report.
+options:
+  top:
+    description:
+      - Number of tasks shown in the tables printed at the end of a play.
+    type: int
+    default: 10
+    env:
+      - name: OTC_METRICS_TOP
+    ini:
+      - section: callback_otc_metrics
+        key: top
+  report_path:
+    description:
+      - Path of the JSON report, no report is written when not set.
+    type: path
+    env:
+      - name: OTC_METRICS_REPORT
+    ini:
+      - section: callback_otc_metrics
+        key: report_path
+'''
+
+import json
+import os
+
+from ansible.plugins.callback import CallbackBase
+
+
+def _new_totals():
+    return {'calls': 0, 'retries': 0, 'throttled': 0, 'bytes': 0,
+            'total_latency': 0.0}
+
+
+def _add(totals, calls, throttled=0, latency=0.0, retries=0, size=0):
+    totals['calls'] += calls
+    totals['throttled'] += throttled
+    totals['retries'] += retries
+    totals['bytes'] += size
+    totals['total_latency'] = round(totals['total_latency'] + latency, 4)
+
+
+def result_metrics(result):
+    """Return `otc_metrics` summaries of a task result (and its items)."""
+    summaries = []
+    if isinstance(result.get('otc_metrics'), dict):
+        summaries.append(result['otc_metrics'])
+    for item in result.get('results') or []:
+        if isinstance(item, dict):
+            summaries.extend(result_metrics(item))
+    return summaries
+
+
+class MetricsAggregator:
+    """Totals of `otc_metrics` summaries per task, role, host and service.
+
+    Every level keeps the number of calls, retries, throttled calls,
+    transferred bytes and the total latency.
+    """
+
+    def __init__(self):
+        self.tasks = {}
+        self.roles = {}
+        self.hosts = {}
+        self.services = {}
+        self.totals = _new_totals()
+
+    def add(self, task_id, task, role, host, summary):
+        """Add the summary of a single module run."""
+        entry = self.tasks.get(task_id)
+        if entry is None:
+            entry = self.tasks[task_id] = dict(
+                _new_totals(), task=task, role=role, hosts={}, services={},
+                max_latency=0.0)
+        latency = summary.get('latency') or {}
+        entry['max_latency'] = max(entry['max_latency'],
+                                   latency.get('max') or 0.0)
+
+        throttled = 0
+        for name, service in (summary.get('services') or {}).items():
+            throttled += service.get('throttled', 0)
+            for totals in (entry['services'], self.services):
+                _add(totals.setdefault(name, _new_totals()),
+                     service.get('calls', 0), service.get('throttled', 0),
+                     service.get('total_latency', 0.0))
+
+        counts = dict(
+            calls=summary.get('calls', 0), throttled=throttled,
+            latency=summary.get('total_latency', 0.0),
+            retries=summary.get('retries', 0), size=summary.get('bytes', 0))
+        _add(entry, **counts)
+        _add(entry['hosts'].setdefault(host, _new_totals()), **counts)
+        _add(self.hosts.setdefault(host, _new_totals()), **counts)
+        if role:
+            _add(self.roles.setdefault(role, _new_totals()), **counts)
+        _add(self.totals, **counts)
+
+    def top(self, key, count):
+        """Return up to `count` task entries with the highest `key`."""
+        tasks = [task for task in self.tasks.values() if task[key]]
+        return sorted(tasks, key=lambda task: task[key],
+                      reverse=True)[:count]
+
+    def report(self):
+        return dict(totals=self.totals, tasks=list(self.tasks.values()),
+                    roles=self.roles, hosts=self.hosts,
+                    services=self.services)
+
+
+class CallbackModule(CallbackBase):
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'opentelekomcloud.cloud.otc_metrics'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        self.plays = []
+        self._play_name = None
+        self._play = None
+
+    def _record(self, result):
+        if self._play is None:
+            self._play = MetricsAggregator()
+        task = result._task
+        role = task._role.get_name() if getattr(task, '_role', None) else None
+        for summary in result_metrics(result._result):
+            self._play.add(task._uuid, task.get_name(), role,
+                           result._host.get_name(), summary)
+
+    def _print_tasks(self, title, tasks, key, unit):
+        self._display.display(title)
+        for task in tasks:
+            name = task['task']
+            if task['role']:
+                name = '%s : %s' % (task['role'], name)
+            self._display.display(
+                '  %-60s %10s%s  (%d calls, %d throttled, %d hosts)' % (
+                    name[:60], task[key], unit, task['calls'],
+                    task['throttled'], len(task['hosts'])))
+
+    def _end_play(self):
+        play, self._play = self._play, None
+        if play is None or not play.totals['calls']:
+            return
+        self.plays.append(dict(play.report(), name=self._play_name))
+
+        top = self.get_option('top')
+        self._display.banner('OTC API USAGE [%s]' % self._play_name)
+        self._print_tasks('Most API calls:',
+                          play.top('calls', top), 'calls', '')
+        self._print_tasks('Most time in API calls:',
+                          play.top('total_latency', top),
+                          'total_latency', 's')
+        self._display.display('Services:')
+        for name, service in sorted(play.services.items(),
+                                    key=lambda item: -item[1]['calls']):
+            self._display.display(
+                '  %-20s %6d calls %6d throttled %10.2fs' % (
+                    name, service['calls'], service['throttled'],
+                    service['total_latency']))
+        totals = play.totals
+        self._display.display(
+            'Total: %d calls, %d retries, %d throttled, %.2fs' % (
+                totals['calls'], totals['retries'], totals['throttled'],
+                totals['total_latency']))
+
+    def _write_report(self):
+        path = self.get_option('report_path')
+        if not path:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as fd:
+            json.dump(dict(plays=self.plays), fd, indent=2, sort_keys=True)
+
+    def v2_playbook_on_play_start(self, play):
+        self._end_play()
+        self._play_name = play.get_name()
+
+    def v2_runner_on_ok(self, result):
+        self._record(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._record(result)
+
+    def v2_playbook_on_stats(self, stats):
+        self._end_play()
+        self._write_report()
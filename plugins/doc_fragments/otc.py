@@ -91,6 +91,113 @@ options:
     choices: [ admin, internal, public ]
     default: public
     aliases: [ endpoint_type ]
+  token_cache:
+    description:
+      - Whether to reuse Keystone tokens between module runs.
+      - Tokens are stored on disk per cloud, auth, region and project and are
+        reused until they are about to expire. Concurrently running tasks
+        wait for a single authentication instead of authenticating each.
+      - Can also be enabled with the C(OTC_TOKEN_CACHE) environment variable.
+    type: bool
+    default: no
+  token_cache_dir:
+    description:
+      - Directory to store cached tokens in when I(token_cache) is enabled.
+      - Defaults to C(~/.cache/opentelekomcloud/tokens), can also be set with
+        the C(OTC_TOKEN_CACHE_DIR) environment variable.
+    type: path
+  api_metrics:
+    description:
+      - Record all API calls done by the module and return their summary in
+        the C(otc_metrics) key of the result.
+      - C(summary) returns the number of calls, retries, transferred bytes,
+        total and percentile latencies and per service totals (calls,
+        throttled calls and latency).
+      - C(full) additionally returns every call with its service, method,
+        URL template, status, latency and response size.
+      - Can also be set with the C(OTC_API_METRICS) environment variable.
+    type: str
+    choices: [ none, summary, full ]
+    default: none
+  resolve_cache_ttl:
+    description:
+      - Seconds resources looked up by name or ID (routers, networks,
+        subnets, pools, gateways, etc.) are cached on disk and reused by
+        subsequent tasks without API calls.
+      - Lookups are always memoized within a single module run, C(0)
+        disables the cache between runs.
+      - Can also be set with the C(OTC_RESOLVE_CACHE_TTL) environment
+        variable.
+    type: int
+    default: 0
+  result_cache_ttl:
+    description:
+      - Seconds results of info modules supporting it (i.e. C(vpc_info),
+        C(subnet_info), C(security_group_info), C(availability_zone_info))
+        are cached on disk by module arguments, cloud and region. Cached
+        results are returned without API calls.
+      - Modules changing the corresponding resources drop the cached
+        results. Changes done outside of the collection are only seen
+        after the results expired.
+      - Can also be set with the C(OTC_RESULT_CACHE_TTL) environment
+        variable.
+    type: int
+    default: 0
+  parallelism:
+    description:
+      - Maximal number of concurrent API calls of modules fanning out over
+        many resources (rules, tags, nodes, instances).
+      - Can also be set with the C(OTC_PARALLELISM) environment variable.
+    type: int
+    default: 1
+  api_rate_limits:
+    description:
+      - Maximal number of API calls per second by service type, i.e.
+        C(network) or C(compute).
+      - The budget is shared by all concurrently running tasks (i.e. forks)
+        using the same credentials and region.
+      - Can also be set with the C(OTC_API_RATE_LIMITS) environment variable
+        in the C(network=10,compute=5) form.
+    type: dict
+  api_retries:
+    description:
+      - Number of retries of API calls rejected with C(429 Too Many
+        Requests), or with C(503 Service Unavailable) for idempotent calls.
+      - A C(Retry-After) header of the response is honored, otherwise the
+        delay grows exponentially.
+      - Can also be set with the C(OTC_API_RETRIES) environment variable.
+    type: int
+    default: 3
+  http_pool_maxsize:
+    description:
+      - Maximal number of kept open HTTP connections per API endpoint.
+      - Defaults to C(10) or I(parallelism) if it is larger.
+      - Can also be set with the C(OTC_HTTP_POOL_MAXSIZE) environment
+        variable.
+    type: int
+  http_keepalive:
+    description:
+      - Reuse HTTP connections for subsequent calls to the same endpoint and
+        keep them alive with TCP keep-alive probes.
+      - When disabled every call opens a new connection.
+      - Can also be set with the C(OTC_HTTP_KEEPALIVE) environment variable.
+    type: bool
+    default: yes
+  profile:
+    description:
+      - Directory to write a profile of the module run to, profiling is
+        disabled when not set.
+      - Every run writes a directory of its own named after the module,
+        time and process ID with the cProfile data (C(profile.pstats) and
+        C(profile.txt)), the source lines holding the most memory
+        (C(allocations.txt)) and a summary, which is also returned in the
+        C(otc_profile) key of the result.
+      - The summary splits the time of the run into network waits, SDK
+        code, code of the collection and other code.
+      - Only the main thread is profiled, items of the C(batch) action are
+        not profiled.
+      - Can also be set with the C(OTC_PROFILE) environment variable.
+    type: path
 requirements:
   - python >= 3.6
   - openstacksdk >= 0.36.0
@@ -104,3 +211,92 @@ notes:
     plays. More information can be found at
     U(https://docs.openstack.org/openstacksdk/)
 '''
+
+    # Result projection of info modules
+    INFO = r'''
+options:
+  fields:
+    description:
+      - Keys of the returned resources to include, all keys are returned
+        when not set.
+      - Use it to keep results listing many resources small.
+    type: list
+    elements: str
+  exclude_fields:
+    description:
+      - Keys of the returned resources to leave out.
+    type: list
+    elements: str
+'''
+
+    # Common options of inventory plugins
+    INVENTORY = r'''
+options:
+  clouds:
+    description:
+      - Names of clouds from C(clouds.yaml) to list resources of.
+      - All configured clouds are used when not set.
+    type: list
+    elements: str
+  regions:
+    description:
+      - Regions to list resources in, the region configured for the cloud
+        is used when not set.
+    type: list
+    elements: str
+  projects:
+    description:
+      - Names of projects to list resources of, the project configured for
+        the cloud is used when not set.
+    type: list
+    elements: str
+  parallelism:
+    description:
+      - Maximal number of cloud/region/project combinations (and of
+        resources within them) queried concurrently.
+    type: int
+    default: 8
+    env:
+      - name: OTC_PARALLELISM
+  fail_on_errors:
+    description:
+      - Fail when listing of one of the clouds, regions or projects fails,
+        otherwise it is skipped with a warning.
+    type: bool
+    default: false
+  api_rate_limits:
+    description:
+      - Maximal number of API calls per second by service type.
+    type: dict
+  api_retries:
+    description:
+      - Number of retries of throttled API calls.
+    type: int
+    default: 3
+  http_pool_maxsize:
+    description:
+      - Maximal number of kept open HTTP connections per API endpoint.
+    type: int
+  http_keepalive:
+    description:
+      - Reuse HTTP connections for subsequent calls to the same endpoint.
+    type: bool
+    default: true
+  token_cache:
+    description:
+      - Cache authentication tokens on disk and share them with module runs.
+    type: bool
+    default: false
+    env:
+      - name: OTC_TOKEN_CACHE
+  token_cache_dir:
+    description:
+      - Directory to store cached tokens in.
+    type: path
+    env:
+      - name: OTC_TOKEN_CACHE_DIR
+requirements:
+  - python >= 3.6
+  - openstacksdk
+  - otcextensions
+'''
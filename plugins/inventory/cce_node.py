@@ -0,0 +1,136 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+name: cce_node
+short_description: CCE cluster nodes inventory source
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+  - opentelekomcloud.cloud.otc.inventory
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Get nodes of all CCE clusters of one or more clouds, regions and
+    projects as inventory hosts. Nodes of all clusters are listed
+    concurrently.
+  - Hosts are grouped by cluster, node pool, Kubernetes labels, status and
+    availability zone.
+  - Node attributes are available as host vars, cluster and node pool in
+    the C(otc) host var.
+  - Uses a YAML configuration file ending with C(otc_cce_node.yml) or
+    C(otc_cce_node.yaml).
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['opentelekomcloud.cloud.cce_node']
+  clusters:
+    description:
+      - Names or IDs of clusters to list nodes of, all clusters when not
+        set.
+    type: list
+    elements: str
+  address_type:
+    description:
+      - Address used as C(ansible_host).
+      - With C(floating) the private address is used for nodes without
+        floating IP.
+    choices: [private, floating]
+    default: private
+    type: str
+  with_node_pools:
+    description:
+      - Look up names of the node pools the nodes belong to.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = '''
+# otc_cce_node.yml
+plugin: opentelekomcloud.cloud.cce_node
+clouds:
+  - otc
+clusters:
+  - production
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible/otc_cce_node
+cache_timeout: 600
+'''
+
+from ansible_collections.opentelekomcloud.cloud.plugins.plugin_utils.inventory import (
+    OTCInventoryPlugin
+)
+
+# Annotation CCE puts on nodes created by a node pool
+NODE_POOL_ANNOTATION = 'kubernetes.io/node-pool.id'
+
+
+class InventoryModule(OTCInventoryPlugin):
+
+    NAME = 'opentelekomcloud.cloud.cce_node'
+
+    otce_services = ('cce',)
+    config_suffixes = ('otc_cce_node.yml', 'otc_cce_node.yaml')
+
+    def _clusters(self, conn):
+        selected = self.get_option('clusters')
+        clusters = list(conn.cce.clusters())
+        if selected:
+            clusters = [cluster for cluster in clusters
+                        if cluster.id in selected or cluster.name in selected]
+        return clusters
+
+    def _cluster_nodes(self, conn, cluster):
+        """Return nodes and node pool names by ID of a cluster."""
+        nodes = list(conn.cce.cluster_nodes(cluster))
+        pools = {}
+        if self.get_option('with_node_pools'):
+            pools = dict((pool.id, pool.name)
+                         for pool in conn.cce.node_pools(cluster))
+        return nodes, pools
+
+    def fetch(self, conn, target):
+        address_type = self.get_option('address_type')
+        clusters = self._clusters(conn)
+        records = []
+        # Every cluster costs a round-trip, fetch all of them at once
+        for cluster, (nodes, pools) in zip(clusters, self.parallel(
+                lambda cluster: self._cluster_nodes(conn, cluster),
+                clusters)):
+            for raw in nodes:
+                node = self.serialize(raw)
+                spec = node.get('spec') or {}
+                status = node.get('status') or {}
+                annotations = (node.get('metadata') or {}).get(
+                    'annotations') or {}
+                otc = dict(cluster=dict(id=cluster.id, name=cluster.name))
+                groups = ['cce_cluster_%s' % cluster.name,
+                          'az_%s' % spec.get('availability_zone'),
+                          'status_%s' % (status.get('status') or '').lower()]
+                pool_id = annotations.get(NODE_POOL_ANNOTATION)
+                if pool_id:
+                    otc['node_pool'] = dict(id=pool_id,
+                                            name=pools.get(pool_id))
+                    groups.append('cce_node_pool_%s'
+                                  % (pools.get(pool_id) or pool_id))
+                for key, value in (spec.get('k8s_tags') or {}).items():
+                    groups.append('label_%s_%s' % (key, value))
+                node['otc'] = otc
+                node['ansible_host'] = (
+                    address_type == 'floating' and status.get('floating_ip')
+                    or status.get('private_ip'))
+                records.append(dict(
+                    name=node['name'] or node['id'],
+                    vars=node, groups=groups))
+        return records
@@ -0,0 +1,181 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+name: database
+short_description: Managed database and middleware instances inventory source
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+  - opentelekomcloud.cloud.otc.inventory
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Get RDS and DDS instances, CSS clusters and DMS instances of one or more
+    clouds, regions and projects as inventory hosts. All services are
+    listed concurrently.
+  - Besides the instance attributes every host has the C(db_service),
+    C(db_engine), C(db_version), C(db_flavor), C(db_endpoint), C(db_port)
+    and C(db_status) host vars, C(ansible_host) is set to the endpoint.
+  - Hosts are grouped by service, engine and status.
+  - Passwords are never added to host vars.
+  - Uses a YAML configuration file ending with C(otc_database.yml) or
+    C(otc_database.yaml).
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['opentelekomcloud.cloud.database']
+  services:
+    description:
+      - Services to list instances of.
+    type: list
+    elements: str
+    choices: [rds, dds, css, dms]
+    default: [rds, dds, css, dms]
+'''
+
+EXAMPLES = '''
+# otc_database.yml
+plugin: opentelekomcloud.cloud.database
+clouds:
+  - otc
+services:
+  - rds
+  - dds
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible/otc_database
+cache_timeout: 900
+keyed_groups:
+  - key: db_version
+    prefix: version
+'''
+
+from ansible_collections.opentelekomcloud.cloud.plugins.plugin_utils.inventory import (
+    OTCInventoryPlugin
+)
+
+# Attributes holding credentials
+SECRET_FIELDS = ('password', 'admin_pwd')
+
+
+def _first(values):
+    return values[0] if values else None
+
+
+def _split_endpoint(endpoints):
+    """Split first `host[:port]` of an endpoint list or comma separated
+    string into host and port."""
+    if isinstance(endpoints, str):
+        endpoints = endpoints.split(',')
+    endpoint = (_first(endpoints) or '').strip()
+    if not endpoint:
+        return None, None
+    host, _, port = endpoint.rpartition(':')
+    if not host:
+        return endpoint, None
+    return host, int(port) if port.isdigit() else None
+
+
+def rds_facts(instance):
+    datastore = instance.get('datastore') or {}
+    return dict(
+        engine=datastore.get('type'),
+        version=datastore.get('version'),
+        flavor=instance.get('flavor_ref'),
+        endpoint=_first(instance.get('private_ips')),
+        port=instance.get('port'),
+    )
+
+
+def dds_facts(instance):
+    datastore = instance.get('datastore') or {}
+    nodes = [node for group in instance.get('groups') or []
+             for node in group.get('nodes') or []]
+    return dict(
+        engine=datastore.get('type'),
+        version=datastore.get('version'),
+        flavor=_first([node.get('spec_code') for node in nodes]),
+        endpoint=_first([node.get('private_ip') for node in nodes
+                         if node.get('private_ip')]),
+        port=instance.get('port'),
+    )
+
+
+def css_facts(instance):
+    datastore = instance.get('datastore') or {}
+    endpoint, port = _split_endpoint(instance.get('endpoints'))
+    nodes = instance.get('nodes') or []
+    return dict(
+        engine=datastore.get('type'),
+        version=datastore.get('version'),
+        flavor=_first([node.get('flavor') for node in nodes]),
+        endpoint=endpoint or _first([node.get('ip') for node in nodes]),
+        port=port,
+    )
+
+
+def dms_facts(instance):
+    endpoint, port = _split_endpoint(instance.get('connect_address'))
+    return dict(
+        engine=instance.get('engine_name'),
+        version=instance.get('engine_version'),
+        flavor=instance.get('spec_code') or instance.get('spec'),
+        endpoint=endpoint,
+        port=instance.get('port') or port,
+    )
+
+
+# Service name -> (list function, normalization of host vars)
+SERVICES = {
+    'rds': (lambda conn: conn.rds.instances(), rds_facts),
+    'dds': (lambda conn: conn.dds.instances(), dds_facts),
+    'css': (lambda conn: conn.css.clusters(), css_facts),
+    'dms': (lambda conn: conn.dms.instances(), dms_facts),
+}
+
+
+class InventoryModule(OTCInventoryPlugin):
+
+    NAME = 'opentelekomcloud.cloud.database'
+
+    config_suffixes = ('otc_database.yml', 'otc_database.yaml')
+
+    @property
+    def otce_services(self):
+        return tuple(self.get_option('services'))
+
+    def _list(self, conn, service):
+        list_instances, facts = SERVICES[service]
+        records = []
+        for raw in list_instances(conn):
+            instance = self.serialize(raw, exclude=SECRET_FIELDS)
+            for key, value in facts(instance).items():
+                instance['db_' + key] = value
+            instance['db_service'] = service
+            instance['db_status'] = instance.get('status')
+            instance['ansible_host'] = instance['db_endpoint']
+            records.append(dict(
+                name=instance.get('name') or instance['id'],
+                vars=instance,
+                groups=[service,
+                        'engine_%s' % str(instance['db_engine']).lower(),
+                        'status_%s' % str(instance['db_status']).lower()]))
+        return records
+
+    def fetch(self, conn, target):
+        services = self.get_option('services')
+        # One list call per service, done at the same time
+        results = self.parallel(
+            lambda service: self._list(conn, service), services)
+        return [record for records in results for record in records]
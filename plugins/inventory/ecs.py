@@ -0,0 +1,157 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+name: ecs
+short_description: ECS servers inventory source
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+  - opentelekomcloud.cloud.otc.inventory
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Get ECS servers of one or more clouds, regions and projects as
+    inventory hosts, listing all of them concurrently.
+  - Hosts are grouped by cloud, region, availability zone, status, tags,
+    AS group and DeH host.
+  - Server attributes are available as host vars, OTC specific data
+    (cloud, region, project, AS group, DeH host) in the C(otc) host var.
+  - Uses a YAML configuration file ending with C(otc_ecs.yml) or
+    C(otc_ecs.yaml).
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ['opentelekomcloud.cloud.ecs']
+  address_type:
+    description:
+      - Address used as C(ansible_host).
+      - With C(floating) the fixed address is used for servers without
+        floating IP.
+    choices: [fixed, floating]
+    default: fixed
+    type: str
+  with_as_groups:
+    description:
+      - Look up AS group membership of the servers.
+    type: bool
+    default: true
+  with_deh:
+    description:
+      - Look up Dedicated Hosts the servers are placed on.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = '''
+# otc_ecs.yml
+plugin: opentelekomcloud.cloud.ecs
+clouds:
+  - otc
+regions:
+  - eu-de
+  - eu-nl
+address_type: floating
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.cache/ansible/otc_ecs
+cache_timeout: 600
+keyed_groups:
+  - key: flavor.original_name
+    prefix: flavor
+'''
+
+from ansible_collections.opentelekomcloud.cloud.plugins.plugin_utils.inventory import (
+    OTCInventoryPlugin
+)
+
+
+def server_address(server, address_type='fixed'):
+    """Return IPv4 address of the server of the preferred type."""
+    addresses = {}
+    for network_addresses in (server.get('addresses') or {}).values():
+        for address in network_addresses:
+            if address.get('version', 4) != 4:
+                continue
+            kind = address.get('OS-EXT-IPS:type', 'fixed')
+            addresses.setdefault(kind, address['addr'])
+    return (addresses.get(address_type) or addresses.get('fixed')
+            or server.get('access_ipv4'))
+
+
+def tag_groups(tags):
+    """Return group names of server tags, `key=value` tags are split."""
+    groups = []
+    for tag in tags or []:
+        key, _, value = tag.partition('=')
+        groups.append('tag_%s_%s' % (key, value) if value else 'tag_' + key)
+    return groups
+
+
+class InventoryModule(OTCInventoryPlugin):
+
+    NAME = 'opentelekomcloud.cloud.ecs'
+
+    otce_services = ('auto_scaling', 'deh')
+    config_suffixes = ('otc_ecs.yml', 'otc_ecs.yaml')
+
+    def _as_groups(self, conn):
+        """Map server IDs to their AS groups."""
+        groups = list(conn.auto_scaling.groups())
+        membership = {}
+        for group, instances in zip(groups, self.parallel(
+                lambda group: list(conn.auto_scaling.instances(group)),
+                groups)):
+            for instance in instances:
+                membership[instance.id] = dict(
+                    id=group.id, name=group.name)
+        return membership
+
+    def _deh_hosts(self, conn):
+        """Map server IDs to the DeH hosts they are placed on."""
+        hosts = list(conn.deh.hosts())
+        placement = {}
+        for host, servers in zip(hosts, self.parallel(
+                lambda host: list(conn.deh.servers(host)), hosts)):
+            for server in servers:
+                placement[server.id] = dict(id=host.id, name=host.name)
+        return placement
+
+    def fetch(self, conn, target):
+        as_groups = deh_hosts = {}
+        if self.get_option('with_as_groups'):
+            as_groups = self._as_groups(conn)
+        if self.get_option('with_deh'):
+            deh_hosts = self._deh_hosts(conn)
+
+        address_type = self.get_option('address_type')
+        records = []
+        for raw in conn.compute.servers(details=True):
+            server = self.serialize(raw)
+            otc = {}
+            groups = ['az_%s' % server.get('availability_zone'),
+                      'status_%s' % server.get('status', '').lower()]
+            groups.extend(tag_groups(server.get('tags')))
+            if server['id'] in as_groups:
+                otc['as_group'] = as_groups[server['id']]
+                groups.append('as_group_%s' % otc['as_group']['name'])
+            if server['id'] in deh_hosts:
+                otc['deh_host'] = deh_hosts[server['id']]
+                groups.append('deh_%s' % (otc['deh_host']['name']
+                                          or otc['deh_host']['id']))
+            server['otc'] = otc
+            server['ansible_host'] = server_address(server, address_type)
+            records.append(dict(
+                name=server['name'] or server['id'],
+                vars=server, groups=groups))
+        return records
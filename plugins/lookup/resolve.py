@@ -0,0 +1,372 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+name: resolve
+short_description: Resolve names of OTC resources to IDs
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Resolve many resource names to IDs on the controller, without running
+    an C(*_info) module per resource.
+  - Every resource type costs a single list call, no matter how many
+    names of it are resolved. Types are listed concurrently.
+  - Listed resources are memoized for the whole playbook run (see
+    C(play_cache)), with C(resolve_cache_ttl) also for later runs.
+  - Types with names missing from memoized resources are listed once
+    more, so resources created by earlier tasks are found. Names of
+    resources deleted and created again meanwhile resolve to the IDs of
+    the deleted resources, disable C(play_cache) for such names.
+  - IDs are returned unchanged.
+options:
+  _terms:
+    description:
+      - Resources to resolve, either C(type:name) strings, C([type, name])
+        pairs or dictionaries with C(type) and C(name) keys.
+      - "Supported types: C(network), C(subnet), C(router), C(port),
+        C(security_group), C(loadbalancer), C(lb_listener), C(lb_pool),
+        C(server), C(nat_gateway), C(dns_zone), C(dns_private_zone)."
+    required: true
+  cloud:
+    description:
+      - Name of the cloud from C(clouds.yaml), C(OS_CLOUD) is used when
+        not set.
+    type: str
+    env:
+      - name: OS_CLOUD
+  region:
+    description:
+      - Region to resolve resources in, the region configured for the cloud
+        is used when not set.
+    type: str
+  project:
+    description:
+      - Name of the project to resolve resources in, the project configured
+        for the cloud is used when not set.
+    type: str
+  ignore_missing:
+    description:
+      - Return C(None) for names that do not exist instead of failing.
+    type: bool
+    default: false
+  play_cache:
+    description:
+      - Memoize listed resources on disk for all lookups of the playbook
+        run. Lookups of every task and host run in processes of their own,
+        without it each of them lists the resources again.
+    type: bool
+    default: true
+    env:
+      - name: OTC_RESOLVE_PLAY_CACHE
+  resolve_cache_ttl:
+    description:
+      - Seconds listed resources are cached on disk and reused by
+        lookups of later playbook runs. Disabled with C(0).
+      - Like with C(play_cache), resources deleted and created again
+        within this time resolve to the IDs of the deleted resources.
+    type: int
+    default: 0
+    env:
+      - name: OTC_RESOLVE_CACHE_TTL
+  parallelism:
+    description:
+      - Maximal number of resource types listed concurrently.
+    type: int
+    default: 4
+    env:
+      - name: OTC_PARALLELISM
+  api_retries:
+    description:
+      - Number of retries of throttled API calls.
+    type: int
+    default: 3
+    env:
+      - name: OTC_API_RETRIES
+  token_cache:
+    description:
+      - Cache authentication tokens on disk and share them with module runs.
+      - Enabled by default, so lookups of later tasks do not authenticate
+        again.
+    type: bool
+    default: true
+    env:
+      - name: OTC_TOKEN_CACHE
+  token_cache_dir:
+    description:
+      - Directory to store cached tokens in.
+    type: path
+    env:
+      - name: OTC_TOKEN_CACHE_DIR
+requirements:
+  - python >= 3.6
+  - openstacksdk
+  - otcextensions
+'''
+
+EXAMPLES = '''
+- name: Create DNAT rule
+  opentelekomcloud.cloud.nat_dnat_rule:
+    nat_gateway: "{{ ids[0] }}"
+    port: "{{ ids[1] }}"
+    internal_service_port: 22
+    external_service_port: 2222
+    floating_ip: 80.158.0.1
+    protocol: tcp
+  vars:
+    ids: "{{ query('opentelekomcloud.cloud.resolve',
+                   'nat_gateway:gw', 'port:db-port') }}"
+
+- name: Resolve with explicit pairs in another region
+  ansible.builtin.debug:
+    msg: "{{ query('opentelekomcloud.cloud.resolve',
+                   ['router', 'vpc-1'], {'type': 'subnet', 'name': 'sn-1'},
+                   region='eu-nl') }}"
+'''
+
+RETURN = '''
+_list:
+  description:
+    - IDs of the resources in the order of the terms, C(None) for missing
+      resources with C(ignore_missing).
+  type: list
+  elements: str
+'''
+
+import multiprocessing
+import os
+import time
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.lookup import LookupBase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.cache import (
+    TTLCache, cache_key, connection_key, default_cache_dir
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.executor import (
+    ParallelError, run_parallel
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import (
+    HAS_LIBRARIES
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.plugin_utils.connection import (
+    connect
+)
+
+# Resource type -> (proxy, list method, list query, OTC service to register)
+RESOURCE_TYPES = {
+    'network': ('network', 'networks', {}, None),
+    'subnet': ('network', 'subnets', {}, None),
+    'router': ('network', 'routers', {}, None),
+    'port': ('network', 'ports', {}, None),
+    'security_group': ('network', 'security_groups', {}, None),
+    'loadbalancer': ('network', 'load_balancers', {}, None),
+    'lb_listener': ('network', 'listeners', {}, None),
+    'lb_pool': ('network', 'pools', {}, None),
+    'server': ('compute', 'servers', {}, None),
+    'nat_gateway': ('nat', 'gateways', {}, 'nat'),
+    'dns_zone': ('dns', 'zones', {}, 'dns'),
+    'dns_private_zone': ('dns', 'zones', {'zone_type': 'private'}, 'dns'),
+}
+
+# Connections and name indexes of the controller process, kept for the
+# lifetime of the process, i.e. every lookup of a task loop reuses them
+_CONNECTIONS = {}
+_INDEXES = {}
+
+# Seconds play caches are kept, files of older runs are removed
+RUN_CACHE_TTL = 86400
+
+
+def run_id():
+    """Return ID of the playbook run of the current process.
+
+    Lookups of tasks run in worker processes forked by the playbook
+    process, which identifies the run along with its start time.
+    """
+    if hasattr(multiprocessing, 'parent_process'):
+        parent = multiprocessing.parent_process()
+        pid = os.getpid() if parent is None else parent.pid
+    elif multiprocessing.current_process().name == 'MainProcess':
+        pid = os.getpid()
+    else:
+        pid = os.getppid()
+    try:
+        # Start time of the process, PIDs are reused
+        with open('/proc/%d/stat' % pid) as fd:
+            started = fd.read().rsplit(')', 1)[1].split()[19]
+    except (IOError, OSError, IndexError):
+        started = None
+    return cache_key('run', pid, started)
+
+
+def run_cache():
+    """Return the play cache of the current run.
+
+    Caches of finished runs are removed when a run starts using its own.
+    """
+    directory = default_cache_dir('resources', 'runs')
+    path = os.path.join(directory, run_id() + '.json')
+    if not os.path.exists(path) and os.path.isdir(directory):
+        expired = time.time() - RUN_CACHE_TTL
+        for name in os.listdir(directory):
+            old = os.path.join(directory, name)
+            try:
+                if os.path.getmtime(old) < expired:
+                    os.unlink(old)
+            except OSError:
+                pass
+    return TTLCache(path, RUN_CACHE_TTL)
+
+
+def parse_term(term):
+    """Return `(type, name)` of a lookup term."""
+    if isinstance(term, dict):
+        resource_type, name = term.get('type'), term.get('name')
+    elif isinstance(term, (list, tuple)) and len(term) == 2:
+        resource_type, name = term
+    elif isinstance(term, str) and ':' in term:
+        resource_type, name = term.split(':', 1)
+    else:
+        raise AnsibleLookupError(
+            'Invalid term %r, expected type:name, a [type, name] pair or '
+            'a dictionary with type and name' % (term,))
+    if resource_type not in RESOURCE_TYPES:
+        raise AnsibleLookupError(
+            'Unsupported resource type %r, supported are: %s'
+            % (resource_type, ', '.join(sorted(RESOURCE_TYPES))))
+    return resource_type, name
+
+
+def build_index(resources):
+    """Return IDs and IDs by name of listed resources."""
+    ids = []
+    names = {}
+    for resource in resources:
+        ids.append(resource.id)
+        if resource.name:
+            names.setdefault(resource.name, []).append(resource.id)
+    return dict(ids=ids, names=names)
+
+
+def lookup_id(index, resource_type, name):
+    """Return ID of the resource with `name` (or ID), None if not found."""
+    if name in index['ids']:
+        return name
+    ids = index['names'].get(name) or []
+    if len(ids) > 1:
+        raise AnsibleLookupError(
+            'More than one %s named %s found: %s'
+            % (resource_type, name, ', '.join(ids)))
+    return ids[0] if ids else None
+
+
+class LookupModule(LookupBase):
+
+    def _connect(self, target, services):
+        key = cache_key(target, sorted(services))
+        if key not in _CONNECTIONS:
+            params = dict(
+                (name, self.get_option(name))
+                for name in ('parallelism', 'api_retries', 'token_cache',
+                             'token_cache_dir'))
+            _CONNECTIONS[key] = connect(target, params, tuple(services),
+                                        log=self._display.vvvv)
+        return _CONNECTIONS[key]
+
+    def _index(self, conn, resource_type, caches, refresh=False):
+        """Return index of a resource type and whether it was just listed.
+
+        Memoized indexes are used unless `refresh` is set.
+
+        Arguments:
+            caches {list} -- `TTLCache`s of the play and of later runs.
+        """
+        proxy, method, query, _ = RESOURCE_TYPES[resource_type]
+        key = cache_key('index', connection_key(conn), resource_type)
+        if not refresh:
+            if key in _INDEXES:
+                return _INDEXES[key], False
+            for cache in caches:
+                index = cache.get(key)
+                if index is not None:
+                    _INDEXES[key] = index
+                    return index, False
+        index = build_index(getattr(getattr(conn, proxy), method)(**query))
+        for cache in caches:
+            cache.set(key, index)
+        _INDEXES[key] = index
+        return index, True
+
+    def _indexes(self, conn, types, caches, refresh=False):
+        """Return indexes and just listed types, one list call per type."""
+        results = run_parallel(
+            lambda resource_type: self._index(
+                conn, resource_type, caches, refresh),
+            types, max_workers=self.get_option('parallelism'))
+        indexes = dict((resource_type, index) for resource_type, (index, _)
+                       in zip(types, results))
+        listed = set(resource_type for resource_type, (_, fresh)
+                     in zip(types, results) if fresh)
+        return indexes, listed
+
+    def run(self, terms, variables=None, **kwargs):
+        if not HAS_LIBRARIES:
+            raise AnsibleLookupError(
+                'openstacksdk and otcextensions are required for the '
+                'opentelekomcloud.cloud.resolve lookup')
+        self.set_options(var_options=variables, direct=kwargs)
+
+        wanted = [parse_term(term) for term in terms]
+        types = sorted(set(resource_type for resource_type, _ in wanted))
+        services = set(RESOURCE_TYPES[resource_type][3]
+                       for resource_type in types) - set([None])
+        target = dict(cloud=self.get_option('cloud'),
+                      region=self.get_option('region'),
+                      project=self.get_option('project'))
+        try:
+            conn = self._connect(target, services)
+            caches = []
+            if self.get_option('play_cache'):
+                caches.append(run_cache())
+            if self.get_option('resolve_cache_ttl') > 0:
+                caches.append(TTLCache(
+                    os.path.join(default_cache_dir('resources'),
+                                 connection_key(conn) + '.json'),
+                    self.get_option('resolve_cache_ttl')))
+            # One list call per type, all types at once
+            indexes, listed = self._indexes(conn, types, caches)
+            # Memoized indexes miss resources created since they were
+            # listed, list types with missing names once more
+            stale = sorted(set(
+                resource_type for resource_type, name in wanted
+                if resource_type not in listed
+                and name not in indexes[resource_type]['ids']
+                and name not in indexes[resource_type]['names']))
+            if stale:
+                indexes.update(self._indexes(
+                    conn, stale, caches, refresh=True)[0])
+        except ParallelError as e:
+            raise AnsibleLookupError(to_native(e))
+        except Exception as e:
+            raise AnsibleLookupError(
+                'Listing resources failed: %s' % to_native(e))
+
+        ignore_missing = self.get_option('ignore_missing')
+        ret = []
+        for resource_type, name in wanted:
+            resource_id = lookup_id(indexes[resource_type], resource_type, name)
+            if resource_id is None and not ignore_missing:
+                raise AnsibleLookupError(
+                    'No %s found for %s' % (resource_type, name))
+            ret.append(resource_id)
+        return ret
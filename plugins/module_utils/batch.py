@@ -0,0 +1,153 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import json
+
+from ansible.module_utils import basic
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.executor import (
+    run_parallel
+)
+
+# Module argument the `batch` action plugin passes the items in
+BATCH_KEY = '_otc_batch'
+
+
+class ItemResult(Exception):
+    """Raised instead of exiting the process by a batch item module."""
+
+    def __init__(self, result):
+        super(ItemResult, self).__init__(result.get('msg', ''))
+        self.result = result
+
+
+def pop_batch_args():
+    """Return the batch definition passed to the module or None.
+
+    Must be called before the module parameters are validated, since the
+    batch key is not part of any argument spec.
+    """
+    args = basic._load_params()
+    batch = args.pop(BATCH_KEY, None)
+    if batch is None:
+        return None
+    return dict(batch, args=args)
+
+
+def _item_exit(module, **kwargs):
+    raise ItemResult(kwargs)
+
+
+def _item_fail(module, msg, **kwargs):
+    kwargs.update(failed=True, msg=msg)
+    raise ItemResult(kwargs)
+
+
+@contextlib.contextmanager
+def _captured_exits():
+    """Turn `exit_json`/`fail_json` of all modules into `ItemResult`."""
+    exit_json = basic.AnsibleModule.exit_json
+    fail_json = basic.AnsibleModule.fail_json
+    basic.AnsibleModule.exit_json = _item_exit
+    basic.AnsibleModule.fail_json = _item_fail
+    try:
+        yield
+    finally:
+        basic.AnsibleModule.exit_json = exit_json
+        basic.AnsibleModule.fail_json = fail_json
+
+
+def _set_args(args):
+    basic._ANSIBLE_ARGS = json.dumps(
+        {'ANSIBLE_MODULE_ARGS': args}).encode('utf-8')
+
+
+def run_batch(module_class, batch):
+    """Run a module once per batch item within the current process.
+
+    Every item is validated by a module instance of its own, built from the
+    shared arguments updated by the item. All instances reuse the
+    connection (and name resolutions) of the first one, `run` of the
+    items is called by up to `parallelism` threads.
+
+    Arguments:
+        module_class -- `OTCModule` child class to run.
+        batch {dict} -- `args` shared by all items, `items` and
+            `parallelism`.
+    """
+    shared = batch['args']
+    items = batch.get('items') or []
+    if not items:
+        # Like a loop over no items, there is no module to report with
+        print(json.dumps(dict(changed=False, results=[])))
+        raise SystemExit(0)
+    modules = []
+    results = [None] * len(items)
+    template = metrics = None
+
+    with _captured_exits():
+        for index, item in enumerate(items):
+            _set_args(dict(shared, **item))
+            try:
+                module = module_class()
+            except ItemResult as e:
+                results[index] = e.result
+                continue
+            if template is None:
+                template = module
+                # API calls are reported once for the whole batch
+                module_class._shared_connection = (module.sdk, module.conn)
+                module_class._shared_resolved = module._resolved
+                metrics, module.metrics = module.metrics, None
+            modules.append((index, module))
+
+        def call(entry):
+            index, module = entry
+            try:
+                module()
+            except ItemResult as e:
+                return e.result
+            except Exception as e:
+                return dict(failed=True, msg=str(e))
+            return dict(changed=False)
+
+        for (index, module), result in zip(modules, run_parallel(
+                call, modules,
+                max_workers=max(batch.get('parallelism') or 1, 1))):
+            results[index] = result
+
+    for item, result in zip(items, results):
+        result['item'] = item
+        result.setdefault('changed', False)
+    failed = [result for result in results if result.get('failed')]
+    output = dict(
+        changed=any(result['changed'] for result in results),
+        results=results,
+        invocation=dict(module_args=dict(shared, items=len(items))))
+    if failed:
+        output.update(failed=True, msg='%d of %d items failed' % (
+            len(failed), len(items)))
+
+    if template is None:
+        # Not even a single module could be built, there is nothing to mask
+        # secrets of the items with, report the first error only
+        print(json.dumps(dict(failed=True, msg='No item could be run: %s'
+                              % (results[0].get('msg') if results else ''))))
+        raise SystemExit(1)
+    if metrics is not None:
+        output['otc_metrics'] = metrics.summary(
+            with_calls=template.params['api_metrics'] == 'full')
+    for _index, module in modules:
+        template.ansible.no_log_values.update(module.ansible.no_log_values)
+    if failed:
+        template.ansible.fail_json(**output)
+    template.ansible.exit_json(**output)
@@ -0,0 +1,227 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+# Tokens expiring within this amount of seconds are not reused from the cache
+TOKEN_STALE_DURATION = 300
+
+
+def default_cache_dir(*parts):
+    """Return the base directory for on-disk caches of the collection.
+
+    Arguments:
+        parts {str} -- Optional sub directories appended to the base path.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'opentelekomcloud', *parts)
+
+
+def cache_key(*elements):
+    """Build a stable file name safe key out of arbitrary json-able data."""
+    raw = json.dumps(elements, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def connection_key(conn):
+    """Return cache key of the cloud, auth, region and project of `conn`."""
+    config = conn.config
+    return cache_key(
+        config.name,
+        config.config.get('auth_type'),
+        config.get_auth_args(),
+        config.get_region_name(),
+        config.get_interface(),
+    )
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Hold an exclusive advisory lock on `path` for the block duration.
+
+    Concurrently running module processes (i.e. Ansible forks) are serialized
+    by the lock. On platforms without `fcntl` the block runs unlocked.
+    """
+    with open(path, 'a') as fd:
+        if HAS_FCNTL:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def read_json(path):
+    """Read json file, return None when it is missing or broken."""
+    try:
+        with open(path) as fd:
+            return json.load(fd)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_json(path, data):
+    """Atomically replace `path` with json dump of `data`.
+
+    The file is only readable by the current user since cached data
+    (tokens, resource ids) is considered sensitive.
+    """
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as tmp:
+            json.dump(data, tmp, default=str)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class TokenCache:
+    """On-disk cache of Keystone tokens shared between module runs.
+
+    Entries are keyed by cloud, auth, region and project of the connection,
+    so that every task of a play reuses a single token instead of doing a
+    full authentication round-trip to IAM. Access to an entry is guarded by
+    a file lock, concurrently started forks therefore wait for the first one
+    to authenticate and pick its token up.
+
+    Args:
+        cache_dir: Directory to store tokens in.
+        stale_duration: Seconds before expiration starting from which a
+            cached token is not reused any more.
+    """
+
+    def __init__(self, cache_dir=None, stale_duration=TOKEN_STALE_DURATION):
+        self.cache_dir = cache_dir or default_cache_dir('tokens')
+        self.stale_duration = stale_duration
+
+    def _load(self, auth, path):
+        state = read_json(path)
+        if not state:
+            return
+        try:
+            auth.set_auth_state(json.dumps(state))
+            if auth.auth_ref.will_expire_soon(self.stale_duration):
+                auth.set_auth_state(None)
+        except Exception:
+            # Broken entry, authenticate from scratch
+            auth.set_auth_state(None)
+
+    def _save(self, auth, path):
+        state = auth.get_auth_state()
+        if state:
+            write_json(path, json.loads(state))
+
+    @contextlib.contextmanager
+    def session(self, conn):
+        """Install cached token into the connection and persist a new one.
+
+        Authentication must happen inside of the block. When the connection
+        auth plugin is not token based (i.e. AK/SK) the cache is a no-op.
+        """
+        auth = getattr(conn.session, 'auth', None)
+        if not hasattr(auth, 'get_auth_state'):
+            yield
+            return
+
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        path = os.path.join(self.cache_dir, connection_key(conn))
+        with file_lock(path + '.lock'):
+            self._load(auth, path + '.json')
+            cached = auth.auth_ref is not None
+            yield
+            if not cached:
+                self._save(auth, path + '.json')
+
+    def invalidate(self, conn):
+        """Drop cached token of the connection."""
+        path = os.path.join(self.cache_dir, connection_key(conn))
+        with contextlib.suppress(OSError):
+            os.unlink(path + '.json')
+
+
+class TTLCache:
+    """Json file backed key/value store with expiring entries.
+
+    The file is read once, updates are merged into the current file content
+    under a file lock so concurrently running module processes do not lose
+    each other entries.
+
+    Args:
+        path: Path of the json file.
+        ttl: Seconds an entry stays valid.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self._entries = None
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = read_json(self.path) or {}
+        return self._entries
+
+    def get(self, key):
+        """Return value stored under `key` or None if missing or expired."""
+        entry = self._load().get(key)
+        if entry and entry['expires'] > time.time():
+            return entry['value']
+        return None
+
+    def set(self, key, value):
+        """Store `value` under `key`."""
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        now = time.time()
+        with file_lock(self.path + '.lock'):
+            entries = read_json(self.path) or {}
+            entries = dict(
+                (k, v) for k, v in entries.items() if v['expires'] > now)
+            entries[key] = {'expires': now + self.ttl, 'value': value}
+            write_json(self.path, entries)
+        self._entries = entries
+
+    def delete(self, key):
+        """Drop entry stored under `key`."""
+        if not os.path.exists(self.path):
+            return
+        with file_lock(self.path + '.lock'):
+            entries = read_json(self.path) or {}
+            if entries.pop(key, None) is not None:
+                write_json(self.path, entries)
+        self._entries = entries
+
+    def clear(self):
+        """Drop all entries."""
+        if os.path.exists(self.path):
+            with file_lock(self.path + '.lock'):
+                with contextlib.suppress(OSError):
+                    os.unlink(self.path)
+        self._entries = {}
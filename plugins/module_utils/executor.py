@@ -0,0 +1,69 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent import futures
+
+
+class ParallelError(Exception):
+    """Aggregated failure of a parallel run.
+
+    Args:
+        errors: List of `(item, exception)` tuples of all failed calls in
+            order of the input items.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super(ParallelError, self).__init__(
+            '%d of the calls failed: %s' % (
+                len(errors),
+                '; '.join('%s: %s' % (item, e) for item, e in errors)))
+
+
+def run_parallel(func, items, max_workers=1):
+    """Call `func` for every item using a bounded thread pool.
+
+    All items are processed even if some of the calls fail.
+
+    Arguments:
+        func {callable} -- Function called with a single item.
+        items {iterable} -- Items to process.
+        max_workers {int} -- Maximal number of concurrent calls, `1`
+            processes items serially in the calling thread.
+
+    Returns:
+        List of results in order of `items`.
+
+    Raises:
+        ParallelError with all failures when any of the calls failed.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    errors = []
+    if max_workers <= 1 or len(items) <= 1:
+        for index, item in enumerate(items):
+            try:
+                results[index] = func(item)
+            except Exception as e:
+                errors.append((item, e))
+    else:
+        workers = min(max_workers, len(items))
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = [pool.submit(func, item) for item in items]
+            for index, future in enumerate(pending):
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    errors.append((items[index], e))
+    if errors:
+        raise ParallelError(errors)
+    return results
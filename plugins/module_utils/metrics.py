@@ -0,0 +1,157 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import re
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+
+# Status codes of calls rejected by API rate limiting
+THROTTLED_STATUS_CODES = frozenset([429])
+
+# Path segments replaced by a placeholder when building URL templates:
+# UUIDs, long hex ids (i.e. project ids) and plain numbers
+_ID_SEGMENT_RE = re.compile(
+    r'^([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?'
+    r'[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}|[0-9a-fA-F]{20,}|\d+)$')
+
+
+def url_template(url):
+    """Return URL path with resource ids replaced by `{id}`.
+
+    Arguments:
+        url {str} -- Absolute or relative request URL.
+    """
+    path = urlsplit(url).path or '/'
+    return '/'.join(
+        '{id}' if _ID_SEGMENT_RE.match(segment) else segment
+        for segment in path.split('/'))
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    rank = max(int(round(pct / 100.0 * len(values))) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+class ApiMetrics:
+    """Recorder of HTTP calls done through a keystoneauth session.
+
+    Once installed, every request of the session is recorded with its
+    service, method, URL template, status, latency and response size.
+    Recording is thread safe.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def install(self, session):
+        """Wrap `request` method of the session to record all calls."""
+        request = session.request
+
+        @functools.wraps(request)
+        def recorded_request(url, method, **kwargs):
+            start = time.time()
+            response = None
+            try:
+                response = request(url, method, **kwargs)
+                return response
+            except Exception as e:
+                response = getattr(e, 'response', None)
+                raise
+            finally:
+                self.record(url, method, response, time.time() - start,
+                            kwargs)
+
+        session.request = recorded_request
+        return session
+
+    def record(self, url, method, response, latency, kwargs=None):
+        """Record a single call."""
+        kwargs = kwargs or {}
+        endpoint_filter = kwargs.get('endpoint_filter') or {}
+        service = endpoint_filter.get('service_type')
+        status = getattr(response, 'status_code', None)
+        if response is not None and getattr(response, 'url', None):
+            url = response.url
+        if not service:
+            # Plain session calls (i.e. authentication) have no endpoint
+            # filter, use the first label of the host name instead
+            service = (urlsplit(url).hostname or 'unknown').split('.')[0]
+        size = 0
+        if response is not None:
+            if kwargs.get('stream'):
+                size = int(response.headers.get('Content-Length') or 0)
+            else:
+                size = len(response.content or b'')
+        call = {
+            'service': service,
+            'method': method.upper(),
+            'url': url_template(url),
+            'status': status,
+            'latency': round(latency, 4),
+            'bytes': size,
+        }
+        with self._lock:
+            self.calls.append(call)
+        return call
+
+    def record_retry(self):
+        """Count a retry of a call, reported by the throttling layer."""
+        with self._lock:
+            self.retries += 1
+
+    def summary(self, with_calls=False):
+        """Return summary of the recorded calls.
+
+        Arguments:
+            with_calls {bool} -- Include list of individual calls.
+        """
+        with self._lock:
+            calls = list(self.calls)
+            retries = self.retries
+        latencies = sorted(call['latency'] for call in calls)
+        services = {}
+        for call in calls:
+            service = services.setdefault(
+                call['service'],
+                {'calls': 0, 'throttled': 0, 'total_latency': 0.0})
+            service['calls'] += 1
+            service['total_latency'] += call['latency']
+            if call['status'] in THROTTLED_STATUS_CODES:
+                service['throttled'] += 1
+        for service in services.values():
+            service['total_latency'] = round(service['total_latency'], 4)
+
+        result = {
+            'calls': len(calls),
+            'retries': retries,
+            'bytes': sum(call['bytes'] for call in calls),
+            'total_latency': round(sum(latencies), 4),
+            'latency': {
+                'p50': percentile(latencies, 50),
+                'p90': percentile(latencies, 90),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if latencies else 0.0,
+            },
+            'services': services,
+        }
+        if with_calls:
+            result['requests'] = calls
+        return result
@@ -11,17 +11,78 @@
 # limitations under the License.
 
 import abc
+import functools
+import importlib
+import os
+import re
 
 try:
     import openstack as sdk
     import otcextensions
+    from requests import adapters as requests_adapters
     from otcextensions import sdk as otc_sdk
-    from pkg_resources import parse_version as V
     HAS_LIBRARIES = True
 except ImportError:
     HAS_LIBRARIES = False
 
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, env_fallback
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.batch import (
+    pop_batch_args, run_batch
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.cache import (
+    TTLCache, TokenCache, cache_key, connection_key, default_cache_dir
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.executor import (
+    ParallelError, run_parallel
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.metrics import ApiMetrics
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.profiler import Profiler
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.serializer import serialize
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.throttle import (
+    RateLimiter, Throttle
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import Waiter
+
+
+OTCE_MIN_VERSION = '0.6.9'
+
+# Connections kept per host by requests when no pool size is given
+HTTP_POOL_MAXSIZE = 10
+
+_VERSION_RE = re.compile(r'^\s*v?(\d+(?:\.\d+)*)(.*)$')
+
+
+@functools.lru_cache(maxsize=None)
+def parse_version(version):
+    """Parse version string into a comparable key.
+
+    This is a lightweight replacement of `pkg_resources.parse_version`
+    (which is very slow to import) good enough for gating features on
+    library versions: release segments are compared numerically and
+    pre/dev releases sort before the corresponding final release.
+
+    Arguments:
+        version {str} -- Version string, i.e. `0.26.3` or `1.0.0rc1`.
+    """
+    match = _VERSION_RE.match(str(version)) if version else None
+    if not match:
+        return ((), 0)
+    release = [int(part) for part in match.group(1).split('.')]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    suffix = match.group(2).lstrip('.-_')
+    is_final = not suffix or suffix.startswith(('+', 'post'))
+    return (tuple(release), 1 if is_final else 0)
+
+
+@functools.lru_cache(maxsize=None)
+def installed_version(distribution):
+    """Return installed version of the python distribution or None."""
+    try:
+        from importlib import metadata
+        return metadata.version(distribution)
+    except Exception:
+        return None
 
 
 def openstack_full_argument_spec(**kwargs):
@@ -40,11 +101,154 @@ def openstack_full_argument_spec(**kwargs):
         interface=dict(
             default='public', choices=['public', 'internal', 'admin'],
             aliases=['endpoint_type']),
+        token_cache=dict(
+            default=False, type='bool',
+            fallback=(env_fallback, ['OTC_TOKEN_CACHE'])),
+        token_cache_dir=dict(
+            default=None, type='path',
+            fallback=(env_fallback, ['OTC_TOKEN_CACHE_DIR'])),
+        api_metrics=dict(
+            default='none', choices=['none', 'summary', 'full'],
+            fallback=(env_fallback, ['OTC_API_METRICS'])),
+        resolve_cache_ttl=dict(
+            default=0, type='int',
+            fallback=(env_fallback, ['OTC_RESOLVE_CACHE_TTL'])),
+        result_cache_ttl=dict(
+            default=0, type='int',
+            fallback=(env_fallback, ['OTC_RESULT_CACHE_TTL'])),
+        parallelism=dict(
+            default=1, type='int',
+            fallback=(env_fallback, ['OTC_PARALLELISM'])),
+        api_rate_limits=dict(
+            default=None, type='dict',
+            fallback=(env_fallback, ['OTC_API_RATE_LIMITS'])),
+        api_retries=dict(
+            default=3, type='int',
+            fallback=(env_fallback, ['OTC_API_RETRIES'])),
+        http_pool_maxsize=dict(
+            default=None, type='int',
+            fallback=(env_fallback, ['OTC_HTTP_POOL_MAXSIZE'])),
+        http_keepalive=dict(
+            default=True, type='bool',
+            fallback=(env_fallback, ['OTC_HTTP_KEEPALIVE'])),
+        profile=dict(
+            default=None, type='path',
+            fallback=(env_fallback, ['OTC_PROFILE'])),
     )
     spec.update(kwargs)
     return spec
 
 
+def configure_http(conn, params):
+    """Size the HTTP connection pool of the connection session.
+
+    All proxies (including the otcextensions ones) are adapters of the
+    single `conn.session`, so the pool is shared by every service. It must
+    be able to hold a connection per concurrent call, otherwise parallel
+    calls keep opening and discarding connections.
+    """
+    http = getattr(conn.session, 'session', None)
+    if http is None:
+        return
+    maxsize = params.get('http_pool_maxsize') or max(
+        HTTP_POOL_MAXSIZE, params.get('parallelism') or 1)
+    keepalive = params.get('http_keepalive', True)
+    for scheme, current in list(http.adapters.items()):
+        if keepalive:
+            # Keep keystoneauth adapter (TCP keep-alive, TLS settings)
+            adapter_class = type(current)
+            kwargs = dict(
+                (attr, getattr(current, attr))
+                for attr in ('tls_ciphers', 'tls_min_version')
+                if hasattr(current, attr))
+        else:
+            adapter_class = requests_adapters.HTTPAdapter
+            kwargs = {}
+        http.mount(scheme, adapter_class(
+            pool_maxsize=maxsize, max_retries=current.max_retries,
+            **kwargs))
+    if not keepalive:
+        http.headers['Connection'] = 'close'
+
+
+def install_throttle(conn, params, metrics=None, log=None):
+    """Rate limit and retry throttled calls of the connection.
+
+    Rate limits are shared by all processes using the same credentials and
+    region, so concurrently running forks stay within one budget.
+    """
+    rate_limiter = None
+    if params.get('api_rate_limits'):
+        rate_limiter = RateLimiter(
+            params['api_rate_limits'],
+            state_dir=default_cache_dir('ratelimit', connection_key(conn)))
+
+    def on_retry(method, url, status, delay):
+        if metrics is not None:
+            metrics.record_retry()
+        if log:
+            log('%s %s returned %s, retrying in %.1f seconds'
+                % (method, url, status, delay))
+
+    Throttle(rate_limiter, retries=params.get('api_retries', 3),
+             on_retry=on_retry).install(conn.session)
+
+
+def load_otce_services(conn, otce_services=None):
+    """Register OTC services in the connection.
+
+    Falls back to registering every known service when `otce_services` is
+    not given or otcextensions does not support it.
+    """
+    if (otce_services is None
+            or not hasattr(otc_sdk, 'register_single_service')):
+        otc_sdk.load(conn)
+        return
+
+    conn.authorize()
+    project_id = conn.current_project_id
+    for service_name in otce_services:
+        otc_sdk.register_single_service(conn, service_name, project_id)
+
+    otc_sdk.patch_openstack_resources()
+    for service_name in ('cce', 'dds', 'rds'):
+        if service_name in otce_services:
+            # Cloud layer helpers, i.e. conn.create_rds_instance
+            cloud_layer = importlib.import_module(
+                'otcextensions.sdk.cloud.' + service_name)
+            mixin = service_name.capitalize() + 'Mixin'
+            otc_sdk.extend_instance(conn, getattr(cloud_layer, mixin))
+
+
+def setup_connection(conn, params, otce_services=None, metrics=None,
+                     log=None):
+    """Prepare a new SDK connection according to the common arguments.
+
+    Shared by modules and inventory plugins: tunes the HTTP pool, installs
+    the metrics recorder and the throttling layer and registers the OTC
+    services, authenticating with a cached token when `token_cache` is set.
+
+    Arguments:
+        conn -- Connection returned by `openstack.connect`.
+        params {dict} -- Values of the common arguments.
+        otce_services {tuple} -- OTC services to register, all when None.
+        metrics {ApiMetrics} -- Recorder to install.
+        log {callable} -- Debug logger.
+    """
+    configure_http(conn, params)
+    if metrics is not None:
+        metrics.install(conn.session)
+    install_throttle(conn, params, metrics=metrics, log=log)
+    if params.get('token_cache'):
+        # otc_sdk.load authorizes the connection, reuse a cached token for
+        # that if there is a valid one
+        with TokenCache(params.get('token_cache_dir')).session(conn):
+            load_otce_services(conn, otce_services)
+    else:
+        load_otce_services(conn, otce_services)
+    return conn
+
+
 class OTCModule:
     """Openstack Module is a base class for all Openstack Module classes.
 
@@ -58,9 +262,14 @@ class OTCModule:
         results: Dictionary for return of Ansible module,
             must include `changed` keyword.
         exit, exit_json: Exit module and return data inside, must include
-            changed` keyword in a data.
+            changed` keyword in a data. When `api_metrics` is enabled the
+            `otc_metrics` summary of API calls is added to the data.
         fail, fail_json: Exit module with failure, has `msg` keyword to
             specify a reason of failure.
+        metrics: Recorder of API calls done by the connection or None.
+        profiler: cProfile and tracemalloc recorder of `run` when the
+            `profile` directory is set, otherwise None. Its summary is
+            returned in the `otc_profile` key.
         conn: Connection to SDK object.
         log: Print message to system log.
         debug: Print debug message to system log, prints if Ansible Debug is
@@ -70,6 +279,13 @@ class OTCModule:
             warning.
         check_versioned: helper function to check that all arguments are known
             in the current SDK version.
+        resolve: Find a resource by name or id, memoizing the result for the
+            module run and (if `resolve_cache_ttl` is set) across runs.
+        waiter: Return a backoff waiter bound to the module `timeout`.
+        serialize: Convert a resource into a dictionary honoring the
+            `fields` and `exclude_fields` parameters.
+        parallel: Call a function for many items using up to `parallelism`
+            threads, returning results in order.
         run: method that executes and shall be overriden in inherited classes.
 
     Args:
@@ -77,24 +293,93 @@ class OTCModule:
             module.
         argument_spec: Used for construction of Openstack common arguments.
         module_kwargs: Additional arguments for Ansible Module.
+        otce_min_version: Minimal required version of otcextensions.
+        otce_services: Names of OTC services (as known to otcextensions)
+            used by the module. Only those proxies are imported and
+            registered in the connection. When not set all of them are.
+        supports_fields: Add `fields` and `exclude_fields` parameters
+            (documented by the `opentelekomcloud.cloud.otc.info` fragment)
+            limiting keys returned by `serialize`.
+        result_cache: Name of the result cache group of an info module.
+            With `result_cache_ttl` set, results are cached on disk by
+            module arguments and connection and returned without running
+            the module again.
+        invalidates_cache: Result cache groups dropped when the module
+            reports a change.
+
+    When started by the `batch` action plugin, the module runs once per
+    batch item within the same process and connection (see `run_batch`).
     """
 
     argument_spec = {}
     module_kwargs = {}
     otce_min_version = None
+    otce_services = None
+    supports_fields = False
+    result_cache = None
+    invalidates_cache = ()
+    _shared_connection = None
+    _shared_resolved = None
 
     def __init__(self):
 
+        self._batch = None
+        if self._shared_connection is None:
+            self._batch = pop_batch_args()
+            if self._batch is not None:
+                # Items are built and run by `__call__`
+                return
+
+        argument_spec = dict(self.argument_spec)
+        if self.supports_fields:
+            argument_spec.update(
+                fields=dict(type='list', elements='str'),
+                exclude_fields=dict(type='list', elements='str'))
         self.ansible = AnsibleModule(
-            openstack_full_argument_spec(**self.argument_spec),
+            openstack_full_argument_spec(**argument_spec),
             **self.module_kwargs)
         self.params = self.ansible.params
         self.module_name = self.ansible._name
         self.sdk_version = None
         self.results = {'changed': False}
-        self.exit = self.exit_json = self.ansible.exit_json
-        self.fail = self.fail_json = self.ansible.fail_json
-        self.sdk, self.conn = self.openstack_cloud_from_module()
+        self.exit = self.exit_json = self._exit_json
+        self.fail = self.fail_json = self._fail_json
+        self.metrics = None
+        self.profiler = None
+        self._resolved = {}
+        if self._shared_resolved is not None:
+            self._resolved = self._shared_resolved
+        self._resolve_cache = None
+        if self._shared_connection is not None:
+            self.params.pop('cloud', None)
+            self.sdk, self.conn = self._shared_connection
+        else:
+            self.sdk, self.conn = self.openstack_cloud_from_module()
+
+    def _add_metrics(self, kwargs):
+        if self.metrics is not None:
+            kwargs['otc_metrics'] = self.metrics.summary(
+                with_calls=self.params['api_metrics'] == 'full')
+
+    def _add_profile(self, kwargs):
+        if self.profiler is not None:
+            summary = self.profiler.stop()
+            if summary is not None:
+                kwargs['otc_profile'] = summary
+
+    def _exit_json(self, **kwargs):
+        if kwargs.get('changed'):
+            self._invalidate_result_caches()
+        else:
+            self._store_result(kwargs)
+        self._add_metrics(kwargs)
+        self._add_profile(kwargs)
+        self.ansible.exit_json(**kwargs)
+
+    def _fail_json(self, **kwargs):
+        self._add_metrics(kwargs)
+        self._add_profile(kwargs)
+        self.ansible.fail_json(**kwargs)
 
     def log(self, msg):
         """Prints log message to system log.
@@ -114,19 +399,20 @@ class OTCModule:
             self.ansible.log(
                 " ".join(['[DEBUG]', msg]))
 
-    def openstack_cloud_from_module(self, min_version='0.6.9'):
+    def openstack_cloud_from_module(self, min_version=OTCE_MIN_VERSION):
         if self.otce_min_version:
             min_version = self.otce_min_version
 
         if not HAS_LIBRARIES:
             self.fail_json(msg='openstacksdk and otcextensions are required for this self')
 
-        if min_version:
-            min_version = max(V('0.6.9'), V(min_version))
-        else:
-            min_version = V('0.6.9')
+        if (not min_version
+                or parse_version(min_version) < parse_version(OTCE_MIN_VERSION)):
+            min_version = OTCE_MIN_VERSION
 
-        if V(otcextensions.__version__) < min_version:
+        otce_version = (installed_version('otcextensions')
+                        or otcextensions.__version__)
+        if parse_version(otce_version) < parse_version(min_version):
             self.fail_json(
                 msg="To utilize this self, the installed version of "
                     "the otcextensions library MUST be >={min_version}".format(
@@ -149,8 +435,6 @@ class OTCModule:
                 if self.params['interface'] != 'public':
                     self.fail_json(msg=fail_message.format(param='interface'))
                 conn = sdk.connect(**cloud_config)
-                otc_sdk.load(conn)
-                return sdk, conn
             else:
                 conn = sdk.connect(
                     cloud=cloud_config,
@@ -163,12 +447,162 @@ class OTCModule:
                     api_timeout=self.params['api_timeout'],
                     interface=self.params['interface'],
                 )
-                otc_sdk.load(conn)
-                return sdk, conn
+            if self.params['api_metrics'] != 'none':
+                self.metrics = ApiMetrics()
+            setup_connection(conn, self.params, self.otce_services,
+                             metrics=self.metrics, log=self.debug)
+            return sdk, conn
         except sdk.exceptions.SDKException as e:
             # Probably a cloud configuration/login error
             self.fail_json(msg=str(e))
 
+    def _result_cache_path(self, group):
+        return os.path.join(default_cache_dir('results'),
+                            connection_key(self.conn), group + '.json')
+
+    def _result_key(self):
+        common = openstack_full_argument_spec()
+        args = dict((name, value) for name, value in self.params.items()
+                    if name not in common)
+        return cache_key(self.module_name, args)
+
+    def _get_result_cache(self):
+        if self.result_cache and self.params['result_cache_ttl'] > 0:
+            return TTLCache(self._result_cache_path(self.result_cache),
+                            self.params['result_cache_ttl'])
+        return None
+
+    def _cached_result(self):
+        result_cache = self._get_result_cache()
+        if result_cache:
+            return result_cache.get(self._result_key())
+        return None
+
+    def _store_result(self, result):
+        result_cache = self._get_result_cache()
+        if result_cache:
+            result_cache.set(self._result_key(), result)
+
+    def _invalidate_result_caches(self):
+        for group in self.invalidates_cache:
+            # Cheap enough to do even when result caching is not used
+            TTLCache(self._result_cache_path(group), 0).clear()
+
+    def _get_resolve_cache(self):
+        if self._resolve_cache is None and self.params['resolve_cache_ttl'] > 0:
+            path = os.path.join(default_cache_dir('resources'),
+                                connection_key(self.conn) + '.json')
+            self._resolve_cache = TTLCache(
+                path, self.params['resolve_cache_ttl'])
+        return self._resolve_cache
+
+    def resolve(self, kind, name_or_id, ignore_missing=True, **query):
+        """Find resource by name or id, memoizing results.
+
+        Repeated resolutions of the same resource during the module run cost
+        no API calls. When `resolve_cache_ttl` is set, found resources are
+        additionally stored on disk and reused by subsequent tasks.
+
+        Arguments:
+            kind {str} -- Proxy and resource type, i.e. `network.router`
+                for `conn.network.find_router`.
+            name_or_id {str} -- Name or ID of the resource.
+            ignore_missing {bool} -- Return None instead of raising
+                `ResourceNotFound` when nothing is found.
+            query -- Additional arguments of the find method.
+
+        Returns:
+            Found resource or None.
+        """
+        if not name_or_id:
+            return None
+        key = cache_key(kind, name_or_id, query)
+        if key in self._resolved:
+            resource = self._resolved[key]
+            if resource is None and not ignore_missing:
+                raise self.sdk.exceptions.ResourceNotFound(
+                    "No %s found for %s" % (kind, name_or_id))
+            return resource
+
+        resource = None
+        resolve_cache = self._get_resolve_cache()
+        if resolve_cache:
+            cached = resolve_cache.get(key)
+            if cached:
+                resource_class = getattr(
+                    importlib.import_module(cached['module']),
+                    cached['class'])
+                resource = resource_class.existing(**cached['attrs'])
+
+        if resource is None:
+            proxy, resource_type = kind.split('.', 1)
+            finder = getattr(getattr(self.conn, proxy),
+                             'find_' + resource_type)
+            resource = finder(name_or_id, ignore_missing=ignore_missing,
+                              **query)
+            if resource is not None and resolve_cache:
+                resolve_cache.set(key, {
+                    'module': type(resource).__module__,
+                    'class': type(resource).__name__,
+                    'attrs': resource.to_dict(computed=False),
+                })
+
+        self._resolved[key] = resource
+        return resource
+
+    def waiter(self, timeout=None, **kwargs):
+        """Return a waiter polling resources with exponential backoff.
+
+        Arguments:
+            timeout {int} -- Overall seconds to wait, defaults to the
+                `timeout` module parameter.
+            kwargs -- Additional arguments of `Waiter`.
+        """
+        if timeout is None:
+            timeout = self.params.get('timeout') or 180
+
+        def on_transition(item, old, new):
+            self.debug('%s changed status from %s to %s'
+                       % (getattr(item, 'id', item), old, new))
+
+        kwargs.setdefault('on_transition', on_transition)
+        return Waiter(timeout, **kwargs)
+
+    def serialize(self, resource, exclude=()):
+        """Return dictionary of the resource for the module result.
+
+        Only keys selected by `fields`/`exclude_fields` are converted, which
+        keeps results of modules listing many resources small.
+
+        Arguments:
+            resource -- SDK resource or a dictionary.
+            exclude {tuple} -- Keys the module never returns.
+        """
+        return serialize(
+            resource, fields=self.params.get('fields'),
+            exclude_fields=list(self.params.get('exclude_fields') or ())
+            + list(exclude))
+
+    def parallel(self, func, items):
+        """Call `func` for every item concurrently.
+
+        At most `parallelism` calls run at once, API calls done by `func`
+        are still subject to `api_rate_limits`. All items are processed even
+        when some calls fail.
+
+        Arguments:
+            func {callable} -- Function called with a single item.
+            items {iterable} -- Items to process.
+
+        Returns:
+            List of results in order of `items`.
+
+        Raises:
+            ParallelError listing every failed item.
+        """
+        return run_parallel(
+            func, items, max_workers=max(self.params['parallelism'], 1))
+
     # Filter out all arguments that are not from current SDK version
     def check_versioned(self, **kwargs):
         """Check that provided arguments are supported by current SDK version
@@ -178,13 +612,16 @@ class OTCModule:
                                     supported by current SDK version. All others
                                     are dropped.
         """
+        if not self.sdk_version:
+            self.sdk_version = installed_version('openstacksdk')
+        sdk_version = parse_version(self.sdk_version)
         versioned_result = {}
         for var_name in kwargs:
             if ('min_ver' in self.argument_spec[var_name]
-                    and V(self.sdk_version) < self.argument_spec[var_name]['min_ver']):
+                    and sdk_version < parse_version(self.argument_spec[var_name]['min_ver'])):
                 continue
             if ('max_ver' in self.argument_spec[var_name]
-                    and V(self.sdk_version) > self.argument_spec[var_name]['max_ver']):
+                    and sdk_version > parse_version(self.argument_spec[var_name]['max_ver'])):
                 continue
             versioned_result.update({var_name: kwargs[var_name]})
         return versioned_result
@@ -197,10 +634,30 @@ class OTCModule:
         """Execute `run` function when calling the class.
         """
 
+        if self._batch is not None:
+            run_batch(type(self), self._batch)
+            return
+
         try:
-            results = self.run()
+            cached = self._cached_result()
+            if cached is not None:
+                # Stored results are final, do not store them again
+                self._add_metrics(cached)
+                self.ansible.exit_json(**cached)
+            # Items of a batch run in threads of a single process, which
+            # cProfile can not follow, so they are never profiled
+            if self.params['profile'] and self._shared_connection is None:
+                self.profiler = Profiler(self.params['profile'],
+                                         self.module_name)
+                self.profiler.start()
+            try:
+                results = self.run()
+            finally:
+                # Exit and failure handling are not part of the profile
+                if self.profiler is not None:
+                    self.profiler.stop()
             if results and isinstance(results, dict):
-                self.ansible.exit_json(**results)
+                self.exit_json(**results)
 
         except self.sdk.exceptions.OpenStackCloudException as e:
             params = {
@@ -212,4 +669,9 @@ class OTCModule:
                                         'text', 'None')
                 }
             }
-            self.ansible.fail_json(**params)
+            self.fail_json(**params)
+
+        except ParallelError as e:
+            self.fail_json(msg=str(e), errors=[
+                {'item': str(item), 'msg': str(error)}
+                for item, error in e.errors])
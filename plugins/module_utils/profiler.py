@@ -0,0 +1,142 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import time
+import tracemalloc
+
+# Number of functions and allocation sites written to the text reports
+TOP_ENTRIES = 40
+
+# Where time is spent, matched against file names of profiled functions in
+# this order: HTTP connections and socket waits, SDK code (i.e. resource
+# parsing), code of the collection. Other functions (standard library,
+# built-ins) count for the category of their main caller.
+CATEGORIES = (
+    ('network', re.compile(
+        r'[/\\](urllib3|http|ssl|socket|selectors)([/\\]|\.py$)|'
+        r'^<method \'(recv|recv_into|read|connect|do_handshake|sendall)\'')),
+    ('sdk', re.compile(r'[/\\](openstack|otcextensions)[/\\]')),
+    ('collection', re.compile(
+        r'ansible_collections[/\\]opentelekomcloud[/\\]cloud[/\\]')),
+)
+
+
+def categorize(filename):
+    """Return the time category of a profiled function's file name."""
+    for name, regex in CATEGORIES:
+        if regex.search(filename):
+            return name
+    return 'other'
+
+
+class Profiler:
+    """cProfile and tracemalloc recorder of a module run.
+
+    `stop` writes the collected data into a directory of its own below
+    `base_dir`:
+
+        profile.pstats -- Raw cProfile data, i.e. for `snakeviz`.
+        profile.txt -- Functions with the highest cumulative time.
+        allocations.txt -- Source lines allocating the most memory still
+            held at the end of the run.
+        summary.json -- The summary returned by `stop`.
+
+    Only the thread starting the profiler is profiled, calls done by
+    `parallel` worker threads show up as waits for them.
+    """
+
+    def __init__(self, base_dir, name):
+        self.path = os.path.join(base_dir, '%s-%s-%d' % (
+            name, time.strftime('%Y%m%dT%H%M%S'), os.getpid()))
+        self._profile = cProfile.Profile()
+        self._start = None
+        self._started_tracing = False
+        self.summary = None
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._start = time.time()
+        self._profile.enable()
+
+    def stop(self):
+        """Stop recording, write the reports and return their summary.
+
+        Stopping again returns the same summary, None when the profiler
+        never ran.
+        """
+        if self._start is None:
+            return self.summary
+        self._profile.disable()
+        wall_time = time.time() - self._start
+        self._start = None
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        os.makedirs(self.path, exist_ok=True)
+        self._profile.dump_stats(os.path.join(self.path, 'profile.pstats'))
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats('cumulative').print_stats(TOP_ENTRIES)
+        with open(os.path.join(self.path, 'profile.txt'), 'w') as fd:
+            fd.write(stream.getvalue())
+
+        allocations = snapshot.statistics('lineno')[:TOP_ENTRIES]
+        with open(os.path.join(self.path, 'allocations.txt'), 'w') as fd:
+            for statistic in allocations:
+                fd.write('%s\n' % statistic)
+
+        self.summary = dict(
+            path=self.path, wall_time=round(wall_time, 4),
+            time=self.time_by_category(stats),
+            memory=dict(current=current, peak=peak))
+        with open(os.path.join(self.path, 'summary.json'), 'w') as fd:
+            json.dump(self.summary, fd, indent=2, sort_keys=True)
+        return self.summary
+
+    @staticmethod
+    def time_by_category(stats):
+        """Return own time of profiled functions summed per category."""
+        categories = {}
+
+        def category(func, seen):
+            if func in categories:
+                return categories[func]
+            filename, _line, name = func
+            # Built-in functions have no file, i.e. `<method 'recv_into' ...>`
+            result = categorize(name if filename == '~' else filename)
+            callers = stats.stats[func][4] if func in stats.stats else {}
+            if result == 'other' and callers and func not in seen:
+                seen.add(func)
+                # Caller with the highest cumulative time spent in `func`
+                result = category(
+                    max(callers, key=lambda caller: callers[caller][3]), seen)
+            categories[func] = result
+            return result
+
+        totals = dict((name, 0.0) for name, _ in CATEGORIES)
+        totals['other'] = 0.0
+        for func, entry in stats.stats.items():
+            totals[category(func, set())] += entry[2]
+        return dict((name, round(value, 4)) for name, value in totals.items())
@@ -0,0 +1,265 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import ipaddress
+import itertools
+
+# Attributes identifying a security group rule, rules can not be updated
+RULE_KEYS = ('direction', 'ethertype', 'protocol', 'port_range_min',
+             'port_range_max', 'remote_ip_prefix', 'remote_group_id',
+             'remote_address_group_id')
+
+# Keys of rules in module arguments besides `RULE_KEYS`, passed on creation
+# but not compared
+RULE_EXTRA_KEYS = ('description', 'project_id')
+
+PROTOCOL_ALIASES = {
+    '1': 'icmp',
+    '6': 'tcp',
+    '17': 'udp',
+    '58': 'ipv6-icmp',
+    'icmpv6': 'ipv6-icmp',
+    'any': None,
+}
+
+ETHERTYPES = {'ipv4': 'IPv4', 'ipv6': 'IPv6'}
+
+# Prefixes matching any address, same as no prefix at all
+ANY_PREFIXES = ('0.0.0.0/0', '::/0')
+
+# Protocols with port ranges, where the full range equals no range
+PORT_PROTOCOLS = ('tcp', 'udp')
+FULL_PORT_RANGE = (1, 65535)
+
+# Protocols with ICMP type and code instead of a port range
+ICMP_PROTOCOLS = ('icmp', 'ipv6-icmp')
+
+# Range of rules without ports, covers ports as well as ICMP types
+ANY_PORT_RANGE = (0, 65535)
+
+
+def _port(value):
+    if value is None or value == '':
+        return None
+    value = int(value)
+    return None if value == -1 else value
+
+
+def normalize_protocol(protocol):
+    if protocol is None:
+        return None
+    protocol = str(protocol).lower()
+    return PROTOCOL_ALIASES.get(protocol, protocol)
+
+
+def normalize_rule(rule):
+    """Return the identity of a rule as tuple of `RULE_KEYS` values.
+
+    Rules equal for the API get equal tuples, no matter if they are given
+    with protocol numbers or names, ports as strings, the full port range or
+    no range, `0.0.0.0/0` or no prefix, or host addresses instead of
+    networks.
+
+    Arguments:
+        rule {dict} -- Rule of module arguments or the API (SDK resources
+            are dictionaries as well).
+
+    Raises ValueError for invalid ports and prefixes.
+    """
+    protocol = normalize_protocol(rule.get('protocol'))
+
+    port_range = (_port(rule.get('port_range_min')),
+                  _port(rule.get('port_range_max')))
+    if protocol in PORT_PROTOCOLS and port_range == FULL_PORT_RANGE:
+        port_range = (None, None)
+
+    remote_group_id = rule.get('remote_group_id') or None
+    prefix = rule.get('remote_ip_prefix') or None
+    if prefix is not None:
+        prefix = str(ipaddress.ip_network(str(prefix), strict=False))
+        if prefix in ANY_PREFIXES and not remote_group_id:
+            prefix = None
+
+    ethertype = rule.get('ethertype') or 'IPv4'
+    return (
+        (rule.get('direction') or 'ingress').lower(),
+        ETHERTYPES.get(ethertype.lower(), ethertype),
+        protocol,
+        port_range[0],
+        port_range[1],
+        prefix,
+        remote_group_id,
+        rule.get('remote_address_group_id') or None,
+    )
+
+
+def rule_attrs(rule):
+    """Return normalized attributes to create a rule with."""
+    attrs = dict((key, value) for key, value in zip(
+        RULE_KEYS, normalize_rule(rule)) if value is not None)
+    for key in RULE_EXTRA_KEYS:
+        if rule.get(key):
+            attrs[key] = rule[key]
+    return attrs
+
+
+def diff_rules(existing, desired, exclusive=False):
+    """Return the minimal changes turning `existing` rules into `desired`.
+
+    Arguments:
+        existing {list} -- Rules of the security group.
+        desired {list} -- Wanted rules, duplicates are created once.
+        exclusive {bool} -- Delete existing rules which are not desired.
+
+    Returns a tuple of desired rules to create and existing rules to
+    delete.
+    """
+    present = {}
+    for rule in existing:
+        present.setdefault(normalize_rule(rule), []).append(rule)
+
+    wanted = set()
+    to_create = []
+    for rule in desired:
+        key = normalize_rule(rule)
+        if key in wanted:
+            continue
+        wanted.add(key)
+        if key not in present:
+            to_create.append(rule)
+
+    to_delete = []
+    if exclusive:
+        for key, rules in present.items():
+            if key not in wanted:
+                to_delete.extend(rules)
+    return to_create, to_delete
+
+
+class IntervalIndex:
+    """Static index of closed intervals answering point queries.
+
+    Intervals are sorted by start, along with the running maximum of their
+    ends. A query walks back from the last interval starting at or before
+    the point and stops as soon as no earlier interval reaches it.
+    """
+
+    def __init__(self, intervals):
+        self._intervals = sorted(intervals, key=lambda item: item[:2])
+        self._starts = [start for start, _end, _value in self._intervals]
+        self._max_ends = list(itertools.accumulate(
+            (end for _start, end, _value in self._intervals), max))
+
+    def find(self, point=None):
+        """Yield values of all intervals containing `point` (any if None)."""
+        if point is None:
+            for _start, _end, value in self._intervals:
+                yield value
+            return
+        index = bisect.bisect_right(self._starts, point) - 1
+        while index >= 0 and self._max_ends[index] >= point:
+            _start, end, value = self._intervals[index]
+            if end >= point:
+                yield value
+            index -= 1
+
+
+class RuleIndex:
+    """Index of security group rules answering which rules permit a flow.
+
+    Port ranges are kept in an `IntervalIndex` per direction, ethertype and
+    protocol, remote prefixes in a table per IP version and prefix length,
+    so a query costs a range lookup and one dictionary lookup per prefix
+    length instead of a scan of all rules.
+
+    Arguments:
+        rules {list} -- Rules of the API.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        intervals = {}
+        self._prefixes = {}
+        self._remote_groups = {}
+        for position, rule in enumerate(self.rules):
+            (direction, ethertype, protocol, port_min, port_max, prefix,
+             remote_group_id, remote_address_group_id) = normalize_rule(rule)
+            if protocol in ICMP_PROTOCOLS:
+                # Port fields are ICMP type and code, only types are indexed
+                port_max = port_min
+            if port_min is None and port_max is None:
+                port_min, port_max = ANY_PORT_RANGE
+            elif port_min is None or port_max is None:
+                port_min = port_max = (
+                    port_min if port_max is None else port_max)
+            intervals.setdefault((direction, ethertype, protocol), []).append(
+                (port_min, port_max, position))
+
+            if prefix is None and remote_group_id:
+                self._remote_groups.setdefault(
+                    remote_group_id, set()).add(position)
+            elif prefix is None and remote_address_group_id:
+                # Members of address groups are not known
+                continue
+            else:
+                network = ipaddress.ip_network(prefix or (
+                    '::/0' if ethertype == 'IPv6' else '0.0.0.0/0'))
+                self._prefixes.setdefault(
+                    (network.version, network.prefixlen), {}).setdefault(
+                        int(network.network_address), set()).add(position)
+        self._ports = dict((key, IntervalIndex(value))
+                           for key, value in intervals.items())
+
+    def allowing(self, source, port=None, protocol='tcp',
+                 direction='ingress', group_members=None):
+        """Return rules permitting a flow, in order of the rules.
+
+        Arguments:
+            source {str} -- IP address or CIDR of the remote side, all its
+                addresses must be permitted.
+            port {int} -- Port (or ICMP type), all rules of the protocol
+                match when not given, whatever their port range.
+            protocol {str} -- Protocol name or number, rules for any
+                protocol always match.
+            direction {str} -- ingress or egress.
+            group_members {callable} -- Function returning addresses of
+                ports of a security group. Without it rules with remote
+                groups never match, neither do they for network sources.
+
+        Raises ValueError for invalid sources.
+        """
+        network = ipaddress.ip_network(str(source), strict=False)
+        ethertype = 'IPv%d' % network.version
+
+        by_port = set()
+        for rule_protocol in set([normalize_protocol(protocol), None]):
+            intervals = self._ports.get((direction, ethertype, rule_protocol))
+            if intervals is not None:
+                by_port.update(intervals.find(port))
+
+        by_source = set()
+        address = int(network.network_address)
+        for length in range(network.prefixlen + 1):
+            table = self._prefixes.get((network.version, length))
+            if table:
+                shift = network.max_prefixlen - length
+                by_source.update(table.get(address >> shift << shift, ()))
+        if group_members is not None and network.num_addresses == 1:
+            host = str(network.network_address)
+            for group_id, positions in self._remote_groups.items():
+                candidates = positions & by_port
+                if candidates and host in group_members(group_id):
+                    by_source.update(candidates)
+
+        return [self.rules[position]
+                for position in sorted(by_port & by_source)]
@@ -0,0 +1,87 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+try:
+    from openstack import fields as sdk_fields
+except ImportError:
+    try:
+        # Older openstacksdk releases define fields in the resource module
+        from openstack import resource as sdk_fields
+    except ImportError:
+        sdk_fields = None
+
+
+# Keys never returned by info modules
+ALWAYS_EXCLUDED = frozenset(['location'])
+
+
+def _components():
+    return (sdk_fields.Body, sdk_fields.Header, sdk_fields.Computed)
+
+
+def _attribute_pairs(resource):
+    """Yield `(key, attribute)` of every key `to_dict` would return.
+
+    Only the attribute definitions of the resource class are inspected, no
+    value is read.
+    """
+    if getattr(resource, '_allow_unknown_attrs_in_body', False):
+        for key in getattr(resource, '_unknown_attrs_in_body', {}):
+            yield key, key
+    seen = set()
+    for attr, component in resource._attributes_iterator(_components()):
+        for key in filter(None, (attr, getattr(component, 'aka', None))):
+            if key not in seen:
+                seen.add(key)
+                yield key, attr
+
+
+def to_plain(value):
+    """Convert (nested) SDK resources into plain data."""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return dict((key, to_plain(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+
+def serialize(resource, fields=None, exclude_fields=None):
+    """Return dictionary of the resource limited to the requested keys.
+
+    Unlike `resource.to_dict()` followed by dropping unwanted keys, values
+    of not requested keys (including nested resources) are never converted.
+
+    Arguments:
+        resource -- SDK resource or a dictionary.
+        fields {list} -- Keys to return, all keys when empty.
+        exclude_fields {list} -- Keys not to return.
+
+    Returns:
+        Dictionary in the `to_dict()` format without `location`.
+    """
+    wanted = set(fields) if fields else None
+    excluded = ALWAYS_EXCLUDED.union(exclude_fields or ())
+
+    def selected(key):
+        return key not in excluded and (wanted is None or key in wanted)
+
+    if sdk_fields is not None and hasattr(resource, '_attributes_iterator'):
+        return dict(
+            (key, to_plain(getattr(resource, attr, None)))
+            for key, attr in _attribute_pairs(resource) if selected(key))
+
+    if hasattr(resource, 'to_dict'):
+        resource = resource.to_dict()
+    return dict((key, to_plain(value))
+                for key, value in resource.items() if selected(key))
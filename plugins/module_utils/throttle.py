@@ -0,0 +1,288 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import email.utils
+import functools
+import os
+import random
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+try:
+    from keystoneauth1 import exceptions as ksa_exceptions
+except ImportError:
+    ksa_exceptions = None
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.cache import (
+    file_lock, read_json, write_json
+)
+
+
+# Status codes of throttled or temporarily unavailable APIs
+THROTTLED_STATUS_CODES = frozenset([429, 503])
+
+# Methods safe to repeat after the server may have processed the request,
+# 429 responses are retried for every method since they were rejected
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+# Upper bound of a single delay, also for server provided Retry-After
+MAX_RETRY_DELAY = 60.0
+
+
+def retry_after(response, clock=time.time):
+    """Return seconds requested by the Retry-After header or None.
+
+    Both delta seconds and HTTP date forms are supported.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - clock(), 0.0)
+
+
+class TokenBucket:
+    """Thread safe token bucket limiting a call rate.
+
+    Args:
+        rate: Number of calls per second, `None` or `0` means unlimited.
+        burst: Number of calls allowed at once, defaults to `rate`.
+    """
+
+    def __init__(self, rate, burst=None, clock=time.time, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = burst or max(rate or 0, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._state = {'tokens': self.capacity, 'updated': clock()}
+        self._lock = threading.Lock()
+
+    def _take(self, state):
+        """Refill `state` and try to take a token from it.
+
+        Returns:
+            Seconds to wait before the next attempt, 0 when a token was
+            taken.
+        """
+        now = self._clock()
+        blocked = state.get('blocked_until', 0) - now
+        if blocked > 0:
+            return blocked
+        state['tokens'] = min(
+            self.capacity,
+            state['tokens'] + max(now - state['updated'], 0) * self.rate)
+        state['updated'] = now
+        if state['tokens'] >= 1:
+            state['tokens'] -= 1
+            return 0
+        return (1 - state['tokens']) / self.rate
+
+    def acquire(self):
+        """Block until a call is allowed."""
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                wait = self._take(self._state)
+            if not wait:
+                return
+            self._sleep(wait)
+
+    def block(self, seconds):
+        """Hold back all calls for `seconds` (i.e. after a 429 response)."""
+        with self._lock:
+            self._state['blocked_until'] = self._clock() + seconds
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket with state stored in a file.
+
+    The state is read and updated under a file lock, so all concurrently
+    running module processes (i.e. Ansible forks) using the same file share
+    one call budget.
+
+    Args:
+        path: Path of the json state file.
+    """
+
+    def __init__(self, path, rate, burst=None, clock=time.time,
+                 sleep=time.sleep):
+        super(SharedTokenBucket, self).__init__(
+            rate, burst=burst, clock=clock, sleep=sleep)
+        self.path = path
+
+    def _update(self, func):
+        with self._lock, file_lock(self.path + '.lock'):
+            state = read_json(self.path) or {
+                'tokens': self.capacity, 'updated': self._clock()}
+            result = func(state)
+            write_json(self.path, state)
+        return result
+
+    def acquire(self):
+        """Block until a call is allowed."""
+        if not self.rate:
+            return
+        while True:
+            wait = self._update(self._take)
+            if not wait:
+                return
+            self._sleep(wait)
+
+    def block(self, seconds):
+        """Hold back calls of all processes for `seconds`."""
+        until = self._clock() + seconds
+
+        def set_blocked(state):
+            state['blocked_until'] = max(
+                state.get('blocked_until', 0), until)
+        self._update(set_blocked)
+
+
+class RateLimiter:
+    """Per service collection of token buckets.
+
+    Args:
+        limits: Dictionary of service type to allowed calls per second.
+        state_dir: Directory to share bucket states in between processes,
+            buckets are local to the process when not set.
+    """
+
+    def __init__(self, limits=None, state_dir=None):
+        self.limits = dict(limits or {})
+        self.state_dir = state_dir
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, service):
+        """Return bucket of `service` or None when it is not limited."""
+        rate = self.limits.get(service)
+        if not rate:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                if self.state_dir:
+                    os.makedirs(self.state_dir, mode=0o700, exist_ok=True)
+                    bucket = SharedTokenBucket(
+                        os.path.join(self.state_dir, service + '.json'),
+                        float(rate))
+                else:
+                    bucket = TokenBucket(float(rate))
+                self._buckets[service] = bucket
+        return bucket
+
+    def acquire(self, service):
+        """Block until a call to `service` is allowed."""
+        bucket = self.bucket(service)
+        if bucket is not None:
+            bucket.acquire()
+
+    def block(self, service, seconds):
+        """Hold back calls to `service` for `seconds`."""
+        bucket = self.bucket(service)
+        if bucket is not None:
+            bucket.block(seconds)
+
+
+def request_service(url, kwargs):
+    """Return service type of a keystoneauth session request."""
+    endpoint_filter = kwargs.get('endpoint_filter') or {}
+    service = endpoint_filter.get('service_type')
+    if not service:
+        service = (urlsplit(url).hostname or 'unknown').split('.')[0]
+    return service
+
+
+class Throttle:
+    """Rate limiting and retrying of throttled calls of a session.
+
+    Every request waits for the rate limiter of its service. Responses with
+    429 (and for idempotent methods 503) status are retried with exponential
+    backoff, a Retry-After header of the response takes precedence over the
+    computed delay and holds back calls of all processes sharing the limiter.
+
+    Args:
+        rate_limiter: `RateLimiter` to acquire before each call or None.
+        retries: Maximal number of retries of a single call.
+        delay: Initial backoff delay.
+        max_delay: Upper bound of a single delay.
+        on_retry: Callable invoked as `(method, url, status, delay)`
+            before a retry.
+    """
+
+    def __init__(self, rate_limiter=None, retries=3, delay=1.0,
+                 max_delay=MAX_RETRY_DELAY, on_retry=None, sleep=time.sleep):
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.delay = delay
+        self.max_delay = max_delay
+        self.on_retry = on_retry
+        self._sleep = sleep
+
+    def _should_retry(self, method, status, attempt):
+        if status not in THROTTLED_STATUS_CODES or attempt >= self.retries:
+            return False
+        return status == 429 or method.upper() in IDEMPOTENT_METHODS
+
+    def _backoff(self, attempt):
+        delay = min(self.delay * 2 ** attempt, self.max_delay)
+        return delay + random.uniform(0, delay * 0.2)
+
+    def install(self, session):
+        """Wrap `request` method of the session."""
+        request = session.request
+
+        @functools.wraps(request)
+        def throttled_request(url, method, **kwargs):
+            service = request_service(url, kwargs)
+            attempt = 0
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(service)
+                error = None
+                try:
+                    response = request(url, method, **kwargs)
+                except Exception as e:
+                    if (ksa_exceptions is None
+                            or not isinstance(e, ksa_exceptions.HttpError)):
+                        raise
+                    error, response = e, e.response
+                status = getattr(response, 'status_code', None)
+                if not self._should_retry(method, status, attempt):
+                    if error is not None:
+                        raise error
+                    return response
+
+                requested = retry_after(response)
+                delay = min(
+                    requested if requested is not None
+                    else self._backoff(attempt), self.max_delay)
+                if requested is not None and self.rate_limiter is not None:
+                    self.rate_limiter.block(service, delay)
+                if self.on_retry:
+                    self.on_retry(method, url, status, delay)
+                self._sleep(delay)
+                attempt += 1
+
+        session.request = throttled_request
+        return session
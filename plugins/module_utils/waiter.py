@@ -0,0 +1,186 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+try:
+    from openstack import exceptions as sdk_exceptions
+except ImportError:
+    sdk_exceptions = None
+
+
+DELETED = 'DELETED'
+
+
+def get_status(resource, attribute='status'):
+    """Return upper-cased value of a (dotted) status attribute.
+
+    Arguments:
+        resource -- Resource to read status of, None means deleted.
+        attribute {str} -- Attribute name, i.e. `status`, `status.status`
+            or `lifecycle_state`.
+    """
+    if resource is None:
+        return DELETED
+    value = resource
+    for part in attribute.split('.'):
+        if isinstance(value, dict):
+            value = value.get(part)
+        else:
+            value = getattr(value, part, None)
+        if value is None:
+            return None
+    return str(value).upper()
+
+
+def status_in(*statuses, **kwargs):
+    """Build predicate checking that resource status is one of `statuses`.
+
+    Arguments:
+        statuses {str} -- Expected statuses, case insensitive.
+        attribute {str} -- Status attribute, defaults to `status`.
+    """
+    attribute = kwargs.get('attribute', 'status')
+    expected = set(status.upper() for status in statuses)
+
+    def predicate(resource):
+        return resource is not None and get_status(
+            resource, attribute) in expected
+    return predicate
+
+
+def is_deleted(resource):
+    """Predicate for deletion waits."""
+    return resource is None
+
+
+class Waiter:
+    """Poll resources with exponential backoff until they are ready.
+
+    A single waiter has one deadline for all its `wait` calls, so a
+    multi-step wait of a module never exceeds the requested `timeout`.
+
+    Args:
+        timeout: Overall number of seconds to wait.
+        delay: Initial delay between two polls.
+        max_delay: Upper bound of the delay.
+        factor: Multiplier applied to the delay after each poll without
+            status change.
+        jitter: Fraction of the delay randomized to spread polls of
+            concurrently running tasks.
+        on_transition: Callable invoked as `(item, old, new)` for every
+            observed status change.
+    """
+
+    def __init__(self, timeout, delay=1.0, max_delay=30.0, factor=2.0,
+                 jitter=0.2, on_transition=None, sleep=time.sleep,
+                 clock=time.time):
+        self.timeout = timeout
+        self.delay = delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.on_transition = on_transition
+        self._sleep = sleep
+        self._clock = clock
+        self.deadline = clock() + timeout
+
+    def _timeout(self, message):
+        if sdk_exceptions is not None:
+            return sdk_exceptions.ResourceTimeout(message)
+        return TimeoutError(message)
+
+    def _failure(self, message):
+        if sdk_exceptions is not None:
+            return sdk_exceptions.ResourceFailure(message)
+        return RuntimeError(message)
+
+    def _refresh(self, refresh, item):
+        try:
+            return refresh(item)
+        except Exception as e:
+            if (sdk_exceptions is not None
+                    and isinstance(e, sdk_exceptions.ResourceNotFound)):
+                return None
+            raise
+
+    def wait(self, items, ready, refresh=None, refresh_all=None,
+             failed=None, status=get_status, message=None):
+        """Wait until `ready` is true for every item.
+
+        Arguments:
+            items {list} -- Items to wait for (resources, IDs, etc.).
+            ready {callable} -- Predicate on the refreshed value of an item.
+            refresh {callable} -- Return the current value of a single item,
+                None or `ResourceNotFound` means the resource is gone.
+            refresh_all {callable} -- Alternative to `refresh`, return
+                current values of all passed pending items (in the same
+                order) at once, i.e. out of a single list call.
+            failed {callable} -- Predicate marking item as failed.
+            status {callable} -- Return status of a refreshed value, used
+                to report transitions and to reset the backoff.
+            message {str} -- Timeout/failure message.
+
+        Returns:
+            List of refreshed values in order of `items`.
+
+        Raises:
+            ResourceTimeout when the deadline is reached, ResourceFailure
+            when an item is failed.
+        """
+        message = message or 'Timeout waiting for resources'
+        items = list(items)
+        results = [None] * len(items)
+        statuses = [None] * len(items)
+        pending = list(range(len(items)))
+        delay = self.delay
+
+        while True:
+            if refresh_all is not None:
+                values = list(refresh_all([items[i] for i in pending]))
+            else:
+                values = [self._refresh(refresh, items[i]) for i in pending]
+
+            transition = False
+            still_pending = []
+            for index, value in zip(pending, values):
+                results[index] = value
+                current = status(value)
+                if current != statuses[index]:
+                    if statuses[index] is not None:
+                        transition = True
+                    if self.on_transition:
+                        self.on_transition(
+                            items[index], statuses[index], current)
+                    statuses[index] = current
+                if failed is not None and failed(value):
+                    raise self._failure(
+                        '%s: resource entered failure state %s'
+                        % (message, current))
+                if not ready(value):
+                    still_pending.append(index)
+            pending = still_pending
+            if not pending:
+                return results
+
+            remaining = self.deadline - self._clock()
+            if remaining <= 0:
+                raise self._timeout(message)
+
+            # Fast transitions are picked up quickly, steady states are
+            # polled less and less often
+            delay = self.delay if transition else delay
+            spread = delay * self.jitter
+            pause = delay + random.uniform(-spread, spread)
+            self._sleep(max(min(pause, remaining), 0))
+            delay = min(delay * self.factor, self.max_delay)
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: anti_ddos_fip_statuses_info
 short_description: Get Anti-DDoS statuses info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.2.1"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -83,6 +85,9 @@ class AntiDDoSFIPStatusesInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('anti_ddos',)
+    supports_fields = True
+
     def run(self):
 
         ip_filter = self.params['ip']
@@ -98,9 +103,7 @@ class AntiDDoSFIPStatusesInfoModule(OTCModule):
             query['status'] = status_filter
 
         for raw in self.conn.anti_ddos.floating_ips(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(changed=False, anti_ddos_statuses=data)
 
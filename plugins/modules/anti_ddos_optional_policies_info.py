@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: anti_ddos_optional_policies_info
 short_description: Get Anti-DDoS optional defense policies info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.4.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -123,14 +125,15 @@ class AntiDDoSOptionalPoliciesInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('anti_ddos',)
+    supports_fields = True
+
     def run(self):
 
         data = []
 
         for raw in self.conn.anti_ddos.configs():
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(changed=False, anti_ddos_optional_policies_info=data)
 
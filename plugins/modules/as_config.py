@@ -266,6 +266,8 @@ class ASConfigModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def _parse_disk_metadata(self, metadata):
         m = metadata
         parsed_metadata = {}
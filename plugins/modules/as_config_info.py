@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_config_info
 short_description: Get AutoScaling configs
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -70,6 +72,9 @@ class AutoScalingConfigInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+    supports_fields = True
+
     def run(self):
         name_filter = self.params['name']
         image_id_filter = self.params['image_id']
@@ -82,9 +87,7 @@ class AutoScalingConfigInfoModule(OTCModule):
             if (image_id_filter
                     and raw.instance_config['image_id'] != image_id_filter):
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
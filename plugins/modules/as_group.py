@@ -291,6 +291,9 @@ EXAMPLES = '''
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import (
+    get_status, is_deleted, status_in
+)
 
 
 def is_value_changed(old: list, new: list):
@@ -392,8 +395,10 @@ class ASGroupModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def _is_as_config_find(self, as_config):
-        return self.conn.auto_scaling.find_config(as_config)
+        return self.resolve('auto_scaling.config', as_config)
 
     def _attrs_id_config(self, attrs, as_config):
         config = self._is_as_config_find(as_config)
@@ -418,7 +423,7 @@ class ASGroupModule(OTCModule):
             )
 
     def _attrs_id_router(self, attrs, router):
-        rtr = self.conn.network.find_router(router)
+        rtr = self.resolve('network.router', router)
         if rtr:
             attrs['router_id'] = rtr.id
             return attrs
@@ -433,7 +438,7 @@ class ASGroupModule(OTCModule):
             lb_listeners = []
             lstnr = {}
             for listener in lbaas_listeners:
-                pool = self.conn.network.find_pool(listener['pool_id'])
+                pool = self.resolve('network.pool', listener['pool_id'])
                 if pool:
                     lstnr['pool_id'] = pool.id
                 else:
@@ -458,7 +463,7 @@ class ASGroupModule(OTCModule):
             netwrks = []
             netwrk = {}
             for network in networks:
-                net = self.conn.network.find_network(network['id'])
+                net = self.resolve('network.network', network['id'])
                 if net:
                     netwrk['id'] = net.id
                     netwrks.append(netwrk)
@@ -485,8 +490,8 @@ class ASGroupModule(OTCModule):
             if len(security_groups) == 1:
                 sec_groups = []
                 sec_group = {}
-                security_group = self.conn.network.find_security_group(
-                    name_or_id=security_groups[0]["id"]
+                security_group = self.resolve(
+                    'network.security_group', security_groups[0]["id"]
                 )
                 if security_group:
                     sec_group['id'] = security_group.id
@@ -729,36 +734,60 @@ class ASGroupModule(OTCModule):
 
         return attrs
 
-    def _wait_for_instances(self, as_group, timeout, desire_instance_number=0):
-        for count in self.sdk.utils.iterate_timeout(
-            timeout=timeout,
-            message="Timeout waiting for AS Instances"
-        ):
-            instances = list(self.conn.auto_scaling.instances(
-                group=as_group
-            ))
+    def _wait_for_instances(self, waiter, as_group, desire_instance_number=0):
+        def instances_created(instances):
             instances_with_id = [instance.id for instance in instances
                                  if instance.id]
-            if (len(instances) == len(instances_with_id) == desire_instance_number):
-                for instance in instances:
-                    self.conn.auto_scaling.wait_for_instance(instance=instance)
-                return
+            return (len(instances) == len(instances_with_id)
+                    == desire_instance_number)
+
+        instances = waiter.wait(
+            [as_group],
+            refresh=lambda group: list(self.conn.auto_scaling.instances(
+                group=group)),
+            ready=instances_created,
+            status=len,
+            message="Timeout waiting for AS Instances"
+        )[0]
+
+        def refresh_instances(pending):
+            current = dict(
+                (instance.id, instance) for instance in
+                self.conn.auto_scaling.instances(group=as_group))
+            return [current.get(instance.id) for instance in pending]
+
+        waiter.wait(
+            instances,
+            refresh_all=refresh_instances,
+            ready=status_in('INSERVICE', attribute='lifecycle_state'),
+            failed=status_in('ERROR', attribute='lifecycle_state'),
+            status=lambda instance: get_status(instance, 'lifecycle_state'),
+            message="Timeout waiting for AS Instances"
+        )
+
+    def _wait_for_group(self, waiter, group, status):
+        return waiter.wait(
+            [group],
+            refresh=self.conn.auto_scaling.get_group,
+            ready=status_in(status),
+            failed=status_in('ERROR'),
+            message="Timeout waiting for AS Group"
+        )[0]
 
     def _resume_group(self, group, wait, timeout, desire_instance_number=0):
         result_group = group
         self.conn.auto_scaling.resume_group(group=group)
         if wait:
+            waiter = self.waiter(timeout)
             try:
                 if desire_instance_number > 0:
                     self._wait_for_instances(
+                        waiter=waiter,
                         as_group=group,
-                        timeout=timeout,
                         desire_instance_number=desire_instance_number
                     )
-                result_group = self.conn.auto_scaling.wait_for_group(
-                    group=group,
-                    wait=timeout
-                )
+                result_group = self._wait_for_group(
+                    waiter, group, 'INSERVICE')
             except self.sdk.exceptions.ResourceTimeout:
                 self.fail(
                     msg="Timeout failure waiting for AS Group"
@@ -770,11 +799,8 @@ class ASGroupModule(OTCModule):
         self.conn.auto_scaling.pause_group(group=group)
         if wait:
             try:
-                result_group = self.conn.auto_scaling.wait_for_group(
-                    group=group,
-                    status='PAUSED',
-                    wait=timeout
-                )
+                result_group = self._wait_for_group(
+                    self.waiter(timeout), group, 'PAUSED')
             except self.sdk.exceptions.ResourceTimeout:
                 self.fail(
                     msg="Timeout failure waiting for AS Group"
@@ -894,9 +920,11 @@ class ASGroupModule(OTCModule):
         )
         if wait:
             try:
-                self.conn.auto_scaling.wait_for_delete_group(
-                    group=as_group,
-                    wait=timeout
+                self.waiter(timeout).wait(
+                    [as_group],
+                    refresh=self.conn.auto_scaling.get_group,
+                    ready=is_deleted,
+                    message="Timeout waiting for AS Group to delete"
                 )
             except self.sdk.exceptions.ResourceTimeout:
                 self.fail(
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_group_info
 short_description: Get AutoScaling groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -71,6 +73,9 @@ class AutoScalingGroupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+    supports_fields = True
+
     def run(self):
 
         name_filter = self.params['name']
@@ -84,9 +89,7 @@ class AutoScalingGroupInfoModule(OTCModule):
         if status_filter:
             attrs['scaling_group_status'] = status_filter.upper()
         for raw in self.conn.auto_scaling.groups(**attrs):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -110,6 +110,9 @@ EXAMPLES = '''
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import (
+    get_status, is_deleted, status_in
+)
 
 
 class ASInstanceModule(OTCModule):
@@ -128,6 +131,8 @@ class ASInstanceModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+
     def _system_state_change(self, instances, as_instances, state, action):
         if state == 'present':
             if action is None:
@@ -185,17 +190,27 @@ class ASInstanceModule(OTCModule):
             result.extend(element)
         return result
 
+    def _find_group_instances(self, group, as_instances):
+        return self.parallel(
+            lambda as_instance: self.conn.auto_scaling.find_instance(
+                group=group,
+                name_or_id=as_instance
+            ), as_instances)
+
     def _get_instances_id_for_adding(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_adding(group)
-        for as_instance in as_instances:
-            instance_ecs = self.conn.compute.find_server(
-                name_or_id=as_instance
-            )
-            instance_as_group = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+        found = self.parallel(
+            lambda as_instance: (
+                self.conn.compute.find_server(
+                    name_or_id=as_instance
+                ),
+                self.conn.auto_scaling.find_instance(
+                    group=group,
+                    name_or_id=as_instance
+                )
+            ), as_instances)
+        for instance_ecs, instance_as_group in found:
             if (instance_ecs
                     and instance_ecs.availability_zone in group.availability_zones
                     and not instance_as_group):
@@ -207,11 +222,8 @@ class ASInstanceModule(OTCModule):
     def _get_instances_id_for_removing(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_removing(group)
-        for as_instance in as_instances:
-            instance = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+        found = self._find_group_instances(group, as_instances)
+        for instance in found:
             if instance and self._is_instance_in_inservice_state(instance):
                 instances.append(instance.id)
         if len(instances) <= max_instances:
@@ -221,11 +233,8 @@ class ASInstanceModule(OTCModule):
     def _get_instances_id_for_protection(self, group, as_instances):
         instances = []
         max_instances = self._max_number_of_instances_for_protecting(group)
-        for as_instance in as_instances:
-            instance = self.conn.auto_scaling.find_instance(
-                group=group,
-                name_or_id=as_instance
-            )
+        found = self._find_group_instances(group, as_instances)
+        for instance in found:
             if instance and self._is_instance_in_inservice_state(instance):
                 instances.append(instance.id)
         if len(instances) <= max_instances:
@@ -274,47 +283,43 @@ class ASInstanceModule(OTCModule):
             instance=instance, delete_instance=delete_instance
         )
 
-    def _wait_for_group_inservice_status(self, as_group, timeout, interval=2):
-        return self.conn.auto_scaling.wait_for_group(
-            group=as_group, interval=interval, wait=timeout
-        )
+    def _wait_for_group_inservice_status(self, as_group, timeout):
+        return self.waiter(timeout).wait(
+            [as_group],
+            refresh=self.conn.auto_scaling.get_group,
+            ready=status_in('INSERVICE'),
+            failed=status_in('ERROR'),
+            message="Timeout waiting for group to be in inservice state"
+        )[0]
+
+    def _refresh_instances(self, group):
+        def refresh(pending):
+            current = dict(
+                (instance.id, instance) for instance in
+                self.conn.auto_scaling.instances(group=group))
+            return [current.get(instance_id) for instance_id in pending]
+        return refresh
 
     def _wait_for_instances_inservice_status(
-            self, timeout, interval, group, instances_id
+            self, timeout, group, instances_id
     ):
-        inst_ids = self._join_lists(instances_id)
-        for count in self.sdk.utils.iterate_timeout(
-            timeout=timeout,
-            wait=interval,
+        self.waiter(timeout).wait(
+            self._join_lists(instances_id),
+            refresh_all=self._refresh_instances(group),
+            ready=status_in('INSERVICE', attribute='lifecycle_state'),
+            failed=status_in('ERROR', attribute='lifecycle_state'),
+            status=lambda instance: get_status(instance, 'lifecycle_state'),
             message="Timeout waiting for instance to be in inservice state"
-        ):
-            all_instances = list(self.conn.auto_scaling.instances(group=group))
-            instances = [instance for instance in all_instances
-                         if instance.id in inst_ids]
-            for instance in instances:
-                self.conn.auto_scaling.wait_for_instance(instance)
-            return
-
-    def _wait_for_delete_instances(self, group, instances_id, timeout,
-                                   interval=5):
-        inst_ids = self._join_lists(instances_id)
-        for count in self.sdk.utils.iterate_timeout(
-                timeout=timeout,
-                wait=interval,
-                message="Timeout waiting for instance to be deleted"
-        ):
-            all_instances = list(
-                self.conn.auto_scaling.instances(group=group)
-            )
-            if all_instances:
-                instances = [instance for instance in all_instances
-                             if instance.id in inst_ids]
-                if not instances:
-                    return
-                else:
-                    for instance in instances:
-                        self.conn.auto_scaling.wait_for_delete_instance(instance)
-                    return
+        )
+
+    def _wait_for_delete_instances(self, group, instances_id, timeout):
+        self.waiter(timeout).wait(
+            self._join_lists(instances_id),
+            refresh_all=self._refresh_instances(group),
+            ready=is_deleted,
+            status=lambda instance: get_status(instance, 'lifecycle_state'),
+            message="Timeout waiting for instance to be deleted"
+        )
 
     def run(self):
         as_group = self.params['scaling_group']
@@ -388,7 +393,6 @@ class ASInstanceModule(OTCModule):
                         if wait:
                             self._wait_for_instances_inservice_status(
                                 timeout=timeout,
-                                interval=5,
                                 group=group,
                                 instances_id=instances_id
                             )
@@ -417,7 +421,6 @@ class ASInstanceModule(OTCModule):
                         if wait:
                             self._wait_for_instances_inservice_status(
                                 timeout=timeout,
-                                interval=5,
                                 group=group,
                                 instances_id=instances_id
                             )
@@ -467,7 +470,6 @@ class ASInstanceModule(OTCModule):
                         if wait:
                             self._wait_for_delete_instances(
                                 timeout=timeout,
-                                interval=15,
                                 group=group,
                                 instances_id=instances_id
                             )
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_instance_info
 short_description: Query Instances in an AS Group.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -187,6 +189,9 @@ class ASInstanceInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+    supports_fields = True
+
     def run(self):
         as_group = self.params['scaling_group']
         lifecycle_state = self.params['lifecycle_state']
@@ -229,9 +234,7 @@ class ASInstanceInfoModule(OTCModule):
             )
 
         for raw in self.conn.auto_scaling.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -232,6 +232,7 @@ class ASPolicyModule(OTCModule):
     )
 
     otce_min_version = '0.7.1'
+    otce_services = ('auto_scaling', 'ces')
 
     def _attrs_for_alarm_policy_type(self, changed, attrs, alarm):
         alarm_id = self.conn.ces.find_alarm(name_or_id=alarm)
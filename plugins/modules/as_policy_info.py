@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_policy_info
 short_description: Query AS policies based on search criteria.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.6.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -181,6 +183,9 @@ class ASPolicyInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+    supports_fields = True
+
     def run(self):
         as_group = self.params['scaling_group']
         as_policy = self.params['scaling_policy']
@@ -232,9 +237,7 @@ class ASPolicyInfoModule(OTCModule):
             )
 
         for raw in self.conn.auto_scaling.policies(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
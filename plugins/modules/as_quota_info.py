@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: as_quota_info
 short_description: Get information about auto scaling quotas
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.1"
 author: "Polina Gubina (@Polina-Gubina)"
 description:
@@ -87,6 +89,9 @@ class ASQuotaInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('auto_scaling',)
+    supports_fields = True
+
     def run(self):
         data = []
 
@@ -99,9 +104,7 @@ class ASQuotaInfoModule(OTCModule):
                 self.fail_json(msg="Auto scaling group not found")
 
         for raw in self.conn.auto_scaling.quotas(group=scaling_group_id):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: availability_zone_info
 short_description: Get AZ info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.7.0"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -64,6 +66,10 @@ class AvailabilityZoneInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+    result_cache = 'availability_zone'
+
     def run(self):
         data = []
 
@@ -72,9 +78,7 @@ class AvailabilityZoneInfoModule(OTCModule):
             raw_data = self.conn.compute.availability_zones()
         if raw_data:
             for raw in raw_data:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+---
+module: batch
+short_description: Run a module of the collection for many items at once
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Runs a module of the collection once per item within a single module
+    execution instead of a loop, saving a module transfer, a Python
+    startup and an authentication per item.
+  - All items share the connection and name lookups of the first item,
+    with C(concurrency) items are run by several threads at once.
+  - Results are returned per item like the results of a loop.
+  - This is an action plugin, the module runs on the same host as the
+    batched module would.
+options:
+  module:
+    description:
+      - Name of the module to run, the collection prefix is optional.
+    type: str
+    required: true
+  args:
+    description:
+      - Arguments shared by all items, including authentication and other
+        common arguments.
+      - Other keys given to the task (i.e. C(module_defaults) of the
+        C(opentelekomcloud.cloud.otc) group) are also passed to the module.
+    type: dict
+  items:
+    description:
+      - Arguments of the module runs, each one updates C(args).
+    type: list
+    elements: dict
+    required: true
+  concurrency:
+    description:
+      - Number of items run concurrently.
+    type: int
+    default: 1
+notes:
+  - Modules keep per-run state (memoized lookups, connection) between
+    items, items modifying the same resource should not run concurrently.
+requirements: ["openstacksdk", "otcextensions"]
+'''
+
+RETURN = '''
+results:
+  description: Results of the module runs in the order of C(items).
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"changed": true, "item": {"name": "member-1"}}]
+otc_metrics:
+  description: Summary of the API calls of all items, see C(api_metrics).
+  returned: when api_metrics is enabled
+  type: dict
+'''
+
+EXAMPLES = '''
+# Add 500 members to a pool with a single module execution
+- opentelekomcloud.cloud.batch:
+    module: lb_member
+    args:
+      pool: my-pool
+      subnet: my-subnet
+      protocol_port: 8080
+    items: "{{ backend_members }}"
+    concurrency: 8
+  vars:
+    backend_members: >-
+      [{% for address in backend_addresses %}
+      {"name": "member-{{ loop.index }}", "address": "{{ address }}"},
+      {% endfor %}]
+
+- opentelekomcloud.cloud.batch:
+    module: opentelekomcloud.cloud.dns_recordset
+    args:
+      zone_id: "{{ zone.id }}"
+      recordset_type: A
+    items:
+      - recordset_name: web1.example.com.
+        records: [10.0.0.1]
+      - recordset_name: web2.example.com.
+        records: [10.0.0.2]
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+def main():
+    # Only reached when the action plugin is bypassed
+    module = AnsibleModule(
+        argument_spec=dict(
+            module=dict(type='str', required=True),
+            args=dict(type='dict'),
+            items=dict(type='list', elements='dict', required=True),
+            concurrency=dict(type='int', default=1),
+        ),
+    )
+    module.fail_json(
+        msg='opentelekomcloud.cloud.batch must be run by its action plugin')
+
+
+if __name__ == '__main__':
+    main()
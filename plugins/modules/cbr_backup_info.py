@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cbr_backup_info
 short_description: Get cbr backup resource list
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.4"
 author: "Gubina Polina (@Polina-Gubina)"
 description:
@@ -283,6 +285,9 @@ class CBRBackupsModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cbr',)
+    supports_fields = True
+
     def run(self):
         data = []
         query = {}
@@ -340,9 +345,7 @@ class CBRBackupsModule(OTCModule):
             query['vault_id'] = vault.id
 
         for raw in self.conn.cbr.backups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -190,6 +190,8 @@ class CBRRestorePointModule(OTCModule):
                               )
     )
 
+    otce_services = ('cbr',)
+
     def _parse_resource_details(self):
         resource_details = self.params['resource_details']
         parsed_resource_details = []
@@ -386,6 +386,8 @@ class CBRVaultModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cbr',)
+
     def _parse_resources(self):
         resources = self.params['resources']
         parsed_resources = []
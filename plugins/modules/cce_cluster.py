@@ -127,6 +127,9 @@ EXAMPLES = '''
 
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import (
+    get_status, status_in
+)
 
 
 class CceClusterModule(OTCModule):
@@ -167,6 +170,7 @@ class CceClusterModule(OTCModule):
     )
 
     otce_min_version = '0.11.0'
+    otce_services = ('cce',)
 
     def _system_state_change(self, cluster):
         state = self.params['state']
@@ -211,24 +215,27 @@ class CceClusterModule(OTCModule):
 
             if cluster:
                 # Delete all nodes from cluster
-                nodes = []
-                job_ids = []
-                nodes = self.conn.cce.cluster_nodes(
+                nodes = list(self.conn.cce.cluster_nodes(
                     cluster=cluster.id
-                )
+                ))
                 if nodes:
-                    for node in nodes:
-                        raw = self.conn.cce.delete_cluster_node(
+                    deleted = self.parallel(
+                        lambda node: self.conn.cce.delete_cluster_node(
                             node=node.id,
                             cluster=cluster.id,
                             ignore_missing=True
-                        )
-                        if raw.status.job_id:
-                            job_ids.append(raw.status.job_id)
-                    for id in job_ids:
-                        self.conn.cce.wait_for_job(
-                            job_id=id,
-                            status='success')
+                        ), nodes)
+                    job_ids = [raw.status.job_id for raw in deleted
+                               if raw and raw.status.job_id]
+                    # Jobs are polled together instead of one after another,
+                    # as long as wait_for_job waited by default
+                    self.waiter(3600).wait(
+                        job_ids,
+                        refresh=self.conn.cce.get_job,
+                        ready=status_in('success', attribute='status.status'),
+                        failed=status_in('failed', attribute='status.status'),
+                        status=lambda job: get_status(job, 'status.status'),
+                        message="Timeout waiting for cluster nodes to delete")
                 # Delete cluster
                 attrs = {
                     'cluster': cluster.id
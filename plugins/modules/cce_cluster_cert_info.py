@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cce_cluster_cert_info
 short_description: Get Certificates of a CCE cluster
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -66,15 +68,17 @@ class CceClusterCertInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cce',)
+    supports_fields = True
+
     def run(self):
         cluster = self.params['cluster']
 
         cluster = self.conn.cce.find_cluster(cluster, ignore_missing=False)
 
-        certs = self.conn.cce.get_cluster_certificates(cluster).to_dict()
-        certs.pop('location')
-        certs.pop('id')
-        certs.pop('name')
+        certs = self.serialize(
+            self.conn.cce.get_cluster_certificates(cluster),
+            exclude=('id', 'name'))
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: cce_cluster_info
 short_description: Get information about CCE clusters
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -78,6 +80,9 @@ class CceClusterInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('cce',)
+    supports_fields = True
+
     def run(self):
 
         name_filter = self.params['name']
@@ -89,11 +94,7 @@ class CceClusterInfoModule(OTCModule):
                 continue
             if status_filter and raw.status != status_filter.lower():
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('api_version')
-            dt.pop('kind')
-            data.append(dt)
+            data.append(self.serialize(raw, exclude=('api_version', 'kind')))
 
         self.exit_json(
             changed=False,
@@ -365,6 +365,8 @@ class CceClusterNodeModule(OTCModule):
 
     otce_min__version = '0.12.1'
 
+    otce_services = ('cce', 'deh')
+
     def run(self):
         self.params['wait_timeout'] = self.params['timeout']
         cce_cluster = self.params['cluster']
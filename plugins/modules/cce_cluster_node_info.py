@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cce_cluster_node_info
 short_description: Get CCE node info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.4.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -138,6 +140,9 @@ class CCEClusterNodeInfoModule(OTCModule):
 
     otce_min__version = '0.12.1'
 
+    otce_services = ('cce',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -159,9 +164,7 @@ class CCEClusterNodeInfoModule(OTCModule):
                 cluster=cluster,
                 node=self.params['name'])
             if node:
-                node = node.to_dict()
-                node.pop('location')
-                data.append(node)
+                data.append(self.serialize(node))
             else:
                 self.exit(
                     changed=False,
@@ -169,9 +172,7 @@ class CCEClusterNodeInfoModule(OTCModule):
                 )
         else:
             for raw in self.conn.cce.cluster_nodes(cluster=cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -364,6 +364,7 @@ class CceNodePoolModule(OTCModule):
     )
 
     otce_min_version = '0.13.0'
+    otce_services = ('cce',)
 
     def run(self):
         cce_cluster = self.params['cluster']
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: cce_node_pool_info
 short_description: Get CCE node pool info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -170,6 +172,8 @@ class CCENodePoolInfoModule(OTCModule):
     )
 
     otce_min_version = '0.13.0'
+    otce_services = ('cce',)
+    supports_fields = True
 
     def run(self):
 
@@ -192,9 +196,7 @@ class CCENodePoolInfoModule(OTCModule):
                 cluster=cluster,
                 pool=self.params['name'])
             if pool:
-                pool = pool.to_dict()
-                pool.pop('location')
-                data.append(pool)
+                data.append(self.serialize(pool))
             else:
                 self.exit(
                     changed=False,
@@ -202,9 +204,7 @@ class CCENodePoolInfoModule(OTCModule):
                 )
         else:
             for raw in self.conn.cce.node_pools(cluster=cluster):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
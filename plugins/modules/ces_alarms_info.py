@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_alarms_info
 short_description: Get Alarms
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -93,6 +95,9 @@ class CesAlarmsInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -105,9 +110,7 @@ class CesAlarmsInfoModule(OTCModule):
             )
 
         for raw in self.conn.ces.alarms():
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
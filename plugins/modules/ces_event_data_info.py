@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_event_data_info
 short_description: Get Event Data
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -108,6 +110,9 @@ class CesEventDataInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -124,9 +129,7 @@ class CesEventDataInfoModule(OTCModule):
                 query['dim.2'] = self.params['dim2']
 
         for raw in self.conn.ces.event_data(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_metrics_info
 short_description: Get Metrics
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -122,6 +124,9 @@ class CesMetricsInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -136,9 +141,7 @@ class CesMetricsInfoModule(OTCModule):
         query['order'] = self.params['order']
 
         for raw in self.conn.ces.metrics(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: ces_quotas_info
 short_description: Get ressource Quotas
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.3.0"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -60,15 +62,16 @@ class CesQuotasInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('ces',)
+    supports_fields = True
+
     def run(self):
 
         data = []
         query = {}
 
         for raw in self.conn.ces.quotas(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
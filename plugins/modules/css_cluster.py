@@ -283,6 +283,8 @@ class CssClusterModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('css',)
+
     def _system_state_change(self, cluster):
         state = self.params['state']
         if state == 'present':
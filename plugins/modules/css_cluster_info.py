@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: css_cluster_info
 short_description: Get info about CSS clusters.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -195,6 +197,8 @@ class CSSClusterInfoModule(OTCModule):
     )
 
     otce_min_version = '0.24.1'
+    otce_services = ('css',)
+    supports_fields = True
 
     def run(self):
 
@@ -211,14 +215,10 @@ class CSSClusterInfoModule(OTCModule):
                 name_or_id=self.params['name'],
                 ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
         else:
             for raw in self.conn.css.clusters(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -97,6 +97,8 @@ class CssSnapshotModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('css',)
+
     def run(self):
         attrs = {}
         name = self.params['name']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: css_snapshot_info
 short_description: Get CSS snapshot info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Vladimir Vshivkov (@enrrou)"
 description:
@@ -116,6 +118,9 @@ class CssSnapshotInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('css',)
+    supports_fields = True
+
     def run(self):
         data = []
         cluster_name = self.params['cluster']
@@ -131,9 +136,7 @@ class CssSnapshotInfoModule(OTCModule):
         if cluster:
             snapshots = self.conn.css.snapshots(cluster['id'])
             for snapshot in snapshots:
-                dt = snapshot.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(snapshot))
 
         self.exit_json(
             changed=False,
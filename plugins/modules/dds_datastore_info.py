@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_datastore_info
 short_description: Obtain database version information about a specified type of a DB instance.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -57,16 +59,15 @@ class DDSDatastoreInfo(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dds',)
+    supports_fields = True
+
     def run(self):
         datastore_name = self.params['datastore_name']
 
         data = []
         for raw in self.conn.dds.datastores(datastore_name):
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('id')
-            dt.pop('name')
-            data.append(dt)
+            data.append(self.serialize(raw, exclude=('id', 'name')))
 
         self.exit(
             changed=False,
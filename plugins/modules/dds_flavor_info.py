@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_flavor_info
 short_description: Obtain flavor type information about a specified region and DB type.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -79,15 +81,16 @@ class DDSFlavorInfo(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dds',)
+    supports_fields = True
+
     def run(self):
         region = self.params['region']
         engine_name = self.params['engine_name']
 
         data = []
         for raw in self.conn.dds.flavors(region=region, engine_name=engine_name):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -199,6 +199,7 @@ class DdsInstanceModule(OTCModule):
     )
 
     otce_min_version = '0.11.0'
+    otce_services = ('dds',)
 
     def _system_state_change(self, obj):
         state = self.params['state']
@@ -8,7 +8,9 @@
 DOCUMENTATION = '''
 module: dds_instance_info
 short_description: Obtain information about a specified DB instance.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.9.0"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -267,6 +269,9 @@ class DDSInstanceInfo(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dds',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -279,7 +284,7 @@ class DDSInstanceInfo(OTCModule):
         subnet_id = self.params['subnet_id']
 
         if instance:
-            db_instance = self.conn.dds.find_instance(name_or_id=instance)
+            db_instance = self.resolve('dds.instance', instance)
             if db_instance:
                 query['id'] = db_instance.id
                 query['name'] = db_instance.name
@@ -290,19 +295,17 @@ class DDSInstanceInfo(OTCModule):
             query['datastore_type'] = datastore_type
 
         if vpc_id:
-            vpc = self.conn.network.find_router(name_or_id=vpc_id)
+            vpc = self.resolve('network.router', vpc_id)
             if vpc:
                 query['vpc_id'] = vpc.id
 
         if subnet_id:
-            subnet = self.conn.network.find_subnet(name_or_id=subnet_id)
+            subnet = self.resolve('network.subnet', subnet_id)
             if subnet:
                 query['subnet_id'] = subnet.id
 
         for raw in self.conn.dds.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -147,6 +147,8 @@ class DehHostModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_host_info
 short_description: Get Dedicated host info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -250,6 +252,9 @@ class DehHostInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -289,9 +294,7 @@ class DehHostInfoModule(OTCModule):
             query['tags'] = self.params['tags']
 
         for raw in self.conn.deh.hosts(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
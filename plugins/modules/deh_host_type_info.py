@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_host_type_info
 short_description: Get info about all available host types in a AZ
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -92,6 +94,10 @@ class DehHostTypeInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+    supports_fields = True
+    result_cache = 'deh_host_type'
+
     def run(self):
 
         data = []
@@ -101,9 +107,7 @@ class DehHostTypeInfoModule(OTCModule):
             query['az'] = self.params['az']
 
         for raw in self.conn.deh.host_types(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
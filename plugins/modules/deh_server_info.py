@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: deh_server_info
 short_description: Get info about ECSs on a Dedicated host
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -126,6 +128,9 @@ class DehServerInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('deh',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -146,9 +151,7 @@ class DehServerInfoModule(OTCModule):
                 )
 
         for raw in self.conn.deh.servers(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
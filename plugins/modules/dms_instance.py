@@ -205,6 +205,8 @@ class DmsInstanceModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
         attrs = {}
         instance = self.conn.dms.find_instance(name_or_id=self.params['name'], ignore_missing=True)
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_instance_info
 short_description: Get info about DMS instances
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -128,6 +130,9 @@ class DmsInstanceInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -147,9 +152,7 @@ class DmsInstanceInfoModule(OTCModule):
             query['exactMatchName'] = self.params['exactMatchName']
 
         for raw in self.conn.dms.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
         self.exit(
             changed=False,
             dms_instances=data
@@ -131,6 +131,8 @@ class DmsInstanceTopic(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+
     def run(self):
         attrs = {}
         instance = self.conn.dms.find_instance(name_or_id=self.params['instance'], ignore_missing=True)
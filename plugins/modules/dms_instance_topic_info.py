@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_instance_topic_info
 short_description: Get info about DMS instance topics
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -98,6 +100,9 @@ class DmsInstanceTopicInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -105,9 +110,7 @@ class DmsInstanceTopicInfoModule(OTCModule):
 
         if instance:
             for raw in self.conn.dms.topics(instance):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
             self.exit(
                 changed=False,
                 dms_instances=data
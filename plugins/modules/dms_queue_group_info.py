@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_queue_group_info
 short_description: Get info about DMS queue groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -72,6 +74,9 @@ class DmsQueueInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -84,9 +89,7 @@ class DmsQueueInfoModule(OTCModule):
             query['include_deadletter'] = self.params['include_deadletter']
         if queue:
             for raw in self.conn.dms.groups(queue.id, **query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
             self.exit(
                 changed=False,
                 dms_queues=data
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dms_queue_info
 short_description: Get info about DMS queues
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -65,6 +67,9 @@ class DmsQueueInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dms',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -74,9 +79,7 @@ class DmsQueueInfoModule(OTCModule):
                 name_or_id=self.params['queue']
             )
             if queue:
-                dt = queue.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(queue))
             else:
                 self.exit(
                     changed=False,
@@ -86,9 +89,7 @@ class DmsQueueInfoModule(OTCModule):
                 )
         else:
             for raw in self.conn.dms.queues():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_nameserver_info
 short_description: Get info about DNS nameservers.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.2"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -67,6 +69,9 @@ class DNSNameserverInfoModule(OTCModule):
         supports_check_mode=True,
     )
 
+    otce_services = ('dns',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -80,11 +85,7 @@ class DNSNameserverInfoModule(OTCModule):
                 self.fail_json(msg="Zone not found")
 
         for raw in self.conn.dns.nameservers(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('name')
-            dt.pop('id')
-            data.append(dt)
+            data.append(self.serialize(raw, exclude=('name', 'id')))
 
         self.exit(
             changed=False,
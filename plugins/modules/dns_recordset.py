@@ -133,6 +133,8 @@ class DNSRecordsetModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dns',)
+
     def run(self):
         changed = False
 
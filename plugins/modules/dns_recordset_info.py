@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: dns_recordset_info
 short_description: Get info about DNS recordsets.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.1"
 author: "Yustina Kvrivishvili (@YustinaKvr)"
 description:
@@ -110,6 +112,9 @@ class DNSRecordsetInfoModule(OTCModule):
         required_if=[('name', not None, ['zone'])]
     )
 
+    otce_services = ('dns',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -130,9 +135,7 @@ class DNSRecordsetInfoModule(OTCModule):
 
                     recordset = self.conn.dns.find_recordset(
                         ignore_missing=False, **query)
-                    dt = recordset.to_dict()
-                    dt.pop('location')
-                    data.append(dt)
+                    data.append(self.serialize(recordset))
 
                     self.exit(
                         changed=False,
@@ -150,9 +153,7 @@ class DNSRecordsetInfoModule(OTCModule):
             query['type'] = self.params['type'].upper()
 
         for raw in self.conn.dns.recordsets(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -131,6 +131,8 @@ class DNSZonesModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('dns',)
+
     def run(self):
         changed = False
         attrs = {}
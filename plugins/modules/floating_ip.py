@@ -188,6 +188,8 @@ class FloatingIpModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: kms_info
 short_description: Get info about KMS keys.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.12.5"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -103,6 +105,8 @@ class KMSInfoModule(OTCModule):
     )
 
     otce_min_version = '0.26.0'
+    otce_services = ('kms',)
+    supports_fields = True
 
     def run(self):
 
@@ -116,22 +120,16 @@ class KMSInfoModule(OTCModule):
             if UUID_PATTERN.match(self.params['name']):
                 raw = self.conn.kms.get_key(self.params['name'])
                 if raw:
-                    dt = raw.to_dict()
-                    dt.pop('location')
-                    data.append(dt)
+                    data.append(self.serialize(raw))
             else:
                 raw = self.conn.kms.find_key(
                     alias=self.params['name'],
                     ignore_missing=True)
                 if raw:
-                    dt = raw.to_dict()
-                    dt.pop('location')
-                    data.append(dt)
+                    data.append(self.serialize(raw))
         else:
             for raw in self.conn.kms.keys(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
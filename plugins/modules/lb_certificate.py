@@ -131,6 +131,7 @@ class LoadBalancerCertificateModule(OTCModule):
     )
 
     otce_min_version = '0.10.1'
+    otce_services = ('elb',)
 
     @staticmethod
     def _is_path(path):
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_certificate_info
 short_description: Get elb certificate info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -86,6 +88,8 @@ class LoadBalancerCertificateInfoModule(OTCModule):
     )
 
     otce_min_version = '0.10.0'
+    otce_services = ('elb',)
+    supports_fields = True
 
     def run(self):
         data = []
@@ -93,14 +97,10 @@ class LoadBalancerCertificateInfoModule(OTCModule):
         if self.params['name']:
             raw = self.conn.elb.find_certificate(name_or_id=self.params['name'], ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
         else:
             for raw in self.conn.elb.certificates():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
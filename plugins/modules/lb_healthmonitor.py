@@ -185,6 +185,8 @@ class LoadBalancerHealthmonitorModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         delay_filter = self.params['delay']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_healthmonitor_info
 short_description: Get health checks info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -162,6 +164,9 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         name_filter = self.params['name']
         delay_filter = self.params['delay']
@@ -199,14 +204,10 @@ class LoadBalancerHealthMonitorInfoModule(OTCModule):
 
         if name_filter:
             raw = self.conn.network.find_health_monitor(name_or_id=name_filter)
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
         else:
             for raw in self.conn.network.health_monitors(**args):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -206,6 +206,8 @@ class LoadBalancerListenerModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         description_filter = self.params['description']
@@ -246,7 +248,7 @@ class LoadBalancerListenerModule(OTCModule):
                         attrs['tls_ciphers_policy'] = tls_ciphers_policy_filter
                 attrs['protocol'] = protocol_filter.upper()
             if lb_filter:
-                lb = self.conn.network.find_load_balancer(name_or_id=lb_filter)
+                lb = self.resolve('network.load_balancer', lb_filter)
                 if lb:
                     attrs['loadbalancer_id'] = lb.id
             if protocol_port_filter:
@@ -258,7 +260,7 @@ class LoadBalancerListenerModule(OTCModule):
             if admin_state_up_filter:
                 attrs['admin_state_up'] = admin_state_up_filter
             if default_pool_filter:
-                pool = self.conn.network.find_pool(name_or_id=default_pool_filter)
+                pool = self.resolve('network.pool', default_pool_filter)
                 if pool:
                     attrs['default_pool_id'] = pool.id
 
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_listener_info
 short_description: Get listener info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -91,19 +93,18 @@ class LoadBalancerListenerInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         data = []
 
         if self.params['name']:
             raw = self.conn.network.find_listener(name_or_id=self.params['name'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
         else:
             for raw in self.conn.network.listeners():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -131,6 +131,8 @@ class LoadBalancerMemberModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def run(self):
         name_filter = self.params['name']
         address_filter = self.params['address']
@@ -145,7 +147,7 @@ class LoadBalancerMemberModule(OTCModule):
         attrs = {}
         changed = False
         if pool_filter:
-            lb_pool = self.conn.network.find_pool(name_or_id=pool_filter)
+            lb_pool = self.resolve('network.pool', pool_filter)
         if lb_pool:
             lb_member = self.conn.network.find_pool_member(pool=lb_pool, name_or_id=self.params['name'])
 
@@ -161,7 +163,7 @@ class LoadBalancerMemberModule(OTCModule):
             if protocol_port_filter:
                 attrs['protocol_port'] = protocol_port_filter
             if subnet_filter:
-                subnet = self.conn.network.find_subnet(name_or_id=subnet_filter)
+                subnet = self.resolve('network.subnet', subnet_filter)
                 attrs['subnet_id'] = subnet.id
 
             if lb_member and lb_pool:
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: lb_member_info
 short_description: Get backend server group member info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -119,6 +121,9 @@ class LoadBalancerMemberInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         name_filter = self.params['name']
         project_id_filter = self.params['project_id']
@@ -151,14 +156,10 @@ class LoadBalancerMemberInfoModule(OTCModule):
         pool = self.conn.network.find_pool(name_or_id=self.params['pool'])
         if self.params['name']:
             raw = self.conn.network.find_pool_member(pool=pool, name_or_id=name_filter)
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
         else:
             for raw in self.conn.network.pool_members(pool=pool, **args):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -164,6 +164,8 @@ class LoadBalancerPoolModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def _dict_hash(self, dictionary: Dict[str, Any]) -> str:
         """MD5 hash of a dictionary."""
 
@@ -197,11 +199,11 @@ class LoadBalancerPoolModule(OTCModule):
             if protocol_filter:
                 attrs['protocol'] = protocol_filter.upper()
             if listener_filter:
-                lstnr = self.conn.network.find_listener(name_or_id=listener_filter)
+                lstnr = self.resolve('network.listener', listener_filter)
                 if lstnr:
                     attrs['listener_id'] = lstnr.id
             if loadbalancer_filter:
-                lb = self.conn.network.find_load_balancer(name_or_id=loadbalancer_filter)
+                lb = self.resolve('network.load_balancer', loadbalancer_filter)
                 if lb:
                     attrs['loadbalancer_id'] = lb.id
             if admin_state_up_filter:
@@ -183,6 +183,8 @@ class LoadBalancerModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def _wait_for_lb(self, lb, status, failures, interval=5):
         """Wait for load balancer to be in a particular provisioning status."""
         timeout = self.params['timeout']
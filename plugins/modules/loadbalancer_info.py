@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: loadbalancer_info
 short_description: Get load balancer info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -109,12 +111,18 @@ class LoadBalancerInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         if self.params['name']:
             lb = self.conn.network.find_load_balancer(
                 name_or_id=self.params['name'])
+            if lb:
+                lb = self.serialize(lb)
         else:
-            lb = list(self.conn.network.load_balancers())
+            lb = [self.serialize(raw)
+                  for raw in self.conn.network.load_balancers()]
 
         self.exit_json(
             changed=False,
@@ -163,6 +163,8 @@ class NatDnatModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def run(self):
         changed = False
 
@@ -198,10 +200,8 @@ class NatDnatModule(OTCModule):
             if self.params['admin_state_up']:
                 attrs['admin_state_up'] = self.params['admin_state_up']
             if self.params['floating_ip']:
-                fip = self.conn.network.find_ip(
-                    name_or_id=self.params['floating_ip'],
-                    ignore_missing=True
-                )
+                fip = self.resolve(
+                    'network.ip', self.params['floating_ip'])
                 if fip:
                     attrs['floating_ip_id'] = fip.id
                 else:
@@ -238,10 +238,8 @@ class NatDnatModule(OTCModule):
             if self.params['project_id']:
                 attrs['project_id'] = self.params['project_id']
             if self.params['nat_gateway']:
-                gw = self.conn.nat.find_gateway(
-                    name_or_id=self.params['nat_gateway'],
-                    ignore_missing=True
-                )
+                gw = self.resolve(
+                    'nat.gateway', self.params['nat_gateway'])
                 if gw:
                     attrs['nat_gateway_id'] = gw.id
                 else:
@@ -266,10 +264,8 @@ class NatDnatModule(OTCModule):
                         message=('Either specify port OR private_ip')
                     )
                 else:
-                    p = self.conn.network.find_port(
-                        name_or_id=self.params['port'],
-                        ignore_missing=True
-                    )
+                    p = self.resolve(
+                        'network.port', self.params['port'])
                     if not p:
                         self.exit(
                             changed=False,
@@ -14,7 +14,9 @@ DOCUMENTATION = '''
 ---
 module: nat_dnat_rule_info
 short_description: Get DNAT rule details
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -171,6 +173,9 @@ class DNATRuleInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+    supports_fields = True
+
     def run(self):
         data = []
         query = {}
@@ -246,9 +251,7 @@ class DNATRuleInfoModule(OTCModule):
             query['status'] = self.params['status']
 
         for raw in self.conn.nat.dnat_rules(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
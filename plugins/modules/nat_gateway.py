@@ -139,6 +139,8 @@ class NATGatewayModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat', 'identity')
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
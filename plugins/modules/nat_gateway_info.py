@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: nat_gateway_info
 short_description: Get NAT gateways
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -150,6 +152,9 @@ class NATGatewayInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -188,9 +193,7 @@ class NATGatewayInfoModule(OTCModule):
             query['status'] = self.params['status']
 
         for raw in self.conn.nat.gateways(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
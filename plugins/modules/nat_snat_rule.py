@@ -156,6 +156,8 @@ class NatSnatModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -183,10 +185,8 @@ class NatSnatModule(OTCModule):
         if self.params['cidr']:
             attrs['cidr'] = self.params['cidr']
         if self.params['network']:
-            nw = self.conn.network.find_network(
-                self.params['network'],
-                ignore_missing=True
-            )
+            nw = self.resolve(
+                'network.network', self.params['network'])
             if not nw:
                 self.exit(
                     changed=False,
@@ -196,10 +196,8 @@ class NatSnatModule(OTCModule):
                 )
             attrs['network_id'] = nw.id
         if self.params['floating_ip']:
-            ip = self.conn.network.find_ip(
-                self.params['floating_ip'],
-                ignore_missing=True
-            )
+            ip = self.resolve(
+                'network.ip', self.params['floating_ip'])
             if not ip:
                 self.exit(
                     changed=False,
@@ -238,9 +236,8 @@ class NatSnatModule(OTCModule):
         # SNAT rule creation
         elif self.params['state'] == 'present':
 
-            gateway = self.conn.nat.find_gateway(
-                name_or_id=self.params['nat_gateway'],
-                ignore_missing=True)
+            gateway = self.resolve(
+                'nat.gateway', self.params['nat_gateway'])
             if not gateway:
                 self.exit(
                     changed=False,
@@ -14,7 +14,9 @@ DOCUMENTATION = '''
 ---
 module: nat_snat_rule_info
 short_description: Get SNAT rule details
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Sebastian Gode (@SebastianGode)"
 description:
@@ -154,6 +156,9 @@ class SNATRuleInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('nat',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -224,9 +229,7 @@ class SNATRuleInfoModule(OTCModule):
             query['status'] = self.params['status']
 
         for raw in self.conn.nat.snat_rules(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: object_info
 short_description: Get Swift info.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.8.0"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -161,6 +163,9 @@ class SwiftInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         container = self.params['container']
         object_name = self.params['object_name']
@@ -172,16 +177,12 @@ class SwiftInfoModule(OTCModule):
         if container:
             objects = []
             for raw in self.conn.object_store.objects(container):
-                dt = raw.to_dict()
-                dt.pop('location')
-                objects.append(dt)
+                objects.append(self.serialize(raw))
             self.exit(changed=False, swift=dict(objects=objects))
 
         containers = []
         for raw in self.conn.object_store.containers():
-            dt = raw.to_dict()
-            dt.pop('location')
-            containers.append(dt)
+            containers.append(self.serialize(raw))
         self.exit(changed=False, swift=dict(containers=containers))
 
 
@@ -163,6 +163,9 @@ EXAMPLES = '''
 
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import (
+    status_in
+)
 
 
 class RdsBackupModule(OTCModule):
@@ -182,6 +185,7 @@ class RdsBackupModule(OTCModule):
     )
 
     otce_min_version = '0.7.1'
+    otce_services = ('rds',)
 
     def _system_state_change(self, obj):
         state = self.params['state']
@@ -192,19 +196,21 @@ class RdsBackupModule(OTCModule):
             return True
         return False
 
-    def _wait_for_delete(self, backup, instance, interval, wait):
+    def _wait_for_delete(self, backup, instance, wait):
         """Wait for backup to be deleted"""
-        orig_backup = backup
-        for count in self.sdk.utils.iterate_timeout(
-                timeout=wait,
-                message="Timeout waiting for backup to delete",
-                wait=interval):
-            backup = self.conn.rds.find_backup(name_or_id=backup.name,
-                                               instance=instance)
-            if backup.status.lower() == 'deleting':
-                return orig_backup
-            if backup is None:
-                return backup
+        def refresh(backup):
+            return self.conn.rds.find_backup(name_or_id=backup.name,
+                                             instance=instance)
+
+        # Backup disappears from the listing some time after entering
+        # deleting state, that is good enough for us
+        self.waiter(wait).wait(
+            [backup],
+            refresh=refresh,
+            ready=lambda backup: backup is None or status_in('deleting')(backup),
+            message="Timeout waiting for backup to delete"
+        )
+        return backup
 
     def run(self):
         name = self.params['name']
@@ -236,8 +242,14 @@ class RdsBackupModule(OTCModule):
 
                     if self.params['wait']:
                         try:
-                            backup = self.conn.rds.wait_for_backup(backup,
-                                                                   wait=timeout)
+                            backup = self.waiter(timeout).wait(
+                                [backup],
+                                refresh=lambda backup: self.conn.rds.find_backup(
+                                    name_or_id=backup.id, instance=instance),
+                                ready=status_in('completed'),
+                                failed=status_in('failed'),
+                                message="Timeout waiting for backup to complete"
+                            )[0]
                         except self.sdk.exceptions.ResourceTimeout:
                             self.fail(msg='Timeout failure waiting for backup '
                                           'with name %s to complete' % name)
@@ -263,7 +275,6 @@ class RdsBackupModule(OTCModule):
                             self._wait_for_delete(
                                 backup=backup,
                                 instance=instance,
-                                interval=10,
                                 wait=timeout
                             )
                         except self.sdk.exceptions.ResourceTimeout:
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_backup_info
 short_description: Get RDS Backup info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -133,6 +135,9 @@ class RdsBackupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+    supports_fields = True
+
     def run(self):
 
         instance_filter = self.params['instance']
@@ -155,9 +160,7 @@ class RdsBackupInfoModule(OTCModule):
                       msg='RDS instance is missing')
 
         for raw in self.conn.rds.backups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_datastore_info
 short_description: Get supported RDS datastore versions
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -70,14 +72,15 @@ class RdsDatastoreInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+    supports_fields = True
+
     def run(self):
         datastore = self.params['datastore']
 
         data = []
         for raw in self.conn.rds.datastores(database_name=datastore):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_flavor_info
 short_description: Get RDS flavor info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.1"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -92,6 +94,10 @@ class RdsFlavorModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+    supports_fields = True
+    result_cache = 'rds_flavor'
+
     def run(self):
         datastore = self.params['datastore']
         version = self.params['version']
@@ -104,10 +110,7 @@ class RdsFlavorModule(OTCModule):
                     and raw.instance_mode != instance_mode_filter):
                 # Skip result
                 continue
-            dt = raw.to_dict()
-            dt.pop('location')
-            dt.pop('id')
-            data.append(dt)
+            data.append(self.serialize(raw, exclude=('id',)))
 
         self.exit_json(
             changed=False,
@@ -197,6 +197,7 @@ class RdsInstanceModule(OTCModule):
     )
 
     otce_min_version = '0.11.0'
+    otce_services = ('rds',)
 
     def _system_state_change(self, obj):
         state = self.params['state']
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: rds_instance_info
 short_description: Get RDS Instance info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.2"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -83,6 +85,9 @@ class RdsInstanceInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('rds',)
+    supports_fields = True
+
     def run(self):
 
         data = []
@@ -132,9 +137,7 @@ class RdsInstanceInfoModule(OTCModule):
                     message=('No router with name or id %s found' %
                              self.params['router']))
         for raw in self.conn.rds.instances(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -54,6 +54,9 @@ options:
           User defined portip is often required when a multiple router need
           to be connected to a single subnet for which the default gateway has
           been already used.
+        - Only missing interfaces are attached and internal interfaces not
+          in the list are detached, up to I(parallelism) at once. Subnets
+          and networks are resolved with a single listing each.
      type: list
      elements: raw
 requirements:
@@ -216,12 +219,34 @@ class RouterModule(OTCModule):
         project=dict(default=None)
     )
 
+    otce_services = ('identity',)
+
     def _router_internal_interfaces(self, router):
         for port in self.conn.list_router_interfaces(router, 'internal'):
             if port['device_owner'] in ROUTER_INTERFACE_OWNERS:
                 yield port
 
-    def _needs_update(self, router, network, internal_subnet_ids, internal_port_ids, filters=None):
+    def _index(self, resources):
+        """Return resources by ID and by name."""
+        by_id = {}
+        by_name = {}
+        for resource in resources:
+            by_id[resource['id']] = resource
+            by_name.setdefault(resource['name'], []).append(resource)
+        return by_id, by_name
+
+    def _find(self, index, name_or_id, kind):
+        by_id, by_name = index
+        if name_or_id in by_id:
+            return by_id[name_or_id]
+        matches = by_name.get(name_or_id) or []
+        if len(matches) > 1:
+            self.fail(msg='More than one %s named %s found' % (kind, name_or_id))
+        if not matches:
+            self.fail(msg='%s %s not found' % (kind, name_or_id))
+        return matches[0]
+
+    def _needs_update(self, router, network):
         """Decide if the given router needs an update.
         """
         if router['admin_state_up'] != self.params['admin_state_up']:
@@ -237,54 +262,37 @@ class RouterModule(OTCModule):
             elif router['external_gateway_info']['network_id'] != network['id']:
                 return True
 
-        # OTC does not support external_fixed_ips in the response.
-        # Comment it out for now.
-
-        # check external interfaces
-        # if self.params['external_fixed_ips']:
-        #     for new_iface in self.params['external_fixed_ips']:
-        #         subnet = self.conn.get_subnet(new_iface['subnet'], filters)
-        #         exists = False
-
-        #         # compare the requested interface with existing, looking for an existing match
-        #         for existing_iface in router['external_gateway_info']['external_fixed_ips']:
-        #             if existing_iface['subnet_id'] == subnet['id']:
-        #                 if 'ip' in new_iface:
-        #                     if existing_iface['ip_address'] == new_iface['ip']:
-        #                         # both subnet id and ip address match
-        #                         exists = True
-        #                         break
-        #                 else:
-        #                     # only the subnet was given, so ip doesn't matter
-        #                     exists = True
-        #                     break
-
-        #         # this interface isn't present on the existing router
-        #         if not exists:
-        #             return True
-
-        # check internal interfaces
-        if self.params['interfaces']:
-            existing_subnet_ids = []
-            for port in self._router_internal_interfaces(router):
-                if 'fixed_ips' in port:
-                    for fixed_ip in port['fixed_ips']:
-                        existing_subnet_ids.append(fixed_ip['subnet_id'])
-
-            for iface in self.params['interfaces']:
-                if isinstance(iface, dict):
-                    for p_id in internal_port_ids:
-                        p = self.conn.get_port(name_or_id=p_id)
-                        if 'fixed_ips' in p:
-                            for fip in p['fixed_ips']:
-                                internal_subnet_ids.append(fip['subnet_id'])
-
-            if set(internal_subnet_ids) != set(existing_subnet_ids):
-                return True
-
+        # OTC does not support external_fixed_ips in the response, they are
+        # not compared.
         return False
 
-    def _system_state_change(self, router, network, internal_ids, internal_portids, filters=None):
+    def _interface_changes(self, router, interfaces):
+        """Return interfaces to attach and interface ports to detach.
+
+        Subnet interfaces are present when the router has a port in the
+        subnet, interfaces with `portip` when it has a port with this IP in
+        the subnet. All other internal interfaces are detached.
+        """
+        existing = list(self._router_internal_interfaces(router)) if router else []
+        by_subnet = {}
+        for port in existing:
+            for fixed_ip in port.get('fixed_ips') or []:
+                by_subnet.setdefault(fixed_ip['subnet_id'], []).append(
+                    (fixed_ip['ip_address'], port['id']))
+
+        matched = set()
+        to_attach = []
+        for iface in interfaces:
+            port_ids = [port_id for ip, port_id in by_subnet.get(iface['subnet_id'], [])
+                        if iface['ip'] in (None, ip)]
+            if port_ids:
+                matched.update(port_ids)
+            else:
+                to_attach.append(iface)
+        to_detach = [port for port in existing if port['id'] not in matched]
+        return to_attach, to_detach
+
+    def _system_state_change(self, router, network, to_attach, to_detach):
         """Check if the system state would be changed."""
         state = self.params['state']
         if state == 'absent' and router:
@@ -292,7 +300,7 @@ class RouterModule(OTCModule):
         if state == 'present':
             if not router:
                 return True
-            return self._needs_update(router, network, internal_ids, internal_portids, filters)
+            return bool(self._needs_update(router, network) or to_attach or to_detach)
         return False
 
     def _build_kwargs(self, router, network):
@@ -311,64 +319,72 @@ class RouterModule(OTCModule):
             if self.params.get('enable_snat') is not None:
                 kwargs['enable_snat'] = self.params['enable_snat']
 
-        # if self.params['external_fixed_ips']:
-        #     kwargs['ext_fixed_ips'] = []
-        #     for iface in self.params['external_fixed_ips']:
-        #         subnet = self.conn.get_subnet(iface['subnet'])
-        #         d = {'subnet_id': subnet['id']}
-        #         if 'ip' in iface:
-        #             d['ip_address'] = iface['ip']
-        #         kwargs['ext_fixed_ips'].append(d)
-
         return kwargs
 
-    def _validate_subnets(self, filters=None):
-        external_subnet_ids = []
-        internal_subnet_ids = []
-        internal_port_ids = []
-        existing_port_ips = []
-        # if self.params['external_fixed_ips']:
-        #     for iface in self.params['external_fixed_ips']:
-        #         subnet = self.conn.get_subnet(iface['subnet'])
-        #         if not subnet:
-        #             self.fail_json(msg='subnet %s not found' % iface['subnet'])
-        #         external_subnet_ids.append(subnet['id'])
-
-        if self.params['interfaces']:
-            for iface in self.params['interfaces']:
-                if isinstance(iface, str):
-                    subnet = self.conn.get_subnet(iface, filters)
-                    if not subnet:
-                        self.fail(msg='subnet %s not found' % iface)
-                    internal_subnet_ids.append(subnet['id'])
-                elif isinstance(iface, dict):
-                    subnet = self.conn.get_subnet(iface['subnet'], filters)
-                    if not subnet:
-                        self.fail(msg='subnet %s not found' % iface['subnet'])
-                    net = self.conn.get_network(iface['net'])
-                    if not net:
-                        self.fail(msg='net %s not found' % iface['net'])
-                    if "portip" not in iface:
-                        internal_subnet_ids.append(subnet['id'])
-                    elif not iface['portip']:
-                        self.fail(msg='put an ip in portip or  remove it from list to assign default port to router')
-                    else:
-                        for existing_port in self.conn.list_ports(filters={'network_id': net.id}):
-                            for fixed_ip in existing_port['fixed_ips']:
-                                if iface['portip'] == fixed_ip['ip_address']:
-                                    internal_port_ids.append(existing_port.id)
-                                    existing_port_ips.append(fixed_ip['ip_address'])
-                        if iface['portip'] not in existing_port_ips:
-                            p = self.conn.create_port(network_id=net.id, fixed_ips=[
-                                {
-                                    'ip_address': iface['portip'],
-                                    'subnet_id': subnet.id
-                                }
-                            ])
-                            if p:
-                                internal_port_ids.append(p.id)
-
-        return external_subnet_ids, internal_subnet_ids, internal_port_ids
+    def _validate_subnets(self, project_id=None):
+        """Return internal interfaces as dicts of subnet ID, network ID and IP.
+
+        Subnets and networks are resolved with a single listing each.
+        """
+        interfaces = []
+        if not self.params['interfaces']:
+            return interfaces
+
+        query = {}
+        if project_id:
+            query['project_id'] = project_id
+        subnets = self._index(self.conn.network.subnets(**query))
+        networks = None
+        for iface in self.params['interfaces']:
+            if isinstance(iface, str):
+                subnet = self._find(subnets, iface, 'subnet')
+                interfaces.append(dict(subnet_id=subnet['id'], network_id=subnet['network_id'], ip=None))
+            elif isinstance(iface, dict):
+                subnet = self._find(subnets, iface['subnet'], 'subnet')
+                if networks is None:
+                    networks = self._index(self.conn.network.networks())
+                net = self._find(networks, iface['net'], 'net')
+                if "portip" not in iface:
+                    ip = None
+                elif not iface['portip']:
+                    self.fail(msg='put an ip in portip or  remove it from list to assign default port to router')
+                else:
+                    ip = iface['portip']
+                interfaces.append(dict(subnet_id=subnet['id'], network_id=net['id'], ip=ip))
+        return interfaces
+
+    def _attach_interfaces(self, router, interfaces):
+        """Attach interfaces concurrently, creating missing `portip` ports.
+
+        Ports of every network are listed once.
+        """
+        network_ids = sorted(set(iface['network_id'] for iface in interfaces if iface['ip']))
+        ports = dict(zip(network_ids, self.parallel(
+            lambda network_id: dict(
+                (fixed_ip['ip_address'], port)
+                for port in self.conn.network.ports(network_id=network_id)
+                for fixed_ip in port['fixed_ips']),
+            network_ids)))
+
+        def attach(iface):
+            if not iface['ip']:
+                return self.conn.add_router_interface(router, subnet_id=iface['subnet_id'])
+            port = ports[iface['network_id']].get(iface['ip'])
+            if port is None:
+                port = self.conn.create_port(network_id=iface['network_id'], fixed_ips=[
+                    {
+                        'ip_address': iface['ip'],
+                        'subnet_id': iface['subnet_id']
+                    }
+                ])
+            return self.conn.add_router_interface(router, port_id=port['id'])
+
+        self.parallel(attach, interfaces)
+
+    def _detach_interfaces(self, router, ports):
+        self.parallel(
+            lambda port: self.conn.remove_router_interface(router, port_id=port['id']),
+            ports)
 
     def run(self):
 
@@ -377,9 +393,6 @@ class RouterModule(OTCModule):
         network = self.params['network']
         project = self.params['project']
 
-        # if self.params['external_fixed_ips'] and not network:
-        #     self.fail_json(msg='network is required when supplying external_fixed_ips')
-
         if project is not None:
             proj = self.conn.get_project(project)
             if proj is None:
@@ -397,12 +410,18 @@ class RouterModule(OTCModule):
             if not net:
                 self.fail(msg='network %s not found' % network)
 
-        # Validate and cache the subnet IDs so we can avoid duplicate checks
-        # and expensive API calls.
-        external_ids, subnet_internal_ids, internal_portids = self._validate_subnets(filters)
+        interfaces = []
+        to_attach = to_detach = []
+        if state == 'present':
+            # Resolve all names at once and compare with the interfaces of
+            # the router, only the differences are changed
+            interfaces = self._validate_subnets(project_id)
+            if self.params['interfaces']:
+                to_attach, to_detach = self._interface_changes(router, interfaces)
+
         if self.ansible.check_mode:
             self.exit_json(
-                changed=self._system_state_change(router, net, subnet_internal_ids, internal_portids, filters)
+                changed=self._system_state_change(router, net, to_attach, to_detach)
             )
 
         if state == 'present':
@@ -413,38 +432,21 @@ class RouterModule(OTCModule):
                 if project_id:
                     kwargs['project_id'] = project_id
                 router = self.conn.create_router(**kwargs)
-                for int_s_id in subnet_internal_ids:
-                    self.conn.add_router_interface(router, subnet_id=int_s_id)
-                # add interface by port id as well
-                for int_p_id in internal_portids:
-                    self.conn.add_router_interface(router, port_id=int_p_id)
+                self._attach_interfaces(router, interfaces)
                 changed = True
             else:
-                if self._needs_update(router, net, subnet_internal_ids, internal_portids, filters):
-                    kwargs = self._build_kwargs(router, net)
-                    updated_router = self.conn.update_router(**kwargs)
-
+                if self._needs_update(router, net):
+                    updated_router = self.conn.update_router(**self._build_kwargs(router, net))
                     # Protect against update_router() not actually
                     # updating the router.
-                    if not updated_router:
-                        changed = False
-
-                    # On a router update, if any internal interfaces were supplied,
-                    # just detach all existing internal interfaces and attach the new.
-                    if internal_portids or subnet_internal_ids:
+                    if updated_router:
                         router = updated_router
-                        ports = self._router_internal_interfaces(router)
-                        for port in ports:
-                            self.conn.remove_router_interface(router, port_id=port['id'])
-                    if internal_portids:
-                        external_ids, subnet_internal_ids, internal_portids = self._validate_subnets(filters)
-                        for int_p_id in internal_portids:
-                            self.conn.add_router_interface(router, port_id=int_p_id)
-                        changed = True
-                    if subnet_internal_ids:
-                        for s_id in subnet_internal_ids:
-                            self.conn.add_router_interface(router, subnet_id=s_id)
                         changed = True
+                if to_attach or to_detach:
+                    # Detach first, a subnet may get another port IP
+                    self._detach_interfaces(router, to_detach)
+                    self._attach_interfaces(router, to_attach)
+                    changed = True
 
             self.exit(changed=changed, router=router, id=router['id'])
 
@@ -454,11 +456,8 @@ class RouterModule(OTCModule):
             else:
                 # We need to detach all internal interfaces on a router before
                 # we will be allowed to delete it.
-                ports = self._router_internal_interfaces(router)
-                router_id = router['id']
-                for port in ports:
-                    self.conn.remove_router_interface(router, port_id=port['id'])
-                self.conn.delete_router(router_id)
+                self._detach_interfaces(router, list(self._router_internal_interfaces(router)))
+                self.conn.delete_router(router['id'])
                 self.exit_json(changed=True)
 
 
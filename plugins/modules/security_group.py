@@ -47,11 +47,22 @@ options:
      elements: dict
      description:
        - list of security group rules
+       - Rules are dictionaries with the keys C(direction) (default
+         C(ingress)), C(ethertype) (default C(IPv4)), C(protocol),
+         C(port_range_min), C(port_range_max), C(remote_ip_prefix),
+         C(remote_group_id), C(remote_address_group_id), C(description) and
+         C(project_id).
+       - Only rules missing in the security group are created. Rules are
+         compared by all keys but the description and the project, protocol
+         numbers and names, the full port range and no range as well as
+         C(0.0.0.0/0) and no prefix are equal.
    exclusive:
      type: bool
      default: false
      description:
        - Deletes existing rules if true
+       - Only rules not in C(security_group_rules) are deleted, after the
+         missing ones were created.
 requirements:
     - "python >= 3.6"
     - "openstacksdk"
@@ -102,6 +113,10 @@ EXAMPLES = '''
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group import (
+    RULE_EXTRA_KEYS, RULE_KEYS, diff_rules, normalize_rule, rule_attrs
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.serializer import to_plain
 
 
 class SecurityGroupModule(OTCModule):
@@ -115,6 +130,9 @@ class SecurityGroupModule(OTCModule):
         exclusive=dict(type='bool', default=False)
     )
 
+    otce_services = ('identity',)
+    invalidates_cache = ('security_group',)
+
     def _needs_update(self, secgroup):
         """Check for differences in the updatable values.
 
@@ -124,6 +142,27 @@ class SecurityGroupModule(OTCModule):
             return True
         return False
 
+    def _check_rules(self, rules):
+        """Fail on rules with unknown keys or invalid values."""
+        for rule in rules:
+            unknown = set(rule) - set(RULE_KEYS + RULE_EXTRA_KEYS)
+            if unknown:
+                self.fail_json(
+                    msg='Unsupported keys in security group rule %s: %s'
+                        % (rule, ', '.join(sorted(unknown))))
+            try:
+                normalize_rule(rule)
+            except ValueError as e:
+                self.fail_json(
+                    msg='Invalid security group rule %s: %s' % (rule, e))
+
+    def _existing_rules(self, secgroup):
+        rules = secgroup.get('security_group_rules')
+        if rules is None:
+            rules = self.conn.network.security_group_rules(
+                security_group_id=secgroup['id'])
+        return [to_plain(rule) for rule in rules]
+
     def _system_state_change(self, secgroup):
         state = self.params['state']
         if state == 'present':
@@ -159,10 +198,18 @@ class SecurityGroupModule(OTCModule):
             filters = None
 
         secgroup = self.conn.get_security_group(name, filters=filters)
-        sg_rules = None
+        manage_rules = exclusive or security_group_rules is not None
+        security_group_rules = security_group_rules or []
+        self._check_rules(security_group_rules)
 
         if self.ansible.check_mode:
-            self.exit(changed=self._system_state_change(secgroup))
+            changed = self._system_state_change(secgroup)
+            if (state == 'present' and secgroup and manage_rules
+                    and not changed):
+                changed = any(diff_rules(
+                    self._existing_rules(secgroup), security_group_rules,
+                    exclusive))
+            self.exit(changed=changed)
 
         changed = False
         if state == 'present':
@@ -179,26 +226,25 @@ class SecurityGroupModule(OTCModule):
                         secgroup['id'], description=description)
                     changed = True
 
-            if exclusive:
-                # delete security group rules if any exists
-                sg_rules = self.conn.network.security_group_rules(
-                    security_group_id=secgroup.id)
-                if sg_rules:
-                    for rule in sg_rules:
-                        self.conn.network.delete_security_group_rule(
-                            security_group_rule=rule.id)
-
-            if security_group_rules is not None:
-                # create rules
-                for rule in security_group_rules:
-                    self.conn.create_security_group_rule(name, **rule)
-                sg_rules = self.conn.network.security_group_rules(
-                    security_group_id=secgroup.id)
-                # prepare sg rules data
-                for raw in sg_rules:
-                    dt = raw.to_dict()
-                    data.append(dt)
-                changed = True
+            if manage_rules:
+                existing = self._existing_rules(secgroup)
+                to_create, to_delete = diff_rules(
+                    existing, security_group_rules, exclusive)
+                # Create first, the group never lacks rules kept by it
+                created = self.parallel(
+                    lambda rule: self.conn.network.create_security_group_rule(
+                        security_group_id=secgroup['id'],
+                        **rule_attrs(rule)),
+                    to_create)
+                self.parallel(
+                    lambda rule: self.conn.network.delete_security_group_rule(
+                        rule['id']),
+                    to_delete)
+                deleted = set(rule['id'] for rule in to_delete)
+                data = [rule for rule in existing
+                        if rule['id'] not in deleted]
+                data.extend(to_plain(rule) for rule in created)
+                changed = changed or bool(to_create or to_delete)
 
             self.exit(
                 changed=changed, id=secgroup['id'],
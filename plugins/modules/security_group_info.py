@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: security_group_info
 short_description: Lists security groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.1.2"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -32,6 +34,41 @@ options:
     description:
       - Name or id of the security group.
     type: str
+  flow:
+    description:
+      - Return the security groups (and their rules) permitting a flow
+        instead of all security groups, the other options limit the
+        security groups searched.
+      - Rules of all listed security groups are indexed by port range and
+        remote prefix once, no further API calls are needed per group.
+    type: dict
+    suboptions:
+      source:
+        description:
+          - IP address or CIDR of the remote side of the flow (the
+            destination for C(egress)). A CIDR is only permitted by rules
+            covering all its addresses.
+          - Rules with a remote group permit addresses of ports of that
+            group, which costs a single listing of ports.
+        type: str
+        required: true
+      port:
+        description:
+          - Port (or ICMP type) of the flow. When not set, all rules of
+            the protocol match, whatever their port range.
+        type: int
+      protocol:
+        description:
+          - Protocol name or number of the flow, rules for any protocol
+            always match.
+        type: str
+        default: tcp
+      direction:
+        description:
+          - Direction of the flow.
+        type: str
+        choices: [ingress, egress]
+        default: ingress
 requirements: ["openstacksdk", "otcextensions"]
 '''
 
@@ -96,6 +133,32 @@ security_groups:
             description: Update time of the security group
             type: str
             sample: "yyyy-mm-dd hh:mm:ss"
+flow_rules:
+    description: Rules permitting the C(flow) with their security groups.
+    type: complex
+    returned: When C(flow) is set.
+    contains:
+        security_group_id:
+            description: ID of the security group of the rule.
+            type: str
+            sample: "0431c9c5-1660-42e0-8a00-134bec7f03e2"
+        security_group_name:
+            description: Name of the security group of the rule.
+            type: str
+            sample: "my-sg"
+        rule:
+            description: The security group rule.
+            type: dict
+            sample: {
+                "id": "d90e55ba-23bd-4d97-b722-8cb6fb485d69",
+                "direction": "ingress",
+                "protocol": "tcp",
+                "ethertype": "IPv4",
+                "port_range_max": 443,
+                "port_range_min": 443,
+                "remote_group_id": null,
+                "remote_ip_prefix": "10.0.0.0/8"
+            }
 '''
 
 EXAMPLES = '''
@@ -107,21 +170,78 @@ EXAMPLES = '''
 # Get all security groups
 - opentelekomcloud.cloud.security_group_info:
   register: sg
+
+# Which security groups allow SSH from a host
+- opentelekomcloud.cloud.security_group_info:
+    flow:
+      source: 192.168.10.12
+      port: 22
+  register: ssh
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group import RuleIndex
 
 
 class SecurityGroupInfoModule(OTCModule):
     argument_spec = dict(
         description=dict(required=False),
         name=dict(required=False),
-        project_id=dict(required=False)
+        project_id=dict(required=False),
+        flow=dict(type='dict', options=dict(
+            source=dict(required=True),
+            port=dict(type='int'),
+            protocol=dict(default='tcp'),
+            direction=dict(default='ingress', choices=['ingress', 'egress'])
+        ))
     )
     module_kwargs = dict(
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+    result_cache = 'security_group'
+
+    def _group_members(self):
+        """Return function listing addresses of ports per security group.
+
+        Ports are listed on the first call only.
+        """
+        members = {}
+
+        def group_members(group_id):
+            if not members:
+                members[None] = set()
+                for port in self.conn.network.ports():
+                    addresses = set(ip['ip_address']
+                                    for ip in port.fixed_ips or [])
+                    for port_group_id in port.security_group_ids or []:
+                        members.setdefault(port_group_id, set()).update(
+                            addresses)
+            return members.get(group_id, ())
+
+        return group_members
+
+    def _flow_rules(self, groups, flow):
+        names = {}
+        rules = []
+        for group in groups:
+            names[group.id] = group.name
+            for rule in group.security_group_rules or []:
+                rules.append(dict(rule, security_group_id=group.id))
+        try:
+            allowing = RuleIndex(rules).allowing(
+                flow['source'], port=flow['port'], protocol=flow['protocol'],
+                direction=flow['direction'],
+                group_members=self._group_members())
+        except ValueError as e:
+            self.fail_json(msg='Invalid flow or rule: %s' % e)
+        return [dict(security_group_id=rule['security_group_id'],
+                     security_group_name=names[rule['security_group_id']],
+                     rule=rule)
+                for rule in allowing]
+
     def run(self):
 
         data = []
@@ -134,11 +254,13 @@ class SecurityGroupInfoModule(OTCModule):
             if sg:
                 query['id'] = sg.id
             else:
+                extra = dict(flow_rules=[]) if self.params['flow'] else {}
                 self.exit(
                     changed=False,
                     security_groups=[],
                     message=('No security group found with name or id: %s' %
-                             self.params['name'])
+                             self.params['name']),
+                    **extra
                 )
 
         if self.params['description']:
@@ -146,10 +268,19 @@ class SecurityGroupInfoModule(OTCModule):
         if self.params['project_id']:
             query['project_id'] = self.params['project_id']
 
-        for raw in self.conn.network.security_groups(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+        groups = list(self.conn.network.security_groups(**query))
+        if self.params['flow']:
+            flow_rules = self._flow_rules(groups, self.params['flow'])
+            allowing = set(rule['security_group_id'] for rule in flow_rules)
+            self.exit(
+                changed=False,
+                security_groups=[self.serialize(group) for group in groups
+                                 if group.id in allowing],
+                flow_rules=flow_rules
+            )
+
+        for raw in groups:
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
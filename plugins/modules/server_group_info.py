@@ -14,7 +14,9 @@
 DOCUMENTATION = '''
 module: server_group_info
 short_description: Lists server groups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Tino Schreiber (@tischrei)"
 description:
@@ -79,14 +81,15 @@ class ServerGroupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
 
         data = []
 
         for raw in self.conn.compute.server_groups():
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -31,8 +31,8 @@ options:
       - Specifies the subnet name or ID.
       - When creating a new subnet, the value can contain 1 to 64 characters,
         including letters, digits, underscores (_), hyphens (-), and periods (.).
+      - Required unless I(subnets) is set.
     type: str
-    required: true
   description:
     description:
       - Provides supplementary information about the subnet.
@@ -104,6 +104,62 @@ options:
         type: str
         required: true
         choices: ['ntp']
+  subnets:
+    description:
+      - Manage many subnets of the VPC in one task instead of a single one.
+      - Subnets of the VPC are listed once for all items, changes of the
+        items are applied concurrently, up to I(parallelism) at once.
+      - Options not set for an item default to the options of the module.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description: Specifies the subnet name or ID.
+        type: str
+        required: true
+      state:
+        description: Indicate desired state of the subnet, I(state) when not set.
+        choices: ['present', 'absent']
+        type: str
+      description:
+        description: Provides supplementary information about the subnet.
+        type: str
+      cidr:
+        description: Specifies the subnet CIDR block.
+        type: str
+      gateway_ip:
+        description: Specifies the gateway of the subnet.
+        type: str
+      dhcp_enable:
+        description: Specifies whether DHCP is enabled for the subnet.
+        type: bool
+      primary_dns:
+        description: Specifies the IP address of DNS server 1 on the subnet.
+        type: str
+      secondary_dns:
+        description: Specifies the IP address of DNS server 2 on the subnet.
+        type: str
+      dns_list:
+        description: Specifies the DNS server address list of a subnet.
+        type: list
+        elements: str
+        aliases: ['dnsList']
+      availability_zone:
+        description: Specifies the AZ to which the subnet belongs.
+        type: str
+      extra_dhcp_opts:
+        description: Specifies the NTP server address configured for the subnet.
+        type: list
+        elements: dict
+        suboptions:
+          opt_value:
+            description: Specifies the NTP server address configured for the subnet.
+            type: str
+          opt_name:
+            description: Specifies the NTP server address name configured for the subnet.
+            type: str
+            required: true
+            choices: ['ntp']
 requirements: ['openstacksdk', 'otcextensions>=0.24.5']
 '''
 
@@ -138,6 +194,22 @@ EXAMPLES = '''
     name: "test-subnet"
     vpc_id: "{{ vpc.vpc.id }}"
     state: absent
+
+- name: Manage many subnets with a single listing
+  opentelekomcloud.cloud.subnet:
+    vpc: "vpc-test"
+    dns_list:
+      - "100.125.4.25"
+      - "100.125.129.199"
+    subnets:
+      - name: "subnet-a"
+        cidr: "192.168.1.0/24"
+        gateway_ip: "192.168.1.1"
+      - name: "subnet-b"
+        cidr: "192.168.2.0/24"
+        gateway_ip: "192.168.2.1"
+      - name: "subnet-old"
+        state: absent
 '''
 
 RETURN = '''
@@ -201,53 +273,147 @@ subnet:
                     "opt_name": "ntp"
                 }
             ]
+subnets:
+    description: Results of the I(subnets) items in their order.
+    returned: On success when I(subnets) is set
+    type: list
+    elements: dict
+    contains:
+        name:
+            description: Name of the item.
+            type: str
+        state:
+            description: Desired state of the item.
+            type: str
+        changed:
+            description: Whether the subnet was changed.
+            type: bool
+        subnet:
+            description: The subnet, like I(subnet), None when absent.
+            type: dict
 '''
 
-import copy
+import re
+
+try:
+    from otcextensions.sdk.vpc.v1 import subnet as vpc_subnet
+except ImportError:
+    vpc_subnet = None
 
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.cache import cache_key
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
 
+_UUID_RE = re.compile(
+    r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+SUBNET_OPTIONS = dict(
+    description=dict(type='str'),
+    cidr=dict(type='str'),
+    gateway_ip=dict(type='str'),
+    dhcp_enable=dict(type='bool'),
+    primary_dns=dict(type='str'),
+    secondary_dns=dict(type='str'),
+    dns_list=dict(type='list', elements='str', aliases=['dnsList']),
+    availability_zone=dict(type='str'),
+    extra_dhcp_opts=dict(type='list', elements='dict', options=dict(
+        opt_value=dict(type='str'),
+        opt_name=dict(type='str', required=True, choices=['ntp'])
+    ))
+)
+
 
 class SubnetModule(OTCModule):
     argument_spec = dict(
         state=dict(default='present', choices=['absent', 'present']),
-        name=dict(type='str', required=True),
+        name=dict(type='str'),
         vpc=dict(type='str', required=True, aliases=['vpc_id']),
-        description=dict(type='str'),
-        cidr=dict(type='str'),
-        gateway_ip=dict(type='str'),
-        dhcp_enable=dict(type='bool'),
-        primary_dns=dict(type='str'),
-        secondary_dns=dict(type='str'),
-        dns_list=dict(type='list', elements='str', aliases=['dnsList']),
-        availability_zone=dict(type='str'),
-        extra_dhcp_opts=dict(type='list', elements='dict', options=dict(
-            opt_value=dict(type='str'),
-            opt_name=dict(type='str', required=True, choices=['ntp'])
-        ))
+        subnets=dict(type='list', elements='dict', options=dict(
+            name=dict(type='str', required=True),
+            state=dict(choices=['absent', 'present']),
+            **SUBNET_OPTIONS
+        )),
+        **SUBNET_OPTIONS
     )
 
     module_kwargs = dict(
-        supports_check_mode=True
+        supports_check_mode=True,
+        required_one_of=[('name', 'subnets')],
+        mutually_exclusive=[('name', 'subnets')],
     )
 
     _update_fields = {'dns_list', 'primary_dns', 'secondary_dns', 'extra_dhcp_opts'}
     _update_forbidden = {'cidr', 'gateway_ip'}
 
+    otce_services = ('vpc',)
+    invalidates_cache = ('subnet',)
+
     def run(self):
-        vpc = self.conn.vpc.find_vpc(self.params['vpc'])
-        self.params['vpc'] = vpc.id
-        subnet = self.find_vpc_subnet()
+        vpc = self.resolve('vpc.vpc', self.params['vpc'], ignore_missing=False)
+
+        if self.params['subnets'] is None:
+            item = dict((field, self.params[field])
+                        for field in ['name', 'state'] + list(SUBNET_OPTIONS))
+            subnet, data, has_changes = self._plan(vpc, item)
+            if self.ansible.check_mode:
+                self.exit(changed=has_changes, subnet=subnet)
+            subnet = self._apply(vpc, item, subnet, data, has_changes)
+            if item['state'] == 'absent':
+                self.exit(changed=has_changes)
+            self.exit(changed=has_changes, subnet=subnet)
 
-        data = copy.deepcopy(self.params)
-        data['vpc_id'] = data.pop('vpc')
-        state = data.pop('state')
+        items = []
+        for subnet in self.params['subnets']:
+            item = dict(subnet)
+            for field in ['state'] + list(SUBNET_OPTIONS):
+                if item.get(field) is None:
+                    item[field] = self.params[field]
+            items.append(item)
+        names = [item['name'] for item in items]
+        duplicates = sorted(set(name for name in names if names.count(name) > 1))
+        if duplicates:
+            self.fail(msg='Subnets are given more than once: %s' % ', '.join(duplicates))
 
-        has_changes = self._changed(subnet, data)
+        # Plans are made one after the other from one listing, only the
+        # changes run concurrently
+        self._subnet_index(vpc.id)
+        plans = [self._plan(vpc, item) for item in items]
         if self.ansible.check_mode:
-            self.exit(changed=has_changes, subnet=subnet)
+            subnets = [subnet for subnet, _data, _has_changes in plans]
+        else:
+            subnets = self.parallel(
+                lambda entry: self._apply(vpc, entry[0], *entry[1]),
+                list(zip(items, plans)))
+        self.exit(
+            changed=any(has_changes for _subnet, _data, has_changes in plans),
+            subnets=[
+                dict(name=item['name'], state=item['state'], changed=plan[2],
+                     subnet=subnet if item['state'] == 'present' else None)
+                for item, plan, subnet in zip(items, plans, subnets)])
+
+    def _plan(self, vpc, item):
+        """Return the subnet of an item, the data to apply and if it changes."""
+        subnet = self.find_vpc_subnet(item['name'], vpc.id)
+        data = dict((field, item[field]) for field in SUBNET_OPTIONS)
+        data['name'] = item['name']
+        data['vpc_id'] = vpc.id
+        present = item['state'] == 'present'
 
-        if state == 'present':
+        has_changes = self._changed(subnet, data, present)
+        if present and subnet is not None and has_changes:
+            err_fields = {}
+            for field in self._update_forbidden:
+                val = data.get(field, None)
+                if val is not None:
+                    err_fields[field] = val
+            if err_fields:
+                self.fail(
+                    msg=f'updating subnet fields {err_fields} is not '
+                        f'supported (subnet: {subnet})')
+        return subnet, data, has_changes
+
+    def _apply(self, vpc, item, subnet, data, has_changes):
+        """Apply the plan of an item, return the resulting subnet."""
+        if item['state'] == 'present':
             if subnet is None:
                 self.sdk.resource.wait_for_status(
                     self.conn.vpc,
@@ -255,16 +421,8 @@ class SubnetModule(OTCModule):
                     None, 1, 5
                 )
                 subnet = self.conn.vpc.create_subnet(**data)
+                self._index_subnet(vpc.id, subnet)
             elif has_changes:
-                err_fields = {}
-                for field in self._update_forbidden:
-                    val = data.get(field, None)
-                    if val is not None:
-                        err_fields[field] = val
-                if err_fields:
-                    self.fail(
-                        f'updating subnet fields {err_fields} is not '
-                        f'supported (subnet: {subnet})')
                 update_data = {}
                 for field in self._update_fields:
                     if data[field] is not None:
@@ -274,24 +432,21 @@ class SubnetModule(OTCModule):
                     name=subnet.name,
                     **update_data,
                 )
-            subnet = self.sdk.resource.wait_for_status(
+            return self.sdk.resource.wait_for_status(
                 self.conn.vpc,
                 subnet, 'ACTIVE',
                 None, 2, 20
             )
-            self.exit(changed=has_changes, subnet=subnet)
-        elif state == 'absent':
-            if subnet:
-                self.conn.vpc.delete_subnet(subnet, ignore_missing=True)
-                self.sdk.resource.wait_for_delete(self.conn.vpc, subnet, 2, 60)
-            self.exit(changed=has_changes)
-
-    def _changed(self, state, expected):
-        expected_removed = self.params['state'] == 'absent'
-        actual_missing = state is None
-        if expected_removed:
-            return not actual_missing
-        elif actual_missing:
+        if subnet:
+            self.conn.vpc.delete_subnet(subnet, ignore_missing=True)
+            self.sdk.resource.wait_for_delete(self.conn.vpc, subnet, 2, 60)
+            self._index_subnet(vpc.id, subnet, remove=True)
+        return None
+
+    def _changed(self, state, expected, present=True):
+        if not present:
+            return state is not None
+        elif state is None:
             return True
 
         if _total_dns_list(state) != _total_dns_list(expected):
@@ -313,28 +468,63 @@ class SubnetModule(OTCModule):
                 return True
         return False
 
-    def find_vpc_subnet(self):
-        name = self.params['name']
-        vpc_id = self.params['vpc']
-
-        try:
-            # first, try to find subnet by ID
-            return self.conn.vpc.get_subnet(name)
-        except (self.sdk.exceptions.ResourceNotFound,
-                # in case id is not a UUID (e.g. us subnet name):
-                self.sdk.exceptions.BadRequestException):
-            subnets = self.conn.vpc.subnets(vpc_id=vpc_id)
-            subnets = [s for s in subnets if s.name == name and s.vpc_id == vpc_id]
-            if len(subnets) == 0:
-                return None
-            if len(subnets) > 1:
-                self.fail(
-                    msg=(
-                        f'More than one subnet with name {name} is found '
-                        f'in vpc {vpc_id}. Please use ID instead.'
-                    )
+    def _subnet_index(self, vpc_id):
+        """Return subnets of the VPC by ID and by name.
+
+        The VPC is listed once per module run (and batch), the index is
+        kept up to date with subnets created and deleted by the module.
+        """
+        key = cache_key('vpc.subnets', vpc_id)
+        if key not in self._resolved:
+            index = dict(ids={}, names={})
+            for subnet in self.conn.vpc.subnets(vpc_id=vpc_id):
+                if subnet.vpc_id == vpc_id:
+                    index['ids'][subnet.id] = subnet
+                    index['names'].setdefault(subnet.name, []).append(subnet)
+            self._resolved[key] = index
+        return self._resolved[key]
+
+    def _index_subnet(self, vpc_id, subnet, remove=False):
+        index = self._resolved.get(cache_key('vpc.subnets', vpc_id))
+        if index is None:
+            return
+        index['ids'].pop(subnet.id, None)
+        names = [s for s in index['names'].get(subnet.name, []) if s.id != subnet.id]
+        if not remove:
+            index['ids'][subnet.id] = subnet
+            names.append(subnet)
+        index['names'][subnet.name] = names
+
+    def find_vpc_subnet(self, name, vpc_id):
+        indexed = cache_key('vpc.subnets', vpc_id) in self._resolved
+        if _UUID_RE.match(name) and not indexed:
+            try:
+                # first, try to find subnet by ID
+                return self.conn.vpc.get_subnet(name)
+            except (self.sdk.exceptions.ResourceNotFound,
+                    self.sdk.exceptions.BadRequestException):
+                pass
+
+        if (not indexed and vpc_subnet is not None
+                and 'name' in vpc_subnet.Subnet._query_mapping._mapping):
+            # Name filtering by the API, where the SDK supports it
+            subnets = list(self.conn.vpc.subnets(vpc_id=vpc_id, name=name))
+        else:
+            index = self._subnet_index(vpc_id)
+            if name in index['ids']:
+                return index['ids'][name]
+            subnets = index['names'].get(name, [])
+        subnets = [s for s in subnets if s.name == name and s.vpc_id == vpc_id]
+        if len(subnets) == 0:
+            return None
+        if len(subnets) > 1:
+            self.fail(
+                msg=(
+                    f'More than one subnet with name {name} is found '
+                    f'in vpc {vpc_id}. Please use ID instead.'
                 )
-            return subnets[0]
+            )
+        return subnets[0]
 
 
 def _total_dns_list(obj: dict) -> set:
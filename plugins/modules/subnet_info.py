@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: subnet_info
 short_description: Get subnet info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.11.1"
 author: "Polina Gubina(@polina-gubina)"
 description:
@@ -112,23 +114,23 @@ class SubnetInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+    supports_fields = True
+    result_cache = 'subnet'
+
     def run(self):
         data = []
 
         if self.params['name_or_id']:
             raw = self.conn.vpc.find_subnet(name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
         else:
             query = {}
             if self.params['vpc']:
                 vpc = self.conn.vpc.find_vpc(name_or_id=self.params['vpc'])
                 query['vpc_id'] = vpc.id
             for raw in self.conn.vpc.subnets(**query):
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -158,6 +158,8 @@ class TagModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     @staticmethod
     def _get_tags_url(url_prefix, instance):
         """Construct direct REST query URL for tags"""
@@ -178,7 +180,7 @@ class TagModule(OTCModule):
             }
         )
 
-    def fetch_tags(self, url_prefix, microver, instance):
+    def fetch_tags(self, endpoint, url_prefix, microver, instance):
         """Get current tags"""
         result = None
         try:
@@ -197,7 +199,7 @@ class TagModule(OTCModule):
 
         return result
 
-    def replace_tags(self, url_prefix, microver, instance, tags):
+    def replace_tags(self, endpoint, url_prefix, microver, instance, tags):
         """Replace all tags at once"""
         result = None
         try:
@@ -216,37 +218,39 @@ class TagModule(OTCModule):
                     msg='API returned something bad %s' % response.reason)
         return result
 
-    def set_tags(self, url_prefix, microver, instance, tags):
+    def set_tags(self, endpoint, url_prefix, microver, instance, tags):
         """Set tag on a server one by one"""
-        try:
-            for tag in tags:
+        def add_tag(tag):
+            if hasattr(instance, 'add_tag'):
                 instance.add_tag(self.conn, tag)
-        except AttributeError:
+                return
             # Try a low-level access if SDK version is old
-            for tag in tags:
-                response = self.conn.put(
-                    self._get_tag_url(url_prefix, instance, tag),
-                    microversion=microver)
-                if response.status_code not in [201, 204]:
-                    self.fail_json(
-                        msg='API returned something bad %s' % response.reason)
-        return self.fetch_tags(url_prefix, microver, instance)
+            response = self.conn.put(
+                self._get_tag_url(url_prefix, instance, tag),
+                microversion=microver)
+            if response.status_code not in [201, 204]:
+                raise self.sdk.exceptions.SDKException(
+                    'API returned something bad %s' % response.reason)
+
+        self.parallel(add_tag, tags)
+        return self.fetch_tags(endpoint, url_prefix, microver, instance)
 
-    def delete_tags(self, url_prefix, microver, instance, tags):
+    def delete_tags(self, endpoint, url_prefix, microver, instance, tags):
         """Set tag on a resource one by one"""
-        try:
-            for tag in tags:
+        def remove_tag(tag):
+            if hasattr(instance, 'remove_tag'):
                 instance.remove_tag(self.conn, tag)
-        except AttributeError:
+                return
             # Try a low-level access if SDK version is old
-            for tag in tags:
-                response = self.conn.delete(
-                    self._get_tag_url(url_prefix, instance, tag),
-                    microversion=microver)
-                if response.status_code not in [204, 404]:
-                    self.fail_json(
-                        msg='API returned something bad %s' % response.reason)
-        return self.fetch_tags(url_prefix, microver, instance)
+            response = self.conn.delete(
+                self._get_tag_url(url_prefix, instance, tag),
+                microversion=microver)
+            if response.status_code not in [204, 404]:
+                raise self.sdk.exceptions.SDKException(
+                    'API returned something bad %s' % response.reason)
+
+        self.parallel(remove_tag, tags)
+        return self.fetch_tags(endpoint, url_prefix, microver, instance)
 
     def run(self):
         server = self.params['server']
@@ -316,7 +320,7 @@ class TagModule(OTCModule):
 
         if instance:
             current_tags = self.fetch_tags(
-                self, endpoint, url_prefix, microver, instance)
+                endpoint, url_prefix, microver, instance)
             if state == 'present':
                 if mode == 'replace' and set(current_tags) != set(new_tags):
                     # Any of the tags mismatch
@@ -338,16 +342,17 @@ class TagModule(OTCModule):
             if state == 'present':
                 if mode == 'replace':
                     tags = self.replace_tags(
-                        self, endpoint, url_prefix, microver,
+                        endpoint, url_prefix, microver,
                         instance, new_tags)
                 elif mode == 'set':
+                    # Only missing tags cost an API call
                     tags = self.set_tags(
-                        self, endpoint, url_prefix, microver,
-                        instance, new_tags)
+                        endpoint, url_prefix, microver, instance,
+                        [x for x in new_tags if x not in current_tags])
             elif state == 'absent':
                 tags = self.delete_tags(
-                    self, endpoint, url_prefix, microver,
-                    instance, new_tags)
+                    endpoint, url_prefix, microver, instance,
+                    [x for x in new_tags if x in current_tags])
 
             self.exit_json(
                 changed=changed,
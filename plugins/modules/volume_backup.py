@@ -106,6 +106,9 @@ EXAMPLES = '''
 '''
 
 from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.waiter import (
+    is_deleted, status_in
+)
 
 
 class VolumeBackupModule(OTCModule):
@@ -129,6 +132,8 @@ class VolumeBackupModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+
     def _system_state_change(self, obj):
         state = self.params['state']
         if state == 'present':
@@ -256,10 +261,13 @@ class VolumeBackupModule(OTCModule):
                     )
                 else:
                     try:
-                        backup = self.conn.block_storage.wait_for_status(
-                            backup,
-                            status='available',
-                            wait=timeout)
+                        backup = self.waiter(timeout).wait(
+                            [backup],
+                            refresh=self.conn.block_storage.get_backup,
+                            ready=status_in('available'),
+                            failed=status_in('error'),
+                            message='Timeout waiting for backup to complete'
+                        )[0]
                         self.exit_json(
                             changed=True,
                             volume_backup=backup.to_dict(),
@@ -288,10 +296,12 @@ class VolumeBackupModule(OTCModule):
                 self.conn.block_storage.delete_backup(backup)
                 if self.params['wait']:
                     try:
-                        self.conn.block_storage.wait_for_delete(
-                            backup,
-                            interval=2,
-                            wait=timeout)
+                        self.waiter(timeout).wait(
+                            [backup],
+                            refresh=self.conn.block_storage.get_backup,
+                            ready=is_deleted,
+                            message='Timeout waiting for backup to delete'
+                        )
                     except self.sdk.exceptions.ResourceTimeout:
                         self.fail_json(
                             msg='Timeout failure waiting for backup '
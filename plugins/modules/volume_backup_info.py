@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: volume_backup_info
 short_description: Get Backups
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Vladimir Hasko (@vladimirhasko)"
 description:
@@ -69,6 +71,9 @@ class VolumeBackupInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         name_filter = self.params['name']
         volume = self.params['volume']
@@ -82,9 +87,7 @@ class VolumeBackupInfoModule(OTCModule):
             attrs['volume_id'] = self.conn.block_storage.find_volume(volume)
 
         for raw in self.conn.block_storage.backups(**attrs):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: volume_snapshot_info
 short_description: Get information about volume snapshots
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -105,6 +107,9 @@ class VolumeSnapshotInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
 
         details_filter = self.params['details']
@@ -124,9 +129,7 @@ class VolumeSnapshotInfoModule(OTCModule):
             query['status'] = status_filter.lower()
 
         for raw in self.conn.block_storage.snapshots(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
@@ -148,6 +148,9 @@ class VpcModule(OTCModule):
         enable_shared_snat=dict(type='bool', required=False)
     )
 
+    otce_services = ('vpc',)
+    invalidates_cache = ('vpc', 'subnet')
+
     def run(self):
 
         query = {}
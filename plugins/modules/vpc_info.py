@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_info
 short_description: Get vpc info from OpenTelekomCloud
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.11.1"
 author: "Polina Gubina(@polina-gubina)"
 description:
@@ -81,19 +83,19 @@ class VpcInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+    supports_fields = True
+    result_cache = 'vpc'
+
     def run(self):
         data = []
 
         if self.params['name_or_id']:
             raw = self.conn.vpc.find_vpc(name_or_id=self.params['name_or_id'])
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
         else:
             for raw in self.conn.vpc.vpcs():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
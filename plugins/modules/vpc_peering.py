@@ -157,6 +157,8 @@ class VPCPeeringModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def _is_peering_exist(self, local_router_id, peer_router_id):
 
         for peering in self.conn.vpc.peerings():
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_peering_info
 short_description: Get information about vpc peerings
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.4"
 author: "Polina Gubina (@polina-gubina)"
 description:
@@ -105,6 +107,9 @@ class VPCPeeringInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+    supports_fields = True
+
     def run(self):
 
         name_filter = self.params['name']
@@ -125,9 +130,7 @@ class VPCPeeringInfoModule(OTCModule):
             query['vpc_id'] = router_obj['id']
 
         for raw in self.conn.vpc.peerings(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
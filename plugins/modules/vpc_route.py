@@ -117,6 +117,8 @@ class VPCRouteModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+
     def _is_route_exist(self, destination, router_id):
 
         query = {}
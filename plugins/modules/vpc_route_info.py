@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpc_route_info
 short_description: Get information about vpc routes info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.2.0"
 author: "Polina Gubina (@polina-gubina)"
 description:
@@ -100,6 +102,9 @@ class VPCRouteInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ('vpc',)
+    supports_fields = True
+
     def run(self):
 
         id_filter = self.params['id']
@@ -124,9 +129,7 @@ class VPCRouteInfoModule(OTCModule):
             query['type'] = type_filter
 
         for raw in self.conn.vpc.routes(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit_json(
             changed=False,
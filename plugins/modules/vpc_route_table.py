@@ -0,0 +1,237 @@
+#!/usr/bin/python
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+DOCUMENTATION = '''
+---
+module: vpc_route_table
+short_description: Manage all VPC routes of a router at once
+extends_documentation_fragment: opentelekomcloud.cloud.otc
+version_added: "0.13.0"
+author: "Open Telekom Cloud Ecosystem Squad"
+description:
+  - Make the VPC routes of a router match a desired route set.
+  - Existing routes are listed once, only missing routes are added and
+    routes with another next hop are replaced. Changes are applied
+    concurrently, up to I(parallelism) at once.
+  - Routes can not be updated, a changed route is deleted before it is
+    added again.
+options:
+  router:
+    description: ID or name of the router (VPC) owning the routes.
+    type: str
+    required: true
+  routes:
+    description:
+      - Desired routes of the router, destinations must be unique.
+    type: list
+    elements: dict
+    default: []
+    suboptions:
+      destination:
+        description: Route destination address (CIDR).
+        type: str
+        required: true
+      nexthop:
+        description:
+          - The next hop. If type is peering, it is the VPC peering
+            connection name or id.
+        type: str
+        required: true
+      type:
+        description: Type of the route.
+        type: str
+        default: peering
+  purge:
+    description:
+      - Delete routes of the router with destinations not in I(routes).
+    type: bool
+    default: false
+requirements: ["openstacksdk", "otcextensions"]
+'''
+
+RETURN = '''
+vpc_routes:
+  description: Routes of the router after the changes.
+  type: list
+  elements: dict
+  returned: On Success.
+  sample: [
+    {
+      "id": "4dae5bac-0925-4d5b-add8-cb6667b8",
+      "destination": "192.168.200.0/24",
+      "nexthop": "7375f1cd-6fe1-4d47-8888-c5c5a64298d8",
+      "type": "peering",
+      "router_id": "4dae5bac-0725-2d5b-add8-cb6667b8"
+    }
+  ]
+added:
+  description: Routes added (or to be added in check mode).
+  type: list
+  elements: dict
+  returned: On Success.
+  sample: [
+    {
+      "destination": "192.168.200.0/24",
+      "nexthop": "7375f1cd-6fe1-4d47-8888-c5c5a64298d8",
+      "type": "peering"
+    }
+  ]
+removed:
+  description: Routes deleted (or to be deleted in check mode).
+  type: list
+  elements: dict
+  returned: On Success.
+'''
+
+EXAMPLES = '''
+# Routes of a peering mesh member, other routes are kept
+- opentelekomcloud.cloud.vpc_route_table:
+    router: "vpc-a"
+    routes:
+      - destination: "192.168.1.0/24"
+        nexthop: "peering-a-b"
+      - destination: "192.168.2.0/24"
+        nexthop: "peering-a-c"
+
+# Exactly these routes, all others are deleted
+- opentelekomcloud.cloud.vpc_route_table:
+    router: "vpc-a"
+    purge: true
+    routes: "{{ mesh_routes['vpc-a'] }}"
+'''
+
+import ipaddress
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import OTCModule
+
+
+class VPCRouteTableModule(OTCModule):
+    argument_spec = dict(
+        router=dict(type='str', required=True),
+        routes=dict(type='list', elements='dict', default=[], options=dict(
+            destination=dict(type='str', required=True),
+            nexthop=dict(type='str', required=True),
+            type=dict(type='str', default='peering'),
+        )),
+        purge=dict(type='bool', default=False),
+    )
+    module_kwargs = dict(
+        supports_check_mode=True
+    )
+
+    otce_services = ('vpc',)
+
+    def _destination(self, destination):
+        try:
+            return str(ipaddress.ip_network(destination, strict=False))
+        except ValueError as e:
+            self.fail_json(msg='Invalid route destination %s: %s'
+                           % (destination, e))
+
+    def _peerings(self):
+        """Return peering connections by ID and by name."""
+        by_id = {}
+        by_name = {}
+        for peering in self.conn.vpc.peerings():
+            by_id[peering.id] = peering
+            by_name.setdefault(peering.name, []).append(peering)
+        return by_id, by_name
+
+    def _desired_routes(self):
+        """Return desired routes by destination with resolved next hops.
+
+        Peering connections are listed once for all routes.
+        """
+        peerings = None
+        desired = {}
+        for route in self.params['routes']:
+            destination = self._destination(route['destination'])
+            if destination in desired:
+                self.fail_json(msg='Route destination %s is given more than '
+                                   'once' % destination)
+            nexthop = route['nexthop']
+            if route['type'] == 'peering':
+                if peerings is None:
+                    peerings = self._peerings()
+                by_id, by_name = peerings
+                if nexthop not in by_id:
+                    matches = by_name.get(nexthop) or []
+                    if len(matches) != 1:
+                        self.fail_json(
+                            msg="vpc peering connection ('nexthop') %s %s"
+                                % (nexthop, 'is ambiguous' if matches
+                                   else 'not found'))
+                    nexthop = matches[0].id
+            desired[destination] = dict(
+                destination=destination, nexthop=nexthop, type=route['type'])
+        return desired
+
+    def run(self):
+        router = self.resolve('network.router', self.params['router'])
+        if not router:
+            self.fail_json(msg='Router %s not found' % self.params['router'])
+
+        desired = self._desired_routes()
+        existing = list(self.conn.vpc.routes(router_id=router.id))
+
+        to_delete = []
+        kept = []
+        present = set()
+        for route in existing:
+            destination = self._destination(route.destination)
+            wanted = desired.get(destination)
+            if wanted is None:
+                (to_delete if self.params['purge'] else kept).append(route)
+            elif (wanted['nexthop'], wanted['type']) != (route.nexthop, route.type):
+                # Routes can not be updated, replace it
+                to_delete.append(route)
+            else:
+                present.add(destination)
+                kept.append(route)
+        to_add = [route for destination, route in desired.items()
+                  if destination not in present]
+
+        removed = [dict(id=route.id, destination=route.destination,
+                        nexthop=route.nexthop, type=route.type)
+                   for route in to_delete]
+        changed = bool(to_add or to_delete)
+        if self.ansible.check_mode:
+            # Planned routes have no ID yet
+            self.exit_json(
+                changed=changed, added=to_add, removed=removed,
+                vpc_routes=[self.serialize(route) for route in kept]
+                + [dict(route, router_id=router.id) for route in to_add])
+
+        # Replaced routes must be gone before they are added again
+        self.parallel(
+            lambda route: self.conn.vpc.delete_route(route, ignore_missing=True),
+            to_delete)
+        added = self.parallel(
+            lambda route: self.conn.vpc.add_route(router_id=router.id, **route),
+            to_add)
+
+        self.exit_json(
+            changed=changed,
+            added=to_add,
+            removed=removed,
+            vpc_routes=[self.serialize(route) for route in kept + added]
+        )
+
+
+def main():
+    module = VPCRouteTableModule()
+    module()
+
+
+if __name__ == '__main__':
+    main()
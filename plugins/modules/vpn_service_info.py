@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: vpn_service_info
 short_description: Query VPN services.
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.5.0"
 author: "Irina Pereiaslavskaia (@irina-pereiaslavskaia)"
 description:
@@ -139,6 +141,9 @@ class VpnServicesInfoModule(OTCModule):
         supports_check_mode=True
     )
 
+    otce_services = ()
+    supports_fields = True
+
     def run(self):
         admin_state_up = self.params['admin_state_up']
         description = self.params['description']
@@ -190,9 +195,7 @@ class VpnServicesInfoModule(OTCModule):
             query['status'] = status.upper()
 
         for raw in self.conn.network.vpn_services(**query):
-            dt = raw.to_dict()
-            dt.pop('location')
-            data.append(dt)
+            data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -88,6 +88,7 @@ class WafCertificateModule(OTCModule):
     )
 
     otce_min_version = '0.8.0'
+    otce_services = ('waf',)
 
     @staticmethod
     def _is_path(path):
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: waf_certificate_info
 short_description: Get WAF certificate info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Artem Goncharov (@gtema)"
 description:
@@ -68,6 +70,8 @@ class WafCertificateInfoModule(OTCModule):
     )
 
     otce_min_version = '0.8.0'
+    otce_services = ('waf',)
+    supports_fields = True
 
     def run(self):
 
@@ -77,14 +81,10 @@ class WafCertificateInfoModule(OTCModule):
             raw = self.conn.waf.find_certificate(
                 self.params['name'], ignore_missing=True)
             if raw:
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
         else:
             for raw in self.conn.waf.certificates():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -15,7 +15,9 @@ DOCUMENTATION = '''
 ---
 module: waf_domain_info
 short_description: Get WAF domain info
-extends_documentation_fragment: opentelekomcloud.cloud.otc
+extends_documentation_fragment:
+  - opentelekomcloud.cloud.otc
+  - opentelekomcloud.cloud.otc.info
 version_added: "0.0.3"
 author: "Anton Sidelnikov (@anton-sidelnikov)"
 description:
@@ -88,6 +90,8 @@ class WafDomainInfoModule(OTCModule):
     )
 
     otce_min_version = '0.9.0'
+    otce_services = ('waf',)
+    supports_fields = True
 
     def run(self):
         data = []
@@ -97,14 +101,10 @@ class WafDomainInfoModule(OTCModule):
             if raw:
                 if not raw.server:
                     raw = self.conn.waf.get_domain(raw.id)
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
         else:
             for raw in self.conn.waf.domains():
-                dt = raw.to_dict()
-                dt.pop('location')
-                data.append(dt)
+                data.append(self.serialize(raw))
 
         self.exit(
             changed=False,
@@ -0,0 +1,44 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import (
+    HAS_LIBRARIES, setup_connection
+)
+
+if HAS_LIBRARIES:
+    import openstack as sdk
+
+# Plugin options passed to `setup_connection` as module parameters
+CONNECTION_OPTIONS = (
+    'parallelism', 'api_rate_limits', 'api_retries', 'http_pool_maxsize',
+    'http_keepalive', 'token_cache', 'token_cache_dir',
+)
+
+
+def connect(target, params, otce_services=(), log=None):
+    """Open a connection of a controller side plugin.
+
+    Arguments:
+        target {dict} -- `cloud`, `region` and `project` to connect to,
+            `region` and `project` may be None to use the cloud defaults.
+        params {dict} -- Values of `CONNECTION_OPTIONS`, missing ones are
+            left to their defaults.
+        otce_services {tuple} -- OTC services to register.
+        log {callable} -- Debug logger.
+    """
+    kwargs = dict(cloud=target['cloud'])
+    if target.get('region'):
+        kwargs['region_name'] = target['region']
+    if target.get('project'):
+        kwargs['project_name'] = target['project']
+    conn = sdk.connect(**kwargs)
+    return setup_connection(conn, params, otce_services, log=log)
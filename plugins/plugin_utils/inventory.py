@@ -0,0 +1,181 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+
+from ansible.errors import AnsibleError, AnsibleParserError
+from ansible.plugins.inventory import (
+    BaseInventoryPlugin, Cacheable, Constructable
+)
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.executor import (
+    ParallelError, run_parallel
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.otc import (
+    HAS_LIBRARIES
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.serializer import (
+    serialize
+)
+from ansible_collections.opentelekomcloud.cloud.plugins.plugin_utils.connection import (
+    CONNECTION_OPTIONS, connect
+)
+
+if HAS_LIBRARIES:
+    from openstack.config import loader as sdk_config_loader
+
+
+class OTCInventoryPlugin(BaseInventoryPlugin, Constructable, Cacheable):
+    """Base class of inventory plugins of the collection.
+
+    Handles the options of the `opentelekomcloud.cloud.otc.inventory`
+    fragment: connects to every cloud/region/project target concurrently
+    (with the connection setup of `OTCModule`), caches the fetched host
+    records and adds them to the inventory with their groups.
+
+    Child classes implement `fetch`.
+
+    Args:
+        otce_services: OTC services to register in connections.
+        config_suffixes: Accepted inventory source file name endings.
+    """
+
+    otce_services = ()
+    config_suffixes = ()
+
+    def verify_file(self, path):
+        if super(OTCInventoryPlugin, self).verify_file(path):
+            return path.endswith(self.config_suffixes)
+        return False
+
+    @abc.abstractmethod
+    def fetch(self, conn, target):
+        """Return host records of a single target.
+
+        Arguments:
+            conn -- Connection to the target.
+            target {dict} -- `cloud`, `region` and `project` of the target.
+
+        Returns:
+            List of dictionaries with `name`, `vars` and `groups` keys.
+        """
+
+    def serialize(self, resource, exclude=()):
+        """Return JSON-able dictionary of a resource for host vars."""
+        return serialize(resource, exclude_fields=exclude)
+
+    def parallel(self, func, items):
+        """Call `func` for every item using up to `parallelism` threads."""
+        return run_parallel(
+            func, items, max_workers=max(self.get_option('parallelism'), 1))
+
+    def _targets(self):
+        clouds = self.get_option('clouds')
+        if not clouds:
+            clouds = sdk_config_loader.OpenStackConfig().get_cloud_names()
+        regions = self.get_option('regions') or [None]
+        projects = self.get_option('projects') or [None]
+        return [
+            dict(cloud=cloud, region=region, project=project)
+            for cloud in clouds for region in regions for project in projects
+        ]
+
+    def _connect(self, target):
+        params = dict((name, self.get_option(name))
+                      for name in CONNECTION_OPTIONS)
+        return connect(target, params, self.otce_services,
+                       log=self.display.vvvv)
+
+    def _fetch_target(self, target):
+        conn = self._connect(target)
+        target = dict(target, region=conn.config.get_region_name(),
+                      project=target['project'] or conn.current_project_id)
+        records = self.fetch(conn, target)
+        for record in records:
+            record['vars'].setdefault('otc', {}).update(target)
+            record['groups'] = list(record.get('groups', [])) + [
+                'cloud_%s' % target['cloud'],
+                'region_%s' % target['region'],
+            ]
+        return records
+
+    def _fetch_all(self):
+        targets = self._targets()
+
+        def fetch_target(target):
+            try:
+                return self._fetch_target(target)
+            except Exception as e:
+                if self.get_option('fail_on_errors'):
+                    raise
+                self.display.warning('Skipping %s: %s' % (
+                    '/'.join(filter(None, target.values())), e))
+                return []
+
+        try:
+            results = self.parallel(fetch_target, targets)
+        except ParallelError as e:
+            raise AnsibleError(str(e))
+        return [record for records in results for record in records]
+
+    def _hostname(self, record, seen):
+        name = record['name']
+        if name in seen:
+            # Names are not unique across projects, fall back to the ID
+            name = record['vars'].get('id') or name
+        seen.add(name)
+        return name
+
+    def _populate(self, records):
+        strict = self.get_option('strict')
+        seen = set()
+        for record in records:
+            host = self._hostname(record, seen)
+            self.inventory.add_host(host)
+            for key, value in record['vars'].items():
+                self.inventory.set_variable(host, key, value)
+            for group in record.get('groups', []):
+                group = self._sanitize_group_name(group)
+                self.inventory.add_group(group)
+                self.inventory.add_child(group, host)
+
+            hostvars = self.inventory.get_host(host).get_vars()
+            self._set_composite_vars(
+                self.get_option('compose'), hostvars, host, strict)
+            self._add_host_to_composed_groups(
+                self.get_option('groups'), hostvars, host, strict)
+            self._add_host_to_keyed_groups(
+                self.get_option('keyed_groups'), hostvars, host, strict)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(OTCInventoryPlugin, self).parse(inventory, loader, path, cache)
+        if not HAS_LIBRARIES:
+            raise AnsibleParserError(
+                'openstacksdk and otcextensions are required for the '
+                '%s inventory plugin' % self.NAME)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        records = None
+        if use_cache:
+            try:
+                records = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if records is None:
+            records = self._fetch_all()
+        if update_cache:
+            self._cache[cache_key] = records
+
+        self._populate(records)
@@ -0,0 +1,226 @@
+"""API call budgets and resource usage of modules on large datasets.
+
+Every benchmark seeds a `FakeOTC` server with a synthetic dataset, runs a
+module against it in a fresh interpreter and records the wall time, the
+peak RSS of the module process and the number of API requests. A
+benchmark fails when the module does more requests than its budget, which
+is declared as a function of the number of pages needed to list the
+dataset (modules looking up single resources must not depend on it).
+
+Run all benchmarks and print a table::
+
+    python -m ansible_collections.opentelekomcloud.cloud.tests.benchmark.benchmarks
+
+`--scale` (or `OTC_BENCHMARK_SCALE`) shrinks or grows the datasets.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+from ansible_collections.opentelekomcloud.cloud.tests.unit.utils.fake_otc import (
+    FakeOTC, run_module
+)
+
+MODULES = 'ansible_collections.opentelekomcloud.cloud.plugins.modules'
+
+
+class Benchmark:
+    """Module run on a dataset with an API call budget.
+
+    Args:
+        name: Name of the benchmark.
+        module: `<module>.<OTCModule class>` of `plugins/modules`.
+        args: Module arguments (without the connection ones).
+        seed: Function adding `size` resources to a `FakeOTC`.
+        size: Number of resources seeded at scale 1.
+        page_size: Server side page size.
+        budget: Function returning the maximal number of requests
+            (authentication included) for the number of dataset pages.
+    """
+
+    def __init__(self, name, module, args, seed, size, page_size, budget):
+        self.name = name
+        self.module = module
+        self.args = args
+        self.seed = seed
+        self.size = size
+        self.page_size = page_size
+        self.budget = budget
+
+    def scaled_size(self, scale):
+        return max(int(self.size * scale), 1)
+
+
+def seed_backups(cloud, size):
+    vault = cloud.add('cbr_vault', name='vault')
+    for index in range(size):
+        cloud.add('cbr_backup', name='backup-%d' % index,
+                  vault_id=vault['id'], resource_type='OS::Nova::Server')
+
+
+def seed_members(cloud, size):
+    pool = cloud.add('lb_pool', name='pool')
+    cloud.add('subnet', name='subnet')
+    for index in range(size):
+        cloud.add('lb_member', parent=pool['id'], name='member-%d' % index,
+                  address='10.%d.%d.%d' % (
+                      index // 65536, index // 256 % 256, index % 256),
+                  protocol_port=80)
+
+
+def seed_recordsets(cloud, size):
+    zone = cloud.add('dns_zone', name='example.com.', zone_type='public')
+    for index in range(size):
+        cloud.add('dns_recordset', parent=zone['id'],
+                  name='host-%d.example.com.' % index, type='A',
+                  records=['192.168.0.1'])
+
+
+def seed_vpcs(cloud, size):
+    for index in range(size):
+        cloud.add('vpc', name='vpc-%d' % index, cidr='192.168.0.0/16')
+
+
+def seed_subnets(cloud, size):
+    vpc = cloud.add('vpc', name='vpc', cidr='10.0.0.0/8')
+    for index in range(size):
+        cloud.add('vpc_subnet', name='subnet-%d' % index, vpc_id=vpc['id'],
+                  cidr='10.%d.%d.0/24' % (index // 256, index % 256))
+
+
+def seed_security_groups(cloud, size):
+    for index in range(size):
+        cloud.add('security_group', name='sg-%d' % index,
+                  security_group_rules=[])
+
+
+def seed_snat_rules(cloud, size):
+    gateway = cloud.add('nat_gateway', name='gateway')
+    for index in range(size):
+        cloud.add('nat_snat_rule', nat_gateway_id=gateway['id'],
+                  network_id='network-%d' % index,
+                  floating_ip_address='80.158.0.1')
+
+
+BENCHMARKS = [
+    Benchmark('cbr_backup_info', 'cbr_backup_info.CBRBackupsModule',
+              dict(vault='vault'), seed_backups, 10000, 1000,
+              lambda pages: 6 + pages),
+    Benchmark('lb_member_info', 'lb_member_info.LoadBalancerMemberInfoModule',
+              dict(pool='pool'), seed_members, 2000, 500,
+              lambda pages: 6 + pages),
+    Benchmark('lb_member', 'lb_member.LoadBalancerMemberModule',
+              dict(name='member-new', pool='pool', subnet='subnet',
+                   address='10.255.0.1', protocol_port=80),
+              seed_members, 2000, 500, lambda pages: 10),
+    Benchmark('dns_recordset_info',
+              'dns_recordset_info.DNSRecordsetInfoModule',
+              dict(zone='example.com.'), seed_recordsets, 5000, 500,
+              lambda pages: 7 + pages),
+    Benchmark('dns_recordset', 'dns_recordset.DNSRecordsetModule',
+              dict(zone_id='example.com.', recordset_name='new.example.com.',
+                   type='A', records=['192.168.0.2']),
+              seed_recordsets, 5000, 500, lambda pages: 10),
+    Benchmark('vpc_info', 'vpc_info.VpcInfoModule', {}, seed_vpcs,
+              1000, 100, lambda pages: 3 + pages),
+    Benchmark('subnet_info', 'subnet_info.SubnetInfoModule',
+              dict(vpc='vpc'), seed_subnets, 2000, 200,
+              lambda pages: 5 + pages),
+    Benchmark('security_group_info',
+              'security_group_info.SecurityGroupInfoModule', {},
+              seed_security_groups, 1000, 200, lambda pages: 3 + pages),
+    Benchmark('nat_snat_rule_info', 'nat_snat_rule_info.SNATRuleInfoModule',
+              dict(gateway='gateway'), seed_snat_rules, 2000, 200,
+              lambda pages: 5 + pages),
+]
+
+
+def _max_rss():
+    """Peak resident set size of the current process in bytes."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def _run_module(module, args, queue):
+    """Child process: run the module, report its result and usage."""
+    module_name, class_name = module.rsplit('.', 1)
+    module_class = getattr(importlib.import_module(
+        '%s.%s' % (MODULES, module_name)), class_name)
+    base_rss = _max_rss()
+    start = time.perf_counter()
+    result = run_module(module_class, args)
+    wall_time = time.perf_counter() - start
+    queue.put(dict(
+        failed=bool(result.get('failed')), msg=result.get('msg'),
+        changed=bool(result.get('changed')), wall_time=wall_time,
+        base_rss=base_rss, peak_rss=_max_rss()))
+
+
+def run_benchmark(benchmark, scale=1.0):
+    """Run a benchmark, return its measurements."""
+    size = benchmark.scaled_size(scale)
+    pages = int(math.ceil(size / float(benchmark.page_size)))
+    with FakeOTC(page_size=benchmark.page_size) as cloud:
+        benchmark.seed(cloud, size)
+        cloud.reset()
+        # A fresh interpreter per module keeps the peak RSS of the module
+        # apart from the dataset held by the server and from other runs
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        process = context.Process(
+            target=_run_module,
+            args=(benchmark.module, cloud.module_args(**benchmark.args),
+                  queue))
+        process.start()
+        try:
+            measurements = queue.get(timeout=600)
+        finally:
+            process.join()
+        requests = cloud.count()
+    return dict(measurements, name=benchmark.name, size=size, pages=pages,
+                requests=requests, budget=benchmark.budget(pages),
+                over_budget=requests > benchmark.budget(pages))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('names', nargs='*',
+                        help='Benchmarks to run, all when not given')
+    parser.add_argument('--scale', type=float, default=float(
+        os.environ.get('OTC_BENCHMARK_SCALE', 1.0)),
+        help='Factor of the dataset sizes')
+    parser.add_argument('--json', help='Path of a JSON report to write')
+    options = parser.parse_args(argv)
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS
+                  if not options.names or benchmark.name in options.names]
+    results = []
+    print('%-22s %7s %9s %7s %9s %9s' % (
+        'benchmark', 'size', 'requests', 'budget', 'wall [s]', 'rss [MB]'))
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, options.scale)
+        results.append(result)
+        print('%-22s %7d %9d %7d %9.2f %9.1f%s' % (
+            result['name'], result['size'], result['requests'],
+            result['budget'], result['wall_time'],
+            result['peak_rss'] / 1048576.0,
+            ' FAILED: %s' % result['msg'] if result['failed']
+            else ' OVER BUDGET' if result['over_budget'] else ''))
+    if options.json:
+        with open(options.json, 'w') as fd:
+            json.dump(dict(scale=options.scale, benchmarks=results), fd,
+                      indent=2, sort_keys=True)
+    return int(any(result['failed'] or result['over_budget']
+                   for result in results))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
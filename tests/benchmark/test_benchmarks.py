@@ -0,0 +1,23 @@
+import os
+
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.tests.benchmark.benchmarks import (
+    BENCHMARKS, run_benchmark
+)
+
+
+class BenchmarkTest(TestCase):
+    """Modules stay within their API call budgets on large datasets."""
+
+    def test_budgets(self):
+        scale = float(os.environ.get('OTC_BENCHMARK_SCALE', 1.0))
+        for benchmark in BENCHMARKS:
+            with self.subTest(benchmark=benchmark.name):
+                result = run_benchmark(benchmark, scale)
+                self.assertFalse(result['failed'], result['msg'])
+                self.assertLessEqual(
+                    result['requests'], result['budget'],
+                    '%s did %d requests for %d resources in %d pages' % (
+                        benchmark.name, result['requests'], result['size'],
+                        result['pages']))
@@ -0,0 +1,79 @@
+import io
+import json
+from unittest import TestCase, mock
+
+from ansible.module_utils import basic
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    batch, otc
+)
+
+
+def set_batch_args(items, parallelism=1, **shared):
+    shared[batch.BATCH_KEY] = dict(items=items, parallelism=parallelism)
+    basic._ANSIBLE_ARGS = json.dumps(
+        {'ANSIBLE_MODULE_ARGS': shared}).encode('utf-8')
+
+
+class BatchTest(TestCase):
+
+    def setUp(self):
+        self.conn = mock.MagicMock()
+
+        class ItemModule(otc.OTCModule):
+            argument_spec = dict(
+                name=dict(required=True),
+                size=dict(type='int', default=1),
+                secret=dict(no_log=True))
+
+            def run(self):
+                router = self.resolve('network.router', 'shared')
+                if self.params['name'] == 'bad':
+                    self.fail_json(msg='bad item')
+                self.exit_json(changed=True, name=self.params['name'],
+                               size=self.params['size'], router=router.id)
+
+        self.module_class = ItemModule
+        patcher = mock.patch.object(
+            ItemModule, 'openstack_cloud_from_module',
+            return_value=(otc.sdk, self.conn))
+        self.connect = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, method):
+        with mock.patch.object(basic.AnsibleModule, method,
+                               side_effect=SystemExit) as exit_mock:
+            self.assertRaises(SystemExit, self.module_class())
+        return exit_mock.call_args[1]
+
+    def test_items(self):
+        set_batch_args([{'name': 'a'}, {'name': 'b', 'size': 2}],
+                       parallelism=2, size=5)
+        result = self._run('exit_json')
+        self.assertTrue(result['changed'])
+        self.assertEqual([('a', 5), ('b', 2)], [
+            (item['name'], item['size']) for item in result['results']])
+        self.assertEqual({'name': 'b', 'size': 2}, result['results'][1]['item'])
+        # Connection and resolved resources are shared by the items
+        self.connect.assert_called_once_with()
+        self.conn.network.find_router.assert_called_once_with(
+            'shared', ignore_missing=True)
+
+    def test_failed_items(self):
+        set_batch_args([{'name': 'a', 'secret': 'pw'}, {'name': 'bad'},
+                        {'size': 3}])
+        result = self._run('fail_json')
+        self.assertEqual('2 of 3 items failed', result['msg'])
+        self.assertEqual([None, True, True], [
+            item.get('failed') for item in result['results']])
+        self.assertIn('required', result['results'][2]['msg'])
+
+    def test_no_items(self):
+        set_batch_args([])
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            with self.assertRaises(SystemExit) as exit:
+                self.module_class()()
+        self.assertEqual(0, exit.exception.code)
+        self.assertEqual(dict(changed=False, results=[]),
+                         json.loads(stdout.getvalue()))
+        self.connect.assert_not_called()
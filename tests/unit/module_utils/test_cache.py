@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+
+from unittest import TestCase, mock
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    cache
+)
+
+
+class FakeAuth(object):
+    """Minimal keystoneauth plugin replacement"""
+
+    def __init__(self, expiring=False):
+        self.auth_ref = None
+        self.expiring = expiring
+        self.authorized = 0
+
+    def set_auth_state(self, data):
+        if not data:
+            self.auth_ref = None
+            return
+        self.auth_ref = mock.MagicMock(token=json.loads(data)['auth_token'])
+        self.auth_ref.will_expire_soon.return_value = self.expiring
+
+    def get_auth_state(self):
+        if not self.auth_ref:
+            return None
+        return json.dumps({'auth_token': self.auth_ref.token, 'body': {}})
+
+    def authorize(self):
+        if not self.auth_ref:
+            self.authorized += 1
+            self.auth_ref = mock.MagicMock(token='token%d' % self.authorized)
+
+
+def fake_conn(auth):
+    conn = mock.MagicMock()
+    conn.session.auth = auth
+    conn.config.name = 'otc'
+    conn.config.config = {'auth_type': 'password'}
+    conn.config.get_auth_args.return_value = {'username': 'u'}
+    conn.config.get_region_name.return_value = 'eu-de'
+    conn.config.get_interface.return_value = 'public'
+    return conn
+
+
+class TokenCacheTest(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = cache.TokenCache(os.path.join(self.tmp.name, 'tokens'))
+
+    def _authorize(self, auth):
+        with self.cache.session(fake_conn(auth)):
+            auth.authorize()
+
+    def test_token_reused(self):
+        first = FakeAuth()
+        self._authorize(first)
+        second = FakeAuth()
+        self._authorize(second)
+        self.assertEqual(1, first.authorized)
+        self.assertEqual(0, second.authorized)
+        self.assertEqual('token1', second.auth_ref.token)
+
+    def test_expiring_token_refreshed(self):
+        self._authorize(FakeAuth())
+        auth = FakeAuth(expiring=True)
+        self._authorize(auth)
+        self.assertEqual(1, auth.authorized)
+
+    def test_invalidate(self):
+        auth = FakeAuth()
+        self._authorize(auth)
+        self.cache.invalidate(fake_conn(auth))
+        second = FakeAuth()
+        self._authorize(second)
+        self.assertEqual(1, second.authorized)
+
+    def test_non_token_auth_ignored(self):
+        conn = fake_conn(None)
+        with self.cache.session(conn):
+            pass
+        self.assertFalse(os.path.exists(self.cache.cache_dir))
+
+
+class TTLCacheTest(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'sub', 'cache.json')
+
+    def test_set_get(self):
+        cache.TTLCache(self.path, 60).set('a', {'id': 1})
+        cache.TTLCache(self.path, 60).set('b', {'id': 2})
+        fresh = cache.TTLCache(self.path, 60)
+        self.assertEqual({'id': 1}, fresh.get('a'))
+        self.assertEqual({'id': 2}, fresh.get('b'))
+        fresh.delete('a')
+        self.assertIsNone(cache.TTLCache(self.path, 60).get('a'))
+
+    def test_expired(self):
+        ttl_cache = cache.TTLCache(self.path, -1)
+        ttl_cache.set('a', 1)
+        self.assertIsNone(ttl_cache.get('a'))
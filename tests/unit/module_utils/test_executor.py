@@ -0,0 +1,48 @@
+import threading
+import time
+
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    executor
+)
+
+
+class RunParallelTest(TestCase):
+
+    def test_ordered_results(self):
+        def slow_square(x):
+            # Earlier items finish last
+            time.sleep((5 - x) * 0.01)
+            return x * x
+
+        self.assertEqual(
+            [0, 1, 4, 9, 16],
+            executor.run_parallel(slow_square, range(5), max_workers=5))
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+
+        def work(item):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            time.sleep(0.01)
+            with lock:
+                state['running'] -= 1
+
+        executor.run_parallel(work, range(10), max_workers=3)
+        self.assertLessEqual(state['max'], 3)
+        self.assertGreater(state['max'], 1)
+
+    def test_errors_aggregated(self):
+        def fail_odd(x):
+            if x % 2:
+                raise ValueError('odd %d' % x)
+            return x
+
+        with self.assertRaises(executor.ParallelError) as ctx:
+            executor.run_parallel(fail_odd, range(5), max_workers=2)
+        self.assertEqual([1, 3], [item for item, _ in ctx.exception.errors])
+        self.assertIn('2 of the calls failed', str(ctx.exception))
@@ -0,0 +1,52 @@
+from unittest import TestCase, mock
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    metrics, otc
+)
+
+
+class FakeSession(object):
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+
+    def request(self, url, method, **kwargs):
+        return mock.MagicMock(
+            status_code=self.statuses.pop(0), url=None, content=b'abcd',
+            headers={'Retry-After': '0'})
+
+
+class ApiMetricsTest(TestCase):
+
+    def test_url_template(self):
+        self.assertEqual(
+            '/v2.0/ports/{id}',
+            metrics.url_template(
+                'https://vpc.example.com/v2.0/ports/'
+                '4dae5bac-0925-4d5b-add8-cb6667b8abcd?fields=id'))
+        self.assertEqual(
+            '/v1/{id}/vpcs/{id}/routes',
+            metrics.url_template(
+                '/v1/0123456789abcdef0123456789abcdef/vpcs/42/routes'))
+
+    def test_summary(self):
+        session = FakeSession([200, 429, 200])
+        recorder = metrics.ApiMetrics()
+        recorder.install(session)
+        # Retries of the throttling layer are counted by the recorder
+        otc.install_throttle(mock.MagicMock(session=session),
+                             dict(api_retries=3), metrics=recorder)
+        session.request('/v2.0/ports', 'get',
+                        endpoint_filter={'service_type': 'network'})
+        session.request('https://iam.example.com/v3/auth/tokens', 'post')
+
+        summary = recorder.summary()
+        self.assertEqual(3, summary['calls'])
+        self.assertEqual(1, summary['retries'])
+        self.assertEqual(12, summary['bytes'])
+        self.assertEqual(1, summary['services']['network']['calls'])
+        self.assertEqual(2, summary['services']['iam']['calls'])
+        self.assertNotIn('requests', summary)
+        calls = recorder.summary(with_calls=True)['requests']
+        self.assertEqual('POST', calls[1]['method'])
+        self.assertEqual(429, calls[1]['status'])
@@ -0,0 +1,163 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from unittest import TestCase, mock
+
+import requests
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    otc
+)
+
+# Seconds the import of module_utils.otc (including openstacksdk and
+# otcextensions) may take in a fresh interpreter
+IMPORT_TIME_BUDGET = float(os.environ.get('OTC_IMPORT_TIME_BUDGET', 5.0))
+
+IMPORT_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import otc
+print(json.dumps({
+    'elapsed': time.perf_counter() - start,
+    'pkg_resources': 'pkg_resources' in sys.modules,
+}))
+'''
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+class FakeModule(otc.OTCModule):
+
+    argument_spec = dict(name=dict())
+
+    def run(self):
+        pass
+
+
+class FakeInfoModule(FakeModule):
+
+    result_cache = 'fake'
+
+    def run(self):
+        self.conn.list()
+        return dict(changed=False, items=[self.params['name']])
+
+
+class FakeChangingModule(FakeModule):
+
+    invalidates_cache = ('fake',)
+
+    def run(self):
+        return dict(changed=True)
+
+
+class OTCModuleTest(TestCase):
+
+    def setUp(self):
+        self.conn = mock.MagicMock()
+        patcher = mock.patch.object(
+            FakeModule, 'openstack_cloud_from_module',
+            return_value=(mock.MagicMock(), self.conn))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        set_module_args({})
+
+    def test_resolve_memoized(self):
+        module = FakeModule()
+        finder = self.conn.network.find_router
+        router = module.resolve('network.router', 'r1')
+        self.assertEqual(router, module.resolve('network.router', 'r1'))
+        finder.assert_called_once_with('r1', ignore_missing=True)
+        module.resolve('network.router', 'r2')
+        self.assertEqual(2, finder.call_count)
+        self.assertIsNone(module.resolve('network.router', None))
+
+    def _exit(self, module_class, args):
+        set_module_args(args)
+        with mock.patch.object(basic.AnsibleModule, 'exit_json',
+                               side_effect=SystemExit) as exit_json, \
+                mock.patch.object(FakeModule, 'openstack_cloud_from_module',
+                                  return_value=(otc.sdk, self.conn)):
+            self.assertRaises(SystemExit, module_class())
+        return exit_json.call_args[1]
+
+    def test_result_cache(self):
+        with mock.patch.dict(os.environ,
+                             {'XDG_CACHE_HOME': tempfile.mkdtemp()}):
+            args = {'name': 'a', 'result_cache_ttl': 60}
+            self.assertEqual(['a'], self._exit(FakeInfoModule, args)['items'])
+            self.assertEqual(['a'], self._exit(FakeInfoModule, args)['items'])
+            self.assertEqual(1, self.conn.list.call_count)
+            # Other arguments are cached separately
+            self._exit(FakeInfoModule, dict(args, name='b'))
+            self.assertEqual(2, self.conn.list.call_count)
+
+            self._exit(FakeChangingModule, {})
+            self._exit(FakeInfoModule, args)
+            self.assertEqual(3, self.conn.list.call_count)
+
+            # Without TTL results are neither read nor stored
+            self._exit(FakeInfoModule, dict(args, result_cache_ttl=0))
+            self.assertEqual(4, self.conn.list.call_count)
+
+    def _http_session(self, args):
+        set_module_args(args)
+        conn = mock.MagicMock()
+        conn.session.session = requests.Session()
+        otc.configure_http(conn, FakeModule().params)
+        return conn.session.session
+
+    def test_http_pool_size(self):
+        http = self._http_session({'parallelism': 32})
+        adapter = http.get_adapter('https://vpc.example.com')
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertEqual('keep-alive', http.headers['Connection'])
+
+        http = self._http_session({'http_pool_maxsize': 5,
+                                   'http_keepalive': False})
+        self.assertEqual(
+            5, http.get_adapter('https://vpc.example.com')._pool_maxsize)
+        self.assertEqual('close', http.headers['Connection'])
+
+
+class ParseVersionTest(TestCase):
+
+    def test_release_ordering(self):
+        V = otc.parse_version
+        self.assertLess(V('0.6.9'), V('0.7.1'))
+        self.assertLess(V('0.9.0'), V('0.10.1'))
+        self.assertEqual(V('0.11'), V('0.11.0'))
+        self.assertGreater(V('1.0.0'), V('0.26.3'))
+
+    def test_pre_releases(self):
+        V = otc.parse_version
+        self.assertLess(V('1.0.0rc1'), V('1.0.0'))
+        self.assertLess(V('0.7.1.dev3'), V('0.7.1'))
+        self.assertGreater(V('0.7.1.dev3'), V('0.7.0'))
+        self.assertEqual(V('0.7.1+local'), V('0.7.1'))
+
+    def test_invalid(self):
+        self.assertEqual(((), 0), otc.parse_version(None))
+        self.assertEqual(((), 0), otc.parse_version('unknown'))
+
+
+class ImportTimeTest(TestCase):
+
+    def test_import_budget(self):
+        """Ensure module startup does not regress past the budget"""
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        out = subprocess.check_output(
+            [sys.executable, '-c', IMPORT_SCRIPT], env=env)
+        result = json.loads(out.decode('utf-8').splitlines()[-1])
+        self.assertFalse(result['pkg_resources'])
+        self.assertLess(result['elapsed'], IMPORT_TIME_BUDGET)
@@ -0,0 +1,134 @@
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils.security_group import (
+    IntervalIndex, RuleIndex, diff_rules, normalize_rule, rule_attrs
+)
+
+
+class SecurityGroupRulesTest(TestCase):
+
+    def test_normalize_equivalent(self):
+        api = dict(id='1', direction='ingress', ethertype='IPv4',
+                   protocol='tcp', port_range_min=None, port_range_max=None,
+                   remote_ip_prefix=None, remote_group_id=None)
+        for rule in (
+                dict(protocol='6'),
+                dict(protocol='TCP', port_range_min='1',
+                     port_range_max='65535'),
+                dict(protocol='tcp', ethertype='ipv4',
+                     remote_ip_prefix='0.0.0.0/0')):
+            self.assertEqual(normalize_rule(api), normalize_rule(rule))
+        self.assertEqual(
+            '10.0.0.1/32',
+            normalize_rule(dict(remote_ip_prefix='10.0.0.1'))[5])
+        self.assertNotEqual(
+            normalize_rule(dict(protocol='tcp', port_range_min=22,
+                                port_range_max=22)),
+            normalize_rule(dict(protocol='tcp')))
+        self.assertRaises(ValueError, normalize_rule,
+                          dict(remote_ip_prefix='10.0.0.300/24'))
+
+    def test_diff(self):
+        existing = [
+            dict(id='keep', direction='ingress', protocol='tcp',
+                 port_range_min=22, port_range_max=22,
+                 remote_ip_prefix='10.0.0.0/8', ethertype='IPv4'),
+            dict(id='drop', direction='egress', ethertype='IPv6'),
+        ]
+        desired = [
+            dict(protocol='6', port_range_min='22', port_range_max='22',
+                 remote_ip_prefix='10.1.2.3/8'),
+            dict(protocol='icmp', remote_ip_prefix='192.168.0.0/16'),
+            dict(protocol='icmp', remote_ip_prefix='192.168.0.0/16'),
+        ]
+        to_create, to_delete = diff_rules(existing, desired)
+        self.assertEqual([desired[1]], to_create)
+        self.assertEqual([], to_delete)
+
+        to_create, to_delete = diff_rules(existing, desired, exclusive=True)
+        self.assertEqual([desired[1]], to_create)
+        self.assertEqual(['drop'], [rule['id'] for rule in to_delete])
+
+        self.assertEqual((set(), set()), tuple(
+            set(rule.get('id') for rule in changes)
+            for changes in diff_rules(existing, existing, exclusive=True)))
+
+    def test_rule_attrs(self):
+        self.assertEqual(
+            dict(direction='ingress', ethertype='IPv4', protocol='udp',
+                 port_range_min=53, port_range_max=53,
+                 remote_ip_prefix='10.0.0.0/8', description='dns'),
+            rule_attrs(dict(protocol='17', port_range_min='53',
+                            port_range_max=53, remote_ip_prefix='10.0.0.0/8',
+                            description='dns')))
+        # The project is passed on creation, but not compared
+        self.assertEqual(
+            dict(direction='egress', ethertype='IPv4', project_id='p1'),
+            rule_attrs(dict(direction='egress', project_id='p1')))
+        self.assertEqual(([], []), diff_rules(
+            [dict(id='rule', direction='egress', project_id='p1')],
+            [dict(direction='egress', project_id='p2')]))
+
+    def test_interval_index(self):
+        index = IntervalIndex([(1, 100, 'a'), (20, 30, 'b'), (25, 25, 'c'),
+                               (200, 300, 'd')])
+        self.assertEqual(['a', 'b', 'c'], sorted(index.find(25)))
+        self.assertEqual(['a'], list(index.find(100)))
+        self.assertEqual([], list(index.find(150)))
+        self.assertEqual(4, len(list(index.find())))
+
+    def test_rule_index(self):
+        rules = [
+            dict(id='ssh', protocol='tcp', port_range_min=22,
+                 port_range_max=22, remote_ip_prefix='10.0.0.0/8'),
+            dict(id='web', protocol='tcp', port_range_min=80,
+                 port_range_max=443),
+            dict(id='any', remote_ip_prefix='10.1.0.0/16'),
+            dict(id='group', protocol='tcp', remote_group_id='sg-1'),
+            dict(id='egress', direction='egress', protocol='tcp'),
+            dict(id='v6', ethertype='IPv6', protocol='tcp'),
+        ]
+        index = RuleIndex(rules)
+
+        def allowing(source, port=None, protocol='tcp', **kwargs):
+            return [rule['id'] for rule in index.allowing(
+                source, port, protocol, **kwargs)]
+
+        self.assertEqual(['ssh'], allowing('10.2.3.4', 22))
+        self.assertEqual(['ssh', 'any'], allowing('10.1.3.4', 22))
+        self.assertEqual(['ssh'], allowing('10.1.0.0/8', 22))
+        self.assertEqual(['web'], allowing('8.8.8.8', 443))
+        self.assertEqual(['any'], allowing('10.1.2.3', 53, 'udp'))
+        self.assertEqual(['ssh', 'web'], allowing('10.2.3.4'))
+        self.assertEqual([], allowing('8.8.8.8', 8080))
+        self.assertEqual(['v6'], allowing('2001:db8::1', 8080))
+        self.assertEqual(['egress'], allowing('8.8.8.8', 8080,
+                                              direction='egress'))
+        members = {'sg-1': set(['192.168.0.5'])}
+        self.assertEqual(['group'], allowing(
+            '192.168.0.5', 8080, group_members=lambda group_id:
+                members.get(group_id, ())))
+        self.assertRaises(ValueError, allowing, 'host', 22)
+
+    def test_rule_index_icmp(self):
+        # Port fields of ICMP rules are type and code
+        index = RuleIndex([
+            dict(id='echo', protocol='icmp', port_range_min=8,
+                 port_range_max=0),
+            dict(id='unreachable', protocol='1', port_range_min=3,
+                 port_range_max=4),
+            dict(id='icmp', protocol='icmp', remote_ip_prefix='10.0.0.0/8'),
+            dict(id='v6', ethertype='IPv6', protocol='icmpv6',
+                 port_range_min=128, port_range_max=0),
+        ])
+
+        def allowing(source, port=None, protocol='icmp'):
+            return [rule['id'] for rule in index.allowing(
+                source, port, protocol)]
+
+        self.assertEqual(['echo'], allowing('1.2.3.4', 8))
+        self.assertEqual(['echo', 'icmp'], allowing('10.0.0.1', 8))
+        self.assertEqual(['unreachable'], allowing('1.2.3.4', 3))
+        self.assertEqual([], allowing('1.2.3.4', 4))
+        self.assertEqual(['echo', 'unreachable'], allowing('1.2.3.4'))
+        self.assertEqual(['v6'], allowing('2001:db8::1', 128, 'ipv6-icmp'))
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from openstack.network.v2.port import Port
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    serializer
+)
+
+
+class SerializeTest(TestCase):
+
+    def setUp(self):
+        self.port = Port(id='p1', name='port', fixed_ips=[{'ip': '10.0.0.1'}])
+
+    def test_same_as_to_dict(self):
+        expected = self.port.to_dict()
+        expected.pop('location')
+        self.assertEqual(expected, serializer.serialize(self.port))
+
+    def test_fields(self):
+        self.assertEqual(
+            {'id': 'p1', 'fixed_ips': [{'ip': '10.0.0.1'}]},
+            serializer.serialize(self.port, fields=['id', 'fixed_ips']))
+
+    def test_exclude_fields(self):
+        result = serializer.serialize(self.port, exclude_fields=['fixed_ips'])
+        self.assertNotIn('fixed_ips', result)
+        self.assertNotIn('location', result)
+        self.assertEqual('port', result['name'])
+
+    def test_dict(self):
+        self.assertEqual(
+            {'id': 'a'},
+            serializer.serialize({'id': 'a', 'location': 'x', 'name': 'b'},
+                                 exclude_fields=['name']))
+
+    def test_to_plain(self):
+        expected = self.port.to_dict()
+        self.assertEqual(
+            {'ports': [expected], 'by_name': {'port': expected}},
+            serializer.to_plain(
+                {'ports': [self.port], 'by_name': {'port': self.port}}))
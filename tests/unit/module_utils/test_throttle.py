@@ -0,0 +1,105 @@
+import os
+import tempfile
+
+from unittest import TestCase, mock
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    throttle
+)
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def response(status, headers=None):
+    return mock.MagicMock(status_code=status, headers=headers or {})
+
+
+class TokenBucketTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_rate(self):
+        bucket = throttle.TokenBucket(
+            2, clock=self.clock.time, sleep=self.clock.sleep)
+        for _ in range(6):
+            bucket.acquire()
+        # Two calls of the initial burst, then one every half second
+        self.assertAlmostEqual(1002.0, self.clock.now)
+
+    def test_shared_between_instances(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'network.json')
+        buckets = [
+            throttle.SharedTokenBucket(
+                path, 1, clock=self.clock.time, sleep=self.clock.sleep)
+            for _ in range(2)]
+        buckets[0].acquire()
+        # Second "process" finds the budget used up
+        buckets[1].acquire()
+        self.assertEqual([1.0], self.clock.sleeps)
+        buckets[0].block(10)
+        buckets[1].acquire()
+        self.assertAlmostEqual(10.0, self.clock.sleeps[-1])
+
+    def test_unlimited_service(self):
+        limiter = throttle.RateLimiter({'network': 1})
+        limiter.acquire('compute')
+        self.assertIsNone(limiter.bucket('compute'))
+
+
+class ThrottleTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.session = mock.MagicMock()
+
+    def _install(self, responses, **kwargs):
+        self.session.request = mock.MagicMock(side_effect=responses)
+        throttle.Throttle(sleep=self.clock.sleep, **kwargs).install(
+            self.session)
+
+    def test_retry_after_honored(self):
+        limiter = mock.MagicMock()
+        self._install([response(429, {'Retry-After': '7'}), response(200)],
+                      rate_limiter=limiter)
+        result = self.session.request(
+            'https://vpc.example.com/v1/vpcs', 'POST',
+            endpoint_filter={'service_type': 'vpc'})
+        self.assertEqual(200, result.status_code)
+        self.assertEqual([7.0], self.clock.sleeps)
+        limiter.block.assert_called_once_with('vpc', 7.0)
+        self.assertEqual(2, limiter.acquire.call_count)
+
+    def test_unavailable_not_retried_for_post(self):
+        self._install([response(503), response(200)])
+        result = self.session.request('https://x/v1', 'POST')
+        self.assertEqual(503, result.status_code)
+        result = self.session.request('https://x/v1', 'GET')
+        self.assertEqual(200, result.status_code)
+
+    def test_retries_exhausted(self):
+        self._install([response(429)] * 3, retries=2, delay=1, max_delay=10)
+        result = self.session.request('https://x/v1', 'GET')
+        self.assertEqual(429, result.status_code)
+        self.assertEqual(2, len(self.clock.sleeps))
+        self.assertLess(self.clock.sleeps[0], self.clock.sleeps[1])
+
+    def test_retry_after_date(self):
+        headers = {'Retry-After': 'Thu, 01 Jan 1970 00:16:50 GMT'}
+        self.assertEqual(
+            10.0, throttle.retry_after(response(429, headers),
+                                       clock=self.clock.time))
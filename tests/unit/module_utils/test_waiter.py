@@ -0,0 +1,87 @@
+from unittest import TestCase, mock
+
+from openstack import exceptions
+
+from ansible_collections.opentelekomcloud.cloud.plugins.module_utils import (
+    waiter
+)
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def resource(status):
+    return mock.MagicMock(status=status)
+
+
+class WaiterTest(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _waiter(self, timeout=100, **kwargs):
+        return waiter.Waiter(timeout, sleep=self.clock.sleep,
+                             clock=self.clock.time, jitter=0, **kwargs)
+
+    def test_multiple_resources(self):
+        states = {
+            'a': iter(['BUILD', 'ACTIVE']),
+            'b': iter(['BUILD', 'BUILD', 'BUILD', 'ACTIVE']),
+        }
+        transitions = []
+        result = self._waiter(
+            on_transition=lambda *args: transitions.append(args)).wait(
+            ['a', 'b'],
+            refresh=lambda item: resource(next(states[item])),
+            ready=waiter.status_in('active'))
+        self.assertEqual(['ACTIVE', 'ACTIVE'],
+                         [res.status for res in result])
+        self.assertIn(('a', 'BUILD', 'ACTIVE'), transitions)
+        # b is polled alone after a is ready, transition of a resets backoff
+        self.assertEqual([1.0, 1.0, 2.0], self.clock.sleeps)
+
+    def test_backoff_capped(self):
+        with self.assertRaises(exceptions.ResourceTimeout):
+            self._waiter(timeout=60, max_delay=8).wait(
+                ['a'],
+                refresh=lambda item: resource('BUILD'),
+                ready=waiter.status_in('ACTIVE'))
+        self.assertEqual([1.0, 2.0, 4.0, 8.0, 8.0],
+                         self.clock.sleeps[:5])
+        self.assertEqual(60, self.clock.now)
+
+    def test_failure(self):
+        with self.assertRaises(exceptions.ResourceFailure):
+            self._waiter().wait(
+                ['a'],
+                refresh=lambda item: resource('ERROR'),
+                ready=waiter.status_in('ACTIVE'),
+                failed=waiter.status_in('ERROR'))
+
+    def test_deleted(self):
+        def refresh(item):
+            raise exceptions.ResourceNotFound()
+
+        self.assertEqual([None], self._waiter().wait(
+            ['a'], refresh=refresh, ready=waiter.is_deleted))
+
+    def test_refresh_all_and_dotted_status(self):
+        job = mock.MagicMock()
+        job.status.status = 'Success'
+        result = self._waiter().wait(
+            ['a', 'b'],
+            refresh_all=lambda pending: [job for _ in pending],
+            ready=waiter.status_in('success', attribute='status.status'))
+        self.assertEqual([job, job], result)
+        self.assertEqual([], self.clock.sleeps)
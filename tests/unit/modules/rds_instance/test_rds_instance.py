@@ -104,6 +104,9 @@ class RdsInstanceTest(TestCase):
             self.conn.rds.find_instance.return_value = None
             self.module().run()
         self.conn.create_rds_instance.assert_called_with(
+            api_metrics='none',
+            api_rate_limits=None,
+            api_retries=3,
             api_timeout=None,
             auth=None,
             auth_type=None,
@@ -120,17 +123,25 @@ class RdsInstanceTest(TestCase):
             disk_encryption=None,
             flavor=None,
             ha_mode=None,
+            http_keepalive=True,
+            http_pool_maxsize=None,
             interface='public',
             name='test',
             network=None,
+            parallelism=1,
             password=None,
             port=None,
+            profile=None,
             region='eu-de',
             region_name=None,
             replica_of=None,
+            resolve_cache_ttl=0,
+            result_cache_ttl=0,
             router=None,
             security_group=None,
             state='present',
+            token_cache=False,
+            token_cache_dir=None,
             validate_certs=None,
             volume_size=None,
             volume_type=None,
@@ -0,0 +1,159 @@
+import os
+import tempfile
+
+from unittest import TestCase
+
+from ansible_collections.opentelekomcloud.cloud.plugins.modules import (
+    lb_member, router, subnet, vpc, vpc_info, vpc_route_table
+)
+from ansible_collections.opentelekomcloud.cloud.tests.unit.utils.fake_otc import (
+    FakeOTC, run_module
+)
+
+
+class OfflineModuleTest(TestCase):
+    """Modules run end-to-end against the fake OTC API server."""
+
+    def setUp(self):
+        self.cloud = FakeOTC(page_size=2).start()
+        self.addCleanup(self.cloud.stop)
+
+    def test_info_pagination(self):
+        for index in range(5):
+            self.cloud.add('vpc', name='vpc-%d' % index,
+                           cidr='192.168.0.0/16')
+        result = run_module(vpc_info.VpcInfoModule, self.cloud.module_args())
+        self.assertEqual(5, len(result['vpcs']))
+        self.assertEqual(3, self.cloud.count(route='vpc', method='GET'))
+
+    def test_create(self):
+        args = self.cloud.module_args(name='vpc-1', cidr='10.0.0.0/16')
+        self.assertTrue(run_module(vpc.VpcModule, args)['changed'])
+        self.assertEqual(['vpc-1'],
+                         [item['name'] for item in self.cloud.list('vpc')])
+        self.assertFalse(run_module(vpc.VpcModule, args)['changed'])
+        self.assertEqual(1, self.cloud.count(route='vpc', method='POST'))
+
+    def test_profile(self):
+        self.cloud.add('vpc', name='vpc-1', cidr='192.168.0.0/16')
+        with tempfile.TemporaryDirectory() as profile_dir:
+            result = run_module(vpc_info.VpcInfoModule,
+                                self.cloud.module_args(profile=profile_dir))
+            profile = result['otc_profile']
+            self.assertEqual(profile_dir, os.path.dirname(profile['path']))
+            self.assertEqual(
+                ['allocations.txt', 'profile.pstats', 'profile.txt',
+                 'summary.json'], sorted(os.listdir(profile['path'])))
+        self.assertEqual(set(['network', 'sdk', 'collection', 'other']),
+                         set(profile['time']))
+        self.assertGreater(profile['time']['sdk'], 0)
+        self.assertGreater(profile['memory']['peak'], 0)
+
+    def test_router_interfaces(self):
+        net = self.cloud.add('network', name='net')
+        rtr = self.cloud.add('router', name='router', admin_state_up=True,
+                             external_gateway_info=None)
+        for index in range(5):
+            subnet = self.cloud.add('subnet', name='subnet-%d' % index,
+                                    network_id=net['id'])
+            self.cloud.add('port', device_id=rtr['id'], network_id=net['id'],
+                           device_owner='network:router_interface',
+                           fixed_ips=[dict(subnet_id=subnet['id'],
+                                           ip_address='10.0.%d.1' % index)])
+        args = self.cloud.module_args(
+            name='router', interfaces=['subnet-%d' % index
+                                       for index in range(5)])
+        self.cloud.reset()
+        self.assertFalse(run_module(router.RouterModule, args)['changed'])
+        # A single listing (of 3 pages) each, no lookups per interface
+        self.assertEqual(3, self.cloud.count(route='subnet'))
+        self.assertEqual(3, self.cloud.count(route='port'))
+
+        args['interfaces'] = args['interfaces'][1:]
+        self.assertTrue(run_module(router.RouterModule, args)['changed'])
+        self.assertEqual(['remove_router_interface'], [
+            request['path'].rsplit('/', 1)[-1]
+            for request in self.cloud.requests if request['method'] == 'PUT'])
+
+    def test_subnets(self):
+        vpc_id = self.cloud.add('vpc', name='vpc', cidr='10.0.0.0/8')['id']
+        for index in range(5):
+            self.cloud.add('vpc_subnet', name='subnet-%d' % index,
+                           vpc_id=vpc_id, cidr='10.0.%d.0/24' % index)
+        self.cloud.reset()
+        result = run_module(subnet.SubnetModule, self.cloud.module_args(
+            vpc='vpc', parallelism=2, subnets=[
+                dict(name='subnet-1', cidr='10.0.1.0/24'),
+                dict(name='subnet-2', state='absent'),
+                dict(name='subnet-new', cidr='10.0.9.0/24')]))
+        self.assertTrue(result['changed'])
+        self.assertEqual([False, True, True], [
+            item['changed'] for item in result['subnets']])
+        # A single listing (of 3 pages) for all items, the deletion is
+        # awaited by a request answered with 404
+        self.assertEqual([200, 200, 200, 404], [
+            request['status'] for request in self.cloud.requests
+            if request['route'] == 'vpc_subnet'
+            and request['method'] == 'GET'])
+        self.assertEqual(
+            ['subnet-0', 'subnet-1', 'subnet-3', 'subnet-4', 'subnet-new'],
+            sorted(item['name'] for item in self.cloud.list('vpc_subnet')))
+
+    def test_vpc_route_table(self):
+        router_id = self.cloud.add('router', name='vpc-a')['id']
+        old = self.cloud.add('vpc_peering', name='peering-old')['id']
+        new = self.cloud.add('vpc_peering', name='peering-new')['id']
+        for index in range(3):
+            self.cloud.add('vpc_route', vpc_id=router_id, type='peering',
+                           destination='10.%d.0.0/16' % index, nexthop=old)
+        self.cloud.reset()
+        result = run_module(
+            vpc_route_table.VPCRouteTableModule, self.cloud.module_args(
+                router='vpc-a', purge=True, routes=[
+                    dict(destination='10.0.0.0/16', nexthop='peering-old'),
+                    dict(destination='10.1.0.1/16', nexthop='peering-new'),
+                    dict(destination='10.5.0.0/16', nexthop=new)]))
+        self.assertTrue(result['changed'])
+        self.assertEqual(['10.1.0.0/16', '10.2.0.0/16'], sorted(
+            route['destination'] for route in result['removed']))
+        self.assertEqual(['10.1.0.0/16', '10.5.0.0/16'], sorted(
+            route['destination'] for route in result['added']))
+        # Routes (2 pages) and peerings are listed once for all routes
+        self.assertEqual(2, self.cloud.count('vpc', 'GET', 'vpc_route'))
+        self.assertEqual(1, self.cloud.count('vpc', 'GET', 'vpc_peering'))
+        self.assertEqual(
+            [('10.0.0.0/16', old), ('10.1.0.0/16', new), ('10.5.0.0/16', new)],
+            sorted((route['destination'], route['nexthop'])
+                   for route in self.cloud.list('vpc_route')))
+
+        result = run_module(
+            vpc_route_table.VPCRouteTableModule, self.cloud.module_args(
+                router='vpc-a', routes=[
+                    dict(destination='10.5.0.0/16', nexthop='peering-new')]))
+        self.assertFalse(result['changed'])
+        self.assertEqual(3, len(result['vpc_routes']))
+
+        # Check mode returns the planned routes, without changing any
+        result = run_module(
+            vpc_route_table.VPCRouteTableModule, self.cloud.module_args(
+                router='vpc-a', purge=True, _ansible_check_mode=True,
+                routes=[dict(destination='10.5.0.0/16', nexthop=new),
+                        dict(destination='10.6.0.0/16', nexthop=new)]))
+        self.assertTrue(result['changed'])
+        self.assertEqual(['10.5.0.0/16', '10.6.0.0/16'], sorted(
+            route['destination'] for route in result['vpc_routes']))
+        self.assertEqual(3, len(self.cloud.list('vpc_route')))
+
+    def test_throttling(self):
+        pool = self.cloud.add('lb_pool', name='pool')
+        self.cloud.add('subnet', name='subnet')
+        self.cloud.rate_limit = {'network': 1}
+        result = run_module(lb_member.LoadBalancerMemberModule,
+                            self.cloud.module_args(
+                                name='m1', pool='pool', subnet='subnet',
+                                address='10.0.0.1', protocol_port=80,
+                                api_retries=0))
+        self.assertTrue(result['failed'])
+        self.assertIn('429', [str(request['status'])
+                              for request in self.cloud.requests])
+        self.assertEqual([], self.cloud.list('lb_member', parent=pool['id']))
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from ansible_collections.opentelekomcloud.cloud.plugins.callback import (
+    otc_metrics
+)
+
+
+def summary(calls, latency, service='network', throttled=0):
+    return {
+        'calls': calls, 'retries': throttled, 'bytes': 10 * calls,
+        'total_latency': latency,
+        'latency': {'p50': 0.1, 'p90': 0.1, 'p99': 0.1, 'max': 0.5},
+        'services': {service: {'calls': calls, 'throttled': throttled,
+                               'total_latency': latency}},
+    }
+
+
+def task_result(uuid, name, host, result, role=None):
+    task = mock.MagicMock(_uuid=uuid)
+    task.get_name.return_value = name
+    task._role = None
+    if role:
+        task._role = mock.MagicMock()
+        task._role.get_name.return_value = role
+    host_obj = mock.MagicMock()
+    host_obj.get_name.return_value = host
+    return mock.MagicMock(_task=task, _host=host_obj, _result=result)
+
+
+class OtcMetricsCallbackTest(TestCase):
+
+    def test_aggregate(self):
+        aggregator = otc_metrics.MetricsAggregator()
+        aggregator.add('t1', 'list', None, 'h1', summary(10, 1.0))
+        aggregator.add('t1', 'list', None, 'h2', summary(30, 2.0))
+        aggregator.add('t2', 'create', 'vpc', 'h1',
+                       summary(2, 5.0, service='vpc', throttled=1))
+
+        task = aggregator.tasks['t1']
+        self.assertEqual(40, task['calls'])
+        self.assertEqual(30, task['hosts']['h2']['calls'])
+        self.assertEqual(['list', 'create'], [
+            task['task'] for task in aggregator.top('calls', 5)])
+        self.assertEqual('create', aggregator.top('total_latency', 1)[0]['task'])
+        self.assertEqual(1, aggregator.services['vpc']['throttled'])
+        self.assertEqual(2, aggregator.roles['vpc']['calls'])
+        self.assertEqual(12, aggregator.hosts['h1']['calls'])
+        self.assertEqual(42, aggregator.totals['calls'])
+
+    def test_report(self):
+        path = os.path.join(tempfile.mkdtemp(), 'report', 'metrics.json')
+        callback = otc_metrics.CallbackModule()
+        options = {'top': 5, 'report_path': path}
+        with mock.patch.object(callback, 'get_option',
+                               side_effect=options.get), \
+                mock.patch.object(callback, '_display'):
+            play = mock.MagicMock()
+            play.get_name.return_value = 'play'
+            callback.v2_playbook_on_play_start(play)
+            callback.v2_runner_on_ok(task_result(
+                't1', 'loop', 'h1',
+                {'results': [{'otc_metrics': summary(3, 0.3)},
+                             {'otc_metrics': summary(4, 0.4)}]}))
+            callback.v2_runner_on_failed(task_result(
+                't2', 'fail', 'h1', {'otc_metrics': summary(1, 0.1)}))
+            callback.v2_runner_on_ok(task_result('t3', 'debug', 'h1', {}))
+            callback.v2_playbook_on_stats(mock.MagicMock())
+
+        with open(path) as fd:
+            report = json.load(fd)
+        play = report['plays'][0]
+        self.assertEqual('play', play['name'])
+        self.assertEqual(8, play['totals']['calls'])
+        self.assertEqual([7, 1], [task['calls'] for task in play['tasks']])
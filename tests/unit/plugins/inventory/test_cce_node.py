@@ -0,0 +1,57 @@
+from otcextensions.sdk.cce.v3.cluster_node import ClusterNode
+
+from ansible_collections.opentelekomcloud.cloud.plugins.inventory import (
+    cce_node
+)
+from ansible_collections.opentelekomcloud.cloud.tests.unit.plugins.inventory.utils import (
+    FakeConn, InventoryPluginTest, named
+)
+
+
+def node(uid, name, pool=None):
+    annotations = {cce_node.NODE_POOL_ANNOTATION: pool} if pool else {}
+    return ClusterNode(
+        metadata={'uid': uid, 'name': name, 'annotations': annotations},
+        spec={'az': 'eu-de-01', 'k8sTags': {'role': 'worker'}},
+        status={'privateIP': '10.0.0.%s' % uid, 'phase': 'Active'})
+
+
+class CceNodeInventoryTest(InventoryPluginTest):
+
+    plugin_class = cce_node.InventoryModule
+    default_options = {
+        'address_type': 'private',
+        'with_node_pools': True,
+    }
+
+    def make_conn(self):
+        conn = FakeConn('cce')
+        conn.cce.clusters.return_value = [
+            named('c1', 'prod'), named('c2', 'dev')]
+        nodes = {'c1': [node('1', 'prod-1', 'p1'), node('2', 'prod-2')],
+                 'c2': [node('3', 'dev-1')]}
+        conn.cce.cluster_nodes.side_effect = lambda c: nodes[c.id]
+        conn.cce.node_pools.return_value = [named('p1', 'big')]
+        return conn
+
+    def test_populate(self):
+        self.plugin._populate(self.plugin._fetch_all())
+        inventory = self.plugin.inventory
+        prod = inventory.get_host('prod-1').get_vars()
+        self.assertEqual('10.0.0.1', prod['ansible_host'])
+        self.assertEqual('big', prod['otc']['node_pool']['name'])
+        self.assertEqual('prod', prod['otc']['cluster']['name'])
+
+        groups = inventory.groups
+        self.assertEqual({'prod-1', 'prod-2'},
+                         set(groups['cce_cluster_prod'].host_names))
+        self.assertEqual({'prod-1'},
+                         set(groups['cce_node_pool_big'].host_names))
+        self.assertEqual(3, len(groups['label_role_worker'].host_names))
+
+    def test_cluster_filter(self):
+        self.options['clusters'] = ['dev']
+        self.plugin._populate(self.plugin._fetch_all())
+        self.assertEqual(['dev-1'], [
+            host.name for host in self.plugin.inventory.hosts.values()])
+        self.conn.cce.cluster_nodes.assert_called_once()
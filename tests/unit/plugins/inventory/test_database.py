@@ -0,0 +1,82 @@
+from otcextensions.sdk.css.v1.cluster import Cluster
+from otcextensions.sdk.dds.v3.instance import Instance as DdsInstance
+from otcextensions.sdk.dms.v1.instance import Instance as DmsInstance
+from otcextensions.sdk.rds.v3.instance import Instance as RdsInstance
+
+from ansible_collections.opentelekomcloud.cloud.plugins.inventory import (
+    database
+)
+from ansible_collections.opentelekomcloud.cloud.tests.unit.plugins.inventory.utils import (
+    FakeConn, InventoryPluginTest
+)
+
+
+class DatabaseInventoryTest(InventoryPluginTest):
+
+    plugin_class = database.InventoryModule
+    default_options = {
+        'services': ['rds', 'dds', 'css', 'dms'],
+        'keyed_groups': [{'key': 'db_version', 'prefix': 'version'}],
+        'leading_separator': True,
+        'strict': True,
+    }
+
+    def make_conn(self):
+        conn = FakeConn('rds', 'dds', 'css', 'dms')
+        conn.rds.instances.return_value = [RdsInstance(
+            id='r1', name='pg', status='ACTIVE', port=5432,
+            flavor_ref='rds.pg.c2.large', private_ips=['192.168.0.10'],
+            datastore={'type': 'PostgreSQL', 'version': '12'},
+            password='secret')]
+        conn.dds.instances.return_value = [DdsInstance(
+            id='d1', name='mongo', status='normal', port=8635,
+            datastore={'type': 'DDS-Community', 'version': '4.0'},
+            groups=[{'nodes': [{'private_ip': '192.168.0.20',
+                                'spec_code': 'dds.mongodb.s2.medium.4'}]}])]
+        conn.css.clusters.return_value = [Cluster(
+            id='c1', name='search', status='200',
+            endpoints=['192.168.0.30:9200'],
+            datastore={'type': 'elasticsearch', 'version': '7.10.2'},
+            nodes=[{'specCode': 'css.xlarge.2', 'ip': '192.168.0.30'}])]
+        conn.dms.instances.return_value = [DmsInstance(
+            instance_id='k1', name='kafka', status='RUNNING', port=9092,
+            engine='kafka', engine_version='2.7',
+            connect_address='192.168.0.40,192.168.0.41',
+            resource_spec_code='dms.instance.kafka.cluster.c3.mini',
+            password='secret')]
+        return conn
+
+    def test_populate(self):
+        self.plugin._populate(self.plugin._fetch_all())
+        inventory = self.plugin.inventory
+        pg = inventory.get_host('pg').get_vars()
+        self.assertEqual('192.168.0.10', pg['ansible_host'])
+        self.assertEqual('postgresql', pg['db_engine'].lower())
+        self.assertEqual('rds.pg.c2.large', pg['db_flavor'])
+        self.assertEqual(5432, pg['db_port'])
+        self.assertNotIn('password', pg)
+        mongo = inventory.get_host('mongo').get_vars()
+        self.assertEqual('192.168.0.20', mongo['db_endpoint'])
+        self.assertEqual('dds.mongodb.s2.medium.4', mongo['db_flavor'])
+        search = inventory.get_host('search').get_vars()
+        self.assertEqual('192.168.0.30', search['ansible_host'])
+        self.assertEqual(9200, search['db_port'])
+        self.assertEqual('css.xlarge.2', search['db_flavor'])
+        kafka = inventory.get_host('kafka').get_vars()
+        self.assertEqual('192.168.0.40', kafka['ansible_host'])
+        self.assertEqual(9092, kafka['db_port'])
+        self.assertEqual('dms', kafka['db_service'])
+        self.assertNotIn('password', kafka)
+
+        groups = inventory.groups
+        self.assertIn('pg', groups['rds'].host_names)
+        self.assertIn('pg', groups['engine_postgresql'].host_names)
+        self.assertIn('kafka', groups['engine_kafka'].host_names)
+        self.assertIn('kafka', groups['status_running'].host_names)
+        self.assertIn('search', groups['version_7_10_2'].host_names)
+
+    def test_services(self):
+        self.options['services'] = ['rds']
+        records = self.plugin._fetch_all()
+        self.assertEqual(['pg'], [record['name'] for record in records])
+        self.assertEqual(('rds',), self.plugin.otce_services)
@@ -0,0 +1,62 @@
+from unittest import mock
+
+from openstack.compute.v2.server import Server
+
+from ansible_collections.opentelekomcloud.cloud.plugins.inventory import ecs
+from ansible_collections.opentelekomcloud.cloud.tests.unit.plugins.inventory.utils import (
+    FakeConn, InventoryPluginTest, named
+)
+
+
+def server(id, name, az='eu-de-01', tags=None, floating=None):
+    addresses = [{'addr': '192.168.0.%s' % id, 'version': 4,
+                  'OS-EXT-IPS:type': 'fixed'}]
+    if floating:
+        addresses.append({'addr': floating, 'version': 4,
+                          'OS-EXT-IPS:type': 'floating'})
+    return Server(id=id, name=name, availability_zone=az, status='ACTIVE',
+                  tags=tags or [], addresses={'net': addresses})
+
+
+class EcsInventoryTest(InventoryPluginTest):
+
+    plugin_class = ecs.InventoryModule
+    default_options = {
+        'address_type': 'floating',
+        'with_as_groups': True,
+        'with_deh': True,
+        'keyed_groups': [{'key': 'status', 'prefix': 'state'}],
+        'leading_separator': True,
+        'strict': True,
+    }
+
+    def make_conn(self):
+        conn = FakeConn('compute', 'auto_scaling', 'deh')
+        conn.compute.servers.return_value = [
+            server('1', 'web', tags=['role=web'], floating='80.0.0.1'),
+            server('2', 'db', az='eu-de-02'),
+        ]
+        conn.auto_scaling.groups.return_value = [named('g1', 'web-group')]
+        conn.auto_scaling.instances.return_value = [mock.MagicMock(id='1')]
+        conn.deh.hosts.return_value = [named('h1', 'deh1')]
+        conn.deh.servers.return_value = [mock.MagicMock(id='2')]
+        return conn
+
+    def test_populate(self):
+        self.plugin._populate(self.plugin._fetch_all())
+        inventory = self.plugin.inventory
+        web = inventory.get_host('web').get_vars()
+        self.assertEqual('80.0.0.1', web['ansible_host'])
+        self.assertEqual('web-group', web['otc']['as_group']['name'])
+        self.assertEqual('otc', web['otc']['cloud'])
+        db = inventory.get_host('db').get_vars()
+        self.assertEqual('192.168.0.2', db['ansible_host'])
+        self.assertEqual('h1', db['otc']['deh_host']['id'])
+
+        groups = inventory.groups
+        self.assertIn('web', groups['tag_role_web'].host_names)
+        self.assertIn('web', groups['as_group_web_group'].host_names)
+        self.assertIn('db', groups['deh_deh1'].host_names)
+        self.assertIn('db', groups['az_eu_de_02'].host_names)
+        self.assertEqual({'web', 'db'},
+                         set(groups['state_ACTIVE'].host_names))
@@ -0,0 +1,51 @@
+from unittest import TestCase, mock
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+
+
+def named(id, name):
+    """Return a resource mock with `id` and `name`."""
+    resource = mock.MagicMock(id=id)
+    resource.name = name
+    return resource
+
+
+class FakeConn(object):
+    """Connection to the `otc` cloud with mocked service proxies."""
+
+    def __init__(self, *proxies):
+        for proxy in proxies:
+            setattr(self, proxy, mock.MagicMock())
+        self.config = mock.MagicMock()
+        self.config.get_region_name.return_value = 'eu-de'
+        self.current_project_id = 'project'
+
+
+class InventoryPluginTest(TestCase):
+    """Inventory plugin with given options connecting to a `FakeConn`.
+
+    Child classes set `plugin_class` and `default_options` and build the
+    connection with `make_conn`.
+    """
+
+    plugin_class = None
+    default_options = {}
+
+    def make_conn(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.plugin = self.plugin_class()
+        self.plugin.inventory = InventoryData()
+        self.plugin.templar = Templar(loader=DataLoader())
+        self.options = dict(clouds=['otc'], parallelism=4,
+                            **self.default_options)
+        self.conn = self.make_conn()
+        for name, kwargs in (
+                ('get_option', dict(side_effect=self.options.get)),
+                ('_connect', dict(return_value=self.conn))):
+            patcher = mock.patch.object(self.plugin, name, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
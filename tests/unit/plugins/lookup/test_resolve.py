@@ -0,0 +1,98 @@
+import os
+import tempfile
+
+from unittest import TestCase, mock
+
+from ansible.errors import AnsibleLookupError
+
+from ansible_collections.opentelekomcloud.cloud.plugins.lookup import resolve
+
+
+def resource(id, name):
+    item = mock.MagicMock(id=id)
+    item.name = name
+    return item
+
+
+class ResolveLookupTest(TestCase):
+
+    def setUp(self):
+        resolve._CONNECTIONS.clear()
+        resolve._INDEXES.clear()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ, XDG_CACHE_HOME=cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.conn = mock.MagicMock()
+        self.conn.network.routers.return_value = [
+            resource('r1', 'vpc-1'), resource('r2', 'vpc-2')]
+        self.conn.network.subnets.return_value = [
+            resource('s1', 'subnet'), resource('s2', 'dup'),
+            resource('s3', 'dup')]
+        self.conn.nat.gateways.return_value = [resource('g1', 'gw')]
+
+        self.lookup = resolve.LookupModule()
+        self.options = {
+            'cloud': 'otc', 'region': None, 'project': None,
+            'ignore_missing': False, 'play_cache': False,
+            'resolve_cache_ttl': 0, 'parallelism': 4, 'api_retries': 3,
+            'token_cache': True, 'token_cache_dir': None,
+        }
+        for target, name, kwargs in (
+                (self.lookup, 'set_options', {}),
+                (self.lookup, 'get_option',
+                 dict(side_effect=self.options.get)),
+                (resolve, 'connect', dict(return_value=self.conn))):
+            patcher = mock.patch.object(target, name, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_resolve(self):
+        self.assertEqual(
+            ['r2', 'g1', 's1', 'r1'],
+            self.lookup.run([
+                'router:vpc-2', ['nat_gateway', 'gw'],
+                {'type': 'subnet', 'name': 'subnet'}, 'router:r1']))
+        resolve.connect.assert_called_once_with(
+            dict(cloud='otc', region=None, project=None), mock.ANY,
+            ('nat',), log=mock.ANY)
+        # A single list call per type, also in later lookups
+        self.lookup.run(['router:vpc-1', 'subnet:subnet'])
+        self.conn.network.routers.assert_called_once_with()
+        self.conn.network.subnets.assert_called_once_with()
+
+    def test_missing(self):
+        self.assertRaises(AnsibleLookupError,
+                          self.lookup.run, ['router:unknown'])
+        self.options['ignore_missing'] = True
+        self.assertEqual([None], self.lookup.run(['router:unknown']))
+
+    def test_missing_relisted(self):
+        self.assertEqual(['r1'], self.lookup.run(['router:vpc-1']))
+        # Created after the routers were listed
+        self.conn.network.routers.return_value = [
+            resource('r1', 'vpc-1'), resource('r3', 'vpc-3')]
+        self.assertEqual(['r3', 'r1'],
+                         self.lookup.run(['router:vpc-3', 'router:vpc-1']))
+        self.assertEqual(2, self.conn.network.routers.call_count)
+        self.assertRaises(AnsibleLookupError,
+                          self.lookup.run, ['router:unknown'])
+        self.assertEqual(3, self.conn.network.routers.call_count)
+
+    def test_play_cache(self):
+        self.options['play_cache'] = True
+        self.assertEqual(['r1'], self.lookup.run(['router:vpc-1']))
+        # Lookups of later tasks run in new processes of the same run
+        resolve._INDEXES.clear()
+        self.assertEqual(['r2'], self.lookup.run(['router:vpc-2']))
+        self.conn.network.routers.assert_called_once_with()
+        # Another run lists again
+        with mock.patch.object(resolve, 'run_id', return_value='other'):
+            resolve._INDEXES.clear()
+            self.assertEqual(['r2'], self.lookup.run(['router:vpc-2']))
+        self.assertEqual(2, self.conn.network.routers.call_count)
+
+    def test_invalid(self):
+        for terms in (['subnet:dup'], ['foo:bar'], ['router']):
+            self.assertRaises(AnsibleLookupError, self.lookup.run, terms)
@@ -0,0 +1,531 @@
+"""Local stand-in of the OTC APIs for offline tests and benchmarks.
+
+`FakeOTC` is an HTTP server emulating the Keystone token and catalog API
+and generic in-memory REST collections of the services used by the modules
+(VPC, network/ELB, compute, DNS, NAT, CBR, AS, CCE and RDS). Every request
+is recorded, latency, server side pagination and throttling are
+configurable::
+
+    with FakeOTC(latency=0.01, page_size=50) as cloud:
+        cloud.add('vpc', name='vpc-1', cidr='192.168.0.0/16')
+        result = run_module(vpc_info.VpcInfoModule, cloud.module_args())
+        assert cloud.count(service='vpc') == 1
+
+Routes match the end of request paths, version and project ID segments
+in front of collections are ignored. Any `POST`/`PUT` to
+`<collection>/<id>/<action>` is answered with the resource itself.
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from ansible.module_utils import basic
+
+PROJECT_ID = '0123456789abcdef0123456789abcdef'
+PROJECT_NAME = 'eu-de_fake'
+REGION = 'eu-de'
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.000000Z'
+
+# Path segments of version discovery requests (versions, project IDs)
+_DISCOVERY_SEGMENT_RE = re.compile(
+    r'^(v\d+(\.\d+)?|api|autoscaling-api|projects|%\(project_id\)s|'
+    r'[0-9a-f]{32})$')
+
+# Query parameters which are not resource attribute filters
+PAGING_PARAMS = ('limit', 'marker', 'offset', 'sort_key', 'sort_dir')
+
+
+class Route:
+    """Collection of resources of a service.
+
+    Args:
+        name: Name of the collection used by `FakeOTC.add` and `count`.
+        service: Service prefix the collection is served under.
+        pattern: Regular expression of the collection path, a `parent`
+            group scopes the collection to a parent resource.
+        resources_key: Key of the list in list responses.
+        resource_key: Key wrapping single resources, None when they are
+            not wrapped.
+        id_path: Keys leading to the resource ID.
+        defaults: Attributes of created resources.
+    """
+
+    def __init__(self, name, service, pattern, resources_key,
+                 resource_key=None, id_path=('id',), defaults=None):
+        self.name = name
+        self.service = service
+        self.regex = re.compile(
+            '(?:^|/)' + pattern + r'(?:/(?P<id>[^/]+))?(?:/(?P<action>[^/]+))?/?$')
+        self.resources_key = resources_key
+        self.resource_key = resource_key
+        self.id_path = id_path
+        self.defaults = defaults or {}
+
+    def get_id(self, resource):
+        for key in self.id_path:
+            resource = (resource or {}).get(key)
+        return resource
+
+    def set_id(self, resource, resource_id):
+        target = resource
+        for key in self.id_path[:-1]:
+            target = target.setdefault(key, {})
+        target.setdefault(self.id_path[-1], resource_id)
+
+    def wrap(self, resource):
+        if self.resource_key:
+            return {self.resource_key: resource}
+        return resource
+
+    def unwrap(self, body):
+        if self.resource_key and isinstance(body, dict):
+            return body.get(self.resource_key, body)
+        return body
+
+
+def neutron(name, path, resources_key, resource_key, **kwargs):
+    return Route(name, 'network', path, resources_key, resource_key,
+                 **kwargs)
+
+
+LB_STATUS = dict(provisioning_status='ACTIVE', operating_status='ONLINE')
+
+ROUTES = [
+    neutron('network', 'networks', 'networks', 'network',
+            defaults=dict(status='ACTIVE', subnets=[])),
+    neutron('subnet', 'subnets', 'subnets', 'subnet'),
+    neutron('router', 'routers', 'routers', 'router',
+            defaults=dict(status='ACTIVE', routes=[])),
+    neutron('port', 'ports', 'ports', 'port',
+            defaults=dict(status='ACTIVE', fixed_ips=[])),
+    neutron('security_group', 'security-groups', 'security_groups',
+            'security_group', defaults=dict(security_group_rules=[])),
+    neutron('security_group_rule', 'security-group-rules',
+            'security_group_rules', 'security_group_rule'),
+    neutron('floating_ip', 'floatingips', 'floatingips', 'floatingip',
+            defaults=dict(status='ACTIVE')),
+    neutron('loadbalancer', 'lbaas/loadbalancers', 'loadbalancers',
+            'loadbalancer', defaults=LB_STATUS),
+    neutron('lb_listener', 'lbaas/listeners', 'listeners', 'listener',
+            defaults=LB_STATUS),
+    neutron('lb_member', r'lbaas/pools/(?P<parent>[^/]+)/members',
+            'members', 'member', defaults=LB_STATUS),
+    neutron('lb_pool', 'lbaas/pools', 'pools', 'pool', defaults=LB_STATUS),
+    neutron('lb_healthmonitor', 'lbaas/healthmonitors', 'healthmonitors',
+            'healthmonitor', defaults=LB_STATUS),
+    Route('server', 'compute', r'servers(?:/detail)?', 'servers', 'server',
+          defaults=dict(status='ACTIVE', addresses={})),
+    Route('flavor', 'compute', r'flavors(?:/detail)?', 'flavors', 'flavor'),
+    Route('availability_zone', 'compute', r'os-availability-zone(?:/detail)?',
+          'availabilityZoneInfo', id_path=('zoneName',)),
+    Route('vpc', 'vpc', 'vpcs', 'vpcs', 'vpc', defaults=dict(status='OK')),
+    Route('vpc_subnet', 'vpc', 'subnets', 'subnets', 'subnet',
+          defaults=dict(status='ACTIVE')),
+    Route('vpc_route', 'vpc', 'vpc/routes', 'routes', 'route'),
+    Route('vpc_peering', 'vpc', 'vpc/peerings', 'peerings', 'peering',
+          defaults=dict(status='ACTIVE')),
+    Route('dns_recordset', 'dns', r'zones/(?P<parent>[^/]+)/recordsets',
+          'recordsets', defaults=dict(status='ACTIVE')),
+    Route('dns_zone', 'dns', 'zones', 'zones',
+          defaults=dict(status='ACTIVE', zone_type='public')),
+    Route('nat_gateway', 'nat', 'nat_gateways', 'nat_gateways',
+          'nat_gateway', defaults=dict(status='ACTIVE')),
+    Route('nat_snat_rule', 'nat', 'snat_rules', 'snat_rules', 'snat_rule',
+          defaults=dict(status='ACTIVE')),
+    Route('nat_dnat_rule', 'nat', 'dnat_rules', 'dnat_rules', 'dnat_rule',
+          defaults=dict(status='ACTIVE')),
+    Route('cbr_vault', 'cbr', 'vaults', 'vaults', 'vault'),
+    Route('cbr_backup', 'cbr', 'backups', 'backups', 'backup',
+          defaults=dict(status='available')),
+    Route('as_group', 'as', 'scaling_group', 'scaling_groups',
+          'scaling_group', id_path=('scaling_group_id',),
+          defaults=dict(scaling_group_status='INSERVICE')),
+    Route('as_config', 'as', 'scaling_configuration', 'scaling_configs',
+          'scaling_config', id_path=('scaling_configuration_id',)),
+    Route('as_policy', 'as', 'scaling_policy', 'scaling_policies',
+          'scaling_policy', id_path=('scaling_policy_id',),
+          defaults=dict(policy_status='INSERVICE')),
+    Route('cce_node', 'cce', r'clusters/(?P<parent>[^/]+)/nodes', 'items',
+          id_path=('metadata', 'uid'),
+          defaults=dict(kind='Node', status={'phase': 'Active'})),
+    Route('cce_cluster', 'cce', 'clusters', 'items',
+          id_path=('metadata', 'uid'),
+          defaults=dict(kind='Cluster', status={'phase': 'Available'})),
+    Route('rds_flavor', 'rds', r'flavors/(?P<parent>[^/]+)', 'flavors',
+          id_path=('spec_code',)),
+    Route('rds_instance', 'rds', 'instances', 'instances', 'instance',
+          defaults=dict(status='ACTIVE')),
+]
+
+# Catalog service type -> (URL prefix, version path of discovery documents)
+SERVICES = OrderedDict([
+    ('identity', ('identity', 'v3')),
+    ('network', ('network', 'v2.0')),
+    ('compute', ('compute', 'v2.1')),
+    ('vpc', ('vpc', 'v1')),
+    ('dns', ('dns', 'v2')),
+    ('nat', ('nat', 'v2.0')),
+    ('cbr', ('cbr', 'v3')),
+    ('as', ('as', 'autoscaling-api/v1')),
+    ('ccev2.0', ('cce', 'api/v3')),
+    ('rdsv3', ('rds', 'v3')),
+])
+
+
+def _matches(resource, query):
+    for key, value in query.items():
+        if key in PAGING_PARAMS:
+            continue
+        if key not in resource:
+            # Unknown filters are ignored like most services do
+            continue
+        if str(resource[key]) != value and resource[key] != value:
+            return False
+    return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length).decode('utf-8') or 'null')
+
+    def _send(self, status, body=None, headers=None):
+        payload = b''
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query))
+        body = self._body()
+        status, response, headers = self.server.fake.dispatch(
+            self.command, url.path, query, body)
+        self._send(status, response, headers)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+
+class FakeOTC:
+    """Fake OTC endpoint, see the module documentation.
+
+    Args:
+        latency: Seconds every response is delayed by, or a dictionary of
+            them by service prefix.
+        page_size: Maximal number of resources returned by a list call,
+            further pages are linked with a marker.
+        rate_limit: Requests per second accepted per service (a number
+            applying to all services but identity, or a dictionary by
+            service prefix), further requests within the same second get
+            `429` responses.
+        retry_after: Value of the Retry-After header of throttled calls.
+    """
+
+    def __init__(self, latency=0.0, page_size=None, rate_limit=None,
+                 retry_after=0):
+        self.latency = latency
+        self.page_size = page_size
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.requests = []
+        self.resources = dict((route.name, OrderedDict())
+                              for route in ROUTES)
+        self._routes = dict((route.name, route) for route in ROUTES)
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    # Server lifecycle
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d' % self._httpd.server_address[1]
+
+    def module_args(self, **kwargs):
+        """Return common module arguments connecting to the server."""
+        args = dict(
+            auth=dict(auth_url=self.url + '/identity/v3', username='user',
+                      password='password', project_name=PROJECT_NAME,
+                      user_domain_name='domain'),
+            auth_type='password', region_name=REGION)
+        args.update(kwargs)
+        return args
+
+    # Data
+
+    def add(self, collection, parent=None, **attrs):
+        """Add resource to `collection`, return it with its ID."""
+        route = self._routes[collection]
+        resource = dict(route.defaults, **attrs)
+        route.set_id(resource, str(uuid.uuid4()))
+        with self._lock:
+            self._collection(route, parent)[route.get_id(resource)] = resource
+        return resource
+
+    def list(self, collection, parent=None):
+        """Return resources of `collection`."""
+        return list(
+            self._collection(self._routes[collection], parent).values())
+
+    def _collection(self, route, parent):
+        if parent is None:
+            return self.resources[route.name]
+        return self.resources.setdefault(
+            (route.name, parent), OrderedDict())
+
+    # Request accounting
+
+    def count(self, service=None, method=None, route=None):
+        """Return number of recorded requests matching all given filters."""
+        return len([
+            request for request in self.requests
+            if (service is None or request['service'] == service)
+            and (method is None or request['method'] == method)
+            and (route is None or request['route'] == route)])
+
+    def reset(self):
+        with self._lock:
+            self.requests = []
+
+    # Request handling
+
+    def _throttled(self, service):
+        limit = self.rate_limit
+        if isinstance(limit, dict):
+            limit = limit.get(service)
+        elif service == 'identity':
+            limit = None
+        if not limit:
+            return False
+        now = time.time()
+        with self._lock:
+            window = [stamp for stamp in self._windows.get(service, [])
+                      if stamp > now - 1]
+            throttled = len(window) >= limit
+            if not throttled:
+                window.append(now)
+            self._windows[service] = window
+        return throttled
+
+    def _delay(self, service):
+        latency = self.latency
+        if isinstance(latency, dict):
+            latency = latency.get(service, 0.0)
+        if latency:
+            time.sleep(latency)
+
+    def dispatch(self, method, path, query, body):
+        parts = path.strip('/').split('/', 1)
+        service, rest = parts[0], (parts[1] if len(parts) > 1 else '')
+        record = dict(method=method, service=service, path=path,
+                      route=None, status=None)
+        self._delay(service)
+        if self._throttled(service):
+            status, response, headers = 429, {
+                'message': 'Too many requests'}, {
+                'Retry-After': str(self.retry_after)}
+        elif service == 'identity':
+            status, response, headers = self._identity(method, rest, body)
+        else:
+            status, response, headers = self._resource(
+                method, service, rest, query, body, record)
+            if isinstance(response, dict):
+                for links in response.values():
+                    # Relative next links of list responses
+                    if (isinstance(links, list) and links
+                            and isinstance(links[0], dict)
+                            and links[0].get('rel') == 'next'):
+                        links[0]['href'] = self.url + path + links[0]['href']
+        record['status'] = status
+        with self._lock:
+            self.requests.append(record)
+        return status, response, headers
+
+    def _version_document(self, service):
+        prefix, version = dict(
+            (prefix, (prefix, version))
+            for prefix, version in SERVICES.values())[service]
+        return {'id': version.split('/')[-1], 'status': 'CURRENT',
+                'links': [{'rel': 'self',
+                           'href': '%s/%s/%s/' % (self.url, prefix, version)}]}
+
+    def _catalog(self):
+        catalog = []
+        for service_type, (prefix, version) in SERVICES.items():
+            url = '%s/%s' % (self.url, prefix)
+            if service_type in ('identity', 'vpc', 'dns', 'nat', 'cbr',
+                                'as', 'rdsv3'):
+                url = '%s/%s' % (url, version)
+            catalog.append({
+                'type': service_type, 'name': service_type,
+                'id': service_type,
+                'endpoints': [{
+                    'id': service_type + '-public', 'interface': 'public',
+                    'region': REGION, 'region_id': REGION, 'url': url}],
+            })
+        return catalog
+
+    def _identity(self, method, rest, body):
+        if method == 'POST' and rest.endswith('auth/tokens'):
+            now = time.time()
+            token = {
+                'methods': ['password'],
+                'expires_at': time.strftime(
+                    TIME_FORMAT, time.gmtime(now + 3600)),
+                'issued_at': time.strftime(TIME_FORMAT, time.gmtime(now)),
+                'user': {'id': 'user-id', 'name': 'user',
+                         'domain': {'id': 'domain-id', 'name': 'domain'}},
+                'project': {'id': PROJECT_ID, 'name': PROJECT_NAME,
+                            'domain': {'id': 'domain-id', 'name': 'domain'}},
+                'roles': [{'id': 'role-id', 'name': 'te_admin'}],
+                'catalog': self._catalog(),
+            }
+            return 201, {'token': token}, {
+                'X-Subject-Token': uuid.uuid4().hex}
+        if method == 'GET' and rest.strip('/') in ('', 'v3'):
+            return 200, {'version': self._version_document('identity')}, {}
+        return 404, {'message': 'Not found'}, {}
+
+    def _resource(self, method, service, rest, query, body, record):
+        rest = '/' + rest.strip('/')
+        for route in ROUTES:
+            if route.service != service:
+                continue
+            match = route.regex.search(rest)
+            if match:
+                record['route'] = route.name
+                return self._collection_call(
+                    route, method, match.group('parent')
+                    if 'parent' in route.regex.groupindex else None,
+                    match.group('id'), match.group('action'), query, body)
+        if method == 'GET' and all(
+                _DISCOVERY_SEGMENT_RE.match(segment)
+                for segment in rest.strip('/').split('/') if segment):
+            # Version discovery of the service root
+            return 200, {'versions': [self._version_document(service)]}, {}
+        return 404, {'message': 'Not found'}, {}
+
+    def _page(self, route, items, query):
+        limit = int(query.get('limit') or 0) or self.page_size
+        start = 0
+        if query.get('marker'):
+            ids = [route.get_id(item) for item in items]
+            if query['marker'] in ids:
+                start = ids.index(query['marker']) + 1
+        elif query.get('offset'):
+            start = int(query['offset'])
+        page = items[start:start + limit] if limit else items[start:]
+        response = {route.resources_key: page}
+        if limit and start + limit < len(items):
+            next_query = dict(query, limit=limit,
+                              marker=route.get_id(page[-1]))
+            next_query.pop('offset', None)
+            response[route.resources_key + '_links'] = [{
+                'rel': 'next', 'href': '?' + urlencode(next_query)}]
+        return response
+
+    def _collection_call(self, route, method, parent, resource_id, action,
+                         query, body):
+        with self._lock:
+            collection = self._collection(route, parent)
+            if resource_id is None:
+                if method == 'GET':
+                    items = [item for item in collection.values()
+                             if _matches(item, query)]
+                    return 200, self._page(route, items, query), {}
+                if method == 'POST':
+                    resource = dict(route.defaults,
+                                    **(route.unwrap(body) or {}))
+                    route.set_id(resource, str(uuid.uuid4()))
+                    collection[route.get_id(resource)] = resource
+                    return 201, route.wrap(resource), {}
+                return 405, {'message': 'Method not allowed'}, {}
+
+            resource = collection.get(resource_id)
+            if resource is None:
+                return 404, {'message': '%s %s could not be found'
+                             % (route.name, resource_id)}, {}
+            if action:
+                return 200, route.wrap(resource), {}
+            if method == 'GET':
+                return 200, route.wrap(resource), {}
+            if method in ('PUT', 'PATCH'):
+                resource.update(route.unwrap(body) or {})
+                return 200, route.wrap(resource), {}
+            if method == 'DELETE':
+                del collection[resource_id]
+                return 204, None, {}
+        return 405, {'message': 'Method not allowed'}, {}
+
+
+class ModuleExit(Exception):
+
+    def __init__(self, result):
+        super(ModuleExit, self).__init__(result.get('msg', ''))
+        self.result = result
+
+
+def _exit_json(module, **kwargs):
+    raise ModuleExit(kwargs)
+
+
+def _fail_json(module, msg, **kwargs):
+    raise ModuleExit(dict(kwargs, msg=msg, failed=True))
+
+
+def run_module(module_class, args):
+    """Run an `OTCModule` class in process, return its result."""
+    basic._ANSIBLE_ARGS = json.dumps(
+        {'ANSIBLE_MODULE_ARGS': args}).encode('utf-8')
+    with mock.patch.multiple(basic.AnsibleModule, exit_json=_exit_json,
+                             fail_json=_fail_json):
+        try:
+            module = module_class()
+            module()
+        except ModuleExit as e:
+            return e.result
+    return {}